@@ -67,6 +67,7 @@ class BiddingAgent:
         # self.opponent_wins = {opp: [] for opp in opponent_teams}  # Track which opponents win what
         # self.opponent_bids = {opp: [] for opp in opponent_teams}  # Infer opponent bidding patterns
         # self.beliefs = {opp: {} for opp in opponent_teams}        # Bayesian beliefs per opponent
+        # self.opponents = OpponentTracker(opponent_teams)  # Opponents' budgets (from src.opponent_state import OpponentTracker)
         # self.high_value_threshold = 12.0  # Classify items
         # self.low_value_threshold = 8.0
         
@@ -129,6 +130,9 @@ class BiddingAgent:
         # if price_paid > 0:
         #     self.price_history.append(price_paid)
         
+        # Track opponents' remaining budgets and items won
+        # self.opponents.update(winning_team, price_paid)
+        
         # Track opponent performance
         # if winning_team and winning_team != self.team_id:
         #     self.opponent_wins[winning_team] = \
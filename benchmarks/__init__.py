@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for the AGT Competition System
+Run from the repository root, e.g. python -m benchmarks.bench_agent_execution
+"""
@@ -0,0 +1,58 @@
+"""
+Benchmark: per-bid overhead of the agent execution backends
+
+Compares the original thread-per-bid backend with persistent worker processes
+and direct inline calls, using a trivial agent so only the overhead is measured.
+
+Usage:
+    python -m benchmarks.bench_agent_execution [--bids 5000] [--agent examples/truthful_bidder.py]
+"""
+
+import argparse
+import time
+
+from src.agent_manager import AgentManager
+from src.config import INITIAL_BUDGET, ITEM_ID_FORMAT, K_TOTAL_ITEMS
+
+
+def measure_mode(mode: str, agent_file: str, num_bids: int) -> float:
+    """
+    Measure the mean wall time of execute_bid_with_timeout for one backend.
+    
+    Returns:
+        Mean microseconds per bid
+    """
+    agent_manager = AgentManager(timeout_seconds=2.0, execution_mode=mode)
+    valuation_vector = {ITEM_ID_FORMAT.format(i): 10.0 for i in range(K_TOTAL_ITEMS)}
+    agent = agent_manager.load_agent(agent_file, "bench_team", valuation_vector, INITIAL_BUDGET, [])
+    
+    try:
+        # Warm up
+        for i in range(min(100, num_bids)):
+            agent_manager.execute_bid_with_timeout(agent, ITEM_ID_FORMAT.format(i % K_TOTAL_ITEMS))
+        
+        start = time.perf_counter()
+        for i in range(num_bids):
+            agent_manager.execute_bid_with_timeout(agent, ITEM_ID_FORMAT.format(i % K_TOTAL_ITEMS))
+        elapsed = time.perf_counter() - start
+    finally:
+        agent_manager.shutdown()
+    
+    return elapsed / num_bids * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-bid overhead of agent execution backends")
+    parser.add_argument('--bids', type=int, default=5000, help='Number of bids per backend')
+    parser.add_argument('--agent', default='examples/truthful_bidder.py', help='Agent file to benchmark')
+    args = parser.parse_args()
+    
+    print(f"{'Backend':<10} {'us/bid':>10} {'bids/sec':>12}")
+    print(f"{'-'*10} {'-'*10} {'-'*12}")
+    for mode in AgentManager.EXECUTION_MODES:
+        per_bid_us = measure_mode(mode, args.agent, args.bids)
+        print(f"{mode:<10} {per_bid_us:>10.1f} {1e6 / per_bid_us:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
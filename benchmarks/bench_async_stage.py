@@ -0,0 +1,90 @@
+"""
+Benchmark: Stage 1 wall time, process mode vs the asyncio driver
+
+Every team's agent sleeps a fixed time per bid, like an agent waiting on I/O.
+Process mode plays the arenas' games one after the other (arena_workers=1);
+async mode interleaves all games of the stage on one event loop, so rounds of
+different games overlap while agents sleep. Async mode starts one agent
+process per team per concurrently running game, which it pays for up front.
+Both modes must produce the same leaderboards.
+
+Usage:
+    python -m benchmarks.bench_async_stage [--teams 15] [--games 5] [--delay-ms 20] [--max-concurrent 64]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.bench_bid_collection import write_agent
+from src.tournament_manager import TournamentManager
+from src.utils import Team
+from src.valuation_generator import ValuationGenerator
+
+
+def run_stage(mode: str, teams: list, num_games: int, seed: int, max_concurrent: int):
+    """
+    Play Stage 1 in memory.
+
+    Returns:
+        Tuple of (elapsed seconds, {arena_id: [(team_id, total_utility), ...]})
+    """
+    tournament_manager = TournamentManager(
+        valuation_generator=ValuationGenerator(random_seed=seed),
+        results_manager=None,
+        execution_mode=mode,
+        headless=True,
+        max_concurrent_games=max_concurrent
+    )
+    arenas = tournament_manager.create_arenas(teams)
+
+    start = time.perf_counter()
+    tournament_manager.run_arenas(arenas, stage=1, num_games=num_games)
+    elapsed = time.perf_counter() - start
+
+    leaderboards = {
+        arena_id: [(entry['team_id'], entry['total_utility'])
+                   for entry in tournament_manager.arena_accumulators[(1, arena_id)].leaderboard()]
+        for arena_id in arenas
+    }
+    return elapsed, leaderboards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stage wall time, process mode vs async driver")
+    parser.add_argument('--teams', type=int, default=15, help='Teams in the stage')
+    parser.add_argument('--games', type=int, default=5, help='Games per arena')
+    parser.add_argument('--delay-ms', type=float, default=20.0, help='Sleep per bid')
+    parser.add_argument('--max-concurrent', type=int, default=64, help='Games interleaved at once (async)')
+    parser.add_argument('--seed', type=int, default=0, help='Tournament seed')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as directory:
+        agent_file = write_agent(directory, args.delay_ms / 1e3, spin=False)
+        teams = [Team(team_id=f"team_{i:02d}", team_name=f"team_{i:02d}", agent_file_path=agent_file,
+                      registration_timestamp=datetime(2025, 1, 1), members=[])
+                 for i in range(args.teams)]
+
+        process_seconds, process_boards = run_stage("process", teams, args.games, args.seed,
+                                                    args.max_concurrent)
+        async_seconds, async_boards = run_stage("async", teams, args.games, args.seed,
+                                                args.max_concurrent)
+
+    assert process_boards == async_boards, "Leaderboards differ between modes"
+
+    num_games = len(process_boards) * args.games
+    print(f"Stage 1: {args.teams} teams, {num_games} games, agents sleep {args.delay_ms:.0f} ms per bid "
+          f"(leaderboards identical)")
+    print(f"{'Mode':<10} {'seconds':>10}")
+    print(f"{'-'*10} {'-'*10}")
+    print(f"{'process':<10} {process_seconds:>10.2f}")
+    print(f"{'async':<10} {async_seconds:>10.2f}")
+    print(f"Speedup: {process_seconds / async_seconds:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
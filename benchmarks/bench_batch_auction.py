@@ -0,0 +1,133 @@
+"""
+Benchmark: batched vs per-round auction engine
+
+Plays full games (T rounds of random bids, capped to budget) for an arena of
+teams, once with AuctionEngine round by round and once with BatchAuctionEngine
+for all games in lockstep, checks that both produce the same winners and prices,
+and reports games per second.
+
+Usage:
+    python -m benchmarks.bench_batch_auction [--games 2000] [--teams 5]
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.auction_engine import AuctionEngine
+from src.batch_auction_engine import BatchAuctionEngine
+from src.config import INITIAL_BUDGET, T_AUCTION_ROUNDS
+
+
+def make_bids(num_games: int, num_teams: int, seed: int, integer_bids: bool) -> np.ndarray:
+    """
+    Random bids for every (round, game, team).
+
+    Integer bids produce many ties, which exercises the tie-breaking path.
+    Otherwise bids are multiples of 0.1 plus 0.01 x team index, so no two teams
+    (up to 10) ever tie and the winner of every round is fully determined.
+    """
+    rng = np.random.default_rng(seed)
+    bids = rng.uniform(0, 20, size=(T_AUCTION_ROUNDS, num_games, num_teams))
+    if integer_bids:
+        return np.floor(bids)
+    return np.round(bids, 1) + 0.01 * np.arange(num_teams)
+
+
+def check_tie_semantics(num_games: int, num_teams: int, seed: int):
+    """
+    Compare determine_winners with AuctionEngine.determine_winner on integer
+    bids, where ties for the highest bid are frequent. Prices must match exactly;
+    on a tie the batched winner must be one of the tied teams.
+    """
+    bids = make_bids(num_games, num_teams, seed, integer_bids=True)[0]
+    winners, prices, tied = BatchAuctionEngine(rng=np.random.default_rng(seed)).determine_winners(bids)
+    engine = AuctionEngine()
+    team_ids = [f"team_{i}" for i in range(num_teams)]
+
+    for game in range(num_games):
+        winner_id, price, tied_teams = engine.determine_winner(dict(zip(team_ids, bids[game].tolist())))
+        assert prices[game] == price, f"Game {game}: price {prices[game]} != {price}"
+        if tied_teams:
+            assert sorted(team_ids[i] for i in np.flatnonzero(tied[game])) == sorted(tied_teams)
+            assert tied[game, winners[game]], f"Game {game}: winner not among tied teams"
+        else:
+            assert winners[game] == (team_ids.index(winner_id) if winner_id else -1)
+
+
+def run_per_round(bids: np.ndarray):
+    """Play all games with AuctionEngine, one round of one game at a time"""
+    engine = AuctionEngine()
+    num_rounds, num_games, num_teams = bids.shape
+    team_ids = [f"team_{i}" for i in range(num_teams)]
+    winners = np.full((num_rounds, num_games), -1)
+    prices = np.zeros((num_rounds, num_games))
+
+    for game in range(num_games):
+        budgets = {team_id: float(INITIAL_BUDGET) for team_id in team_ids}
+        for round_index in range(num_rounds):
+            round_bids = dict(zip(team_ids, bids[round_index, game].tolist()))
+            result = engine.execute_round(round_index + 1, "item", round_bids, budgets, {})
+            if result.winner_id:
+                budgets[result.winner_id] -= result.price_paid
+                winners[round_index, game] = team_ids.index(result.winner_id)
+                prices[round_index, game] = result.price_paid
+
+    return winners, prices
+
+
+def run_batched(bids: np.ndarray):
+    """Play all games in lockstep with BatchAuctionEngine"""
+    engine = BatchAuctionEngine(rng=np.random.default_rng(0))
+    num_rounds, num_games, num_teams = bids.shape
+    budgets = np.full((num_games, num_teams), float(INITIAL_BUDGET))
+    winners = np.empty((num_rounds, num_games), dtype=np.int64)
+    prices = np.empty((num_rounds, num_games))
+
+    for round_index in range(num_rounds):
+        result = engine.execute_round(bids[round_index], budgets)
+        engine.charge_winners(budgets, result)
+        winners[round_index] = result.winners
+        prices[round_index] = result.prices
+
+    return winners, prices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched vs per-round auction engine")
+    parser.add_argument('--games', type=int, default=2000, help='Number of games')
+    parser.add_argument('--teams', type=int, default=5, help='Teams per game')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the generated bids')
+    args = parser.parse_args()
+
+    # The per-round engine logs every round; keep that out of the measurement
+    logging.disable(logging.WARNING)
+
+    # Tie-free bids, so both engines must agree exactly
+    bids = make_bids(args.games, args.teams, args.seed, integer_bids=False)
+
+    start = time.perf_counter()
+    reference_winners, reference_prices = run_per_round(bids)
+    per_round_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_winners, batch_prices = run_batched(bids)
+    batched_seconds = time.perf_counter() - start
+
+    assert np.array_equal(reference_winners, batch_winners), "Winners differ"
+    assert np.array_equal(reference_prices, batch_prices), "Prices differ"
+
+    check_tie_semantics(min(args.games, 1000), args.teams, args.seed + 1)
+
+    print(f"Games: {args.games} x {args.teams} teams x {T_AUCTION_ROUNDS} rounds (results identical)")
+    print(f"{'Engine':<12} {'seconds':>10} {'games/sec':>12}")
+    print(f"{'-'*12} {'-'*10} {'-'*12}")
+    print(f"{'per-round':<12} {per_round_seconds:>10.3f} {args.games / per_round_seconds:>12.0f}")
+    print(f"{'batched':<12} {batched_seconds:>10.3f} {args.games / batched_seconds:>12.0f}")
+    print(f"Speedup: {per_round_seconds / batched_seconds:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
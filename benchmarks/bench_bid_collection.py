@@ -0,0 +1,125 @@
+"""
+Benchmark: round latency of sequential vs concurrent bid collection
+
+Each team's agent spends a fixed time per bid (sleeping, or spinning the CPU
+with --work spin, CPU time). Collecting bids one agent after the other makes a round cost
+the sum of those times; AgentManager.collect_bids dispatches all bids at once,
+so a round costs roughly the slowest agent's time. Spinning agents only overlap
+in process mode with enough CPU cores. Both methods must return the same bids.
+
+Usage:
+    python -m benchmarks.bench_bid_collection [--rounds 20] [--teams 5] [--delay-ms 50] [--work sleep]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.agent_manager import AgentManager
+from src.config import INITIAL_BUDGET, ITEM_ID_FORMAT, K_TOTAL_ITEMS
+
+
+AGENT_TEMPLATE = '''
+import time
+
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def _work(self):
+        if {spin}:
+            end = time.thread_time() + {delay}
+            while time.thread_time() < end:
+                pass
+        else:
+            time.sleep({delay})
+
+    def bidding_function(self, item_id):
+        self._work()
+        return min(self.valuation_vector.get(item_id, 0), self.budget)
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        return True
+'''
+
+
+def write_agent(directory: str, delay_seconds: float, spin: bool) -> str:
+    """Write an agent that spends delay_seconds per bid and return its path"""
+    path = os.path.join(directory, f"agent_{delay_seconds:.4f}_{spin}.py")
+    with open(path, "w") as f:
+        f.write(AGENT_TEMPLATE.format(delay=delay_seconds, spin=spin))
+    return path
+
+
+def measure(concurrent: bool, mode: str, agent_files: dict, num_rounds: int):
+    """
+    Play num_rounds rounds of bid collection.
+
+    Returns:
+        Tuple of (mean milliseconds per round, list of per-round bid dicts)
+    """
+    agent_manager = AgentManager(timeout_seconds=2.0, execution_mode=mode)
+    team_ids = list(agent_files)
+    agents = {}
+    for i, (team_id, path) in enumerate(agent_files.items()):
+        valuation_vector = {ITEM_ID_FORMAT.format(k): float(i + k) for k in range(K_TOTAL_ITEMS)}
+        opponents = [t for t in team_ids if t != team_id]
+        agents[team_id] = agent_manager.load_agent(path, team_id, valuation_vector,
+                                                   INITIAL_BUDGET, opponents)
+
+    rounds = []
+    try:
+        start = time.perf_counter()
+        for r in range(num_rounds):
+            item_id = ITEM_ID_FORMAT.format(r % K_TOTAL_ITEMS)
+            if concurrent:
+                results = agent_manager.collect_bids(agents, item_id)
+            else:
+                results = {team_id: agent_manager.execute_bid_with_timeout(agent, item_id)
+                           for team_id, agent in agents.items()}
+            rounds.append({team_id: (bid, error) for team_id, (bid, _, error) in results.items()})
+        elapsed = time.perf_counter() - start
+    finally:
+        agent_manager.shutdown()
+
+    return elapsed / num_rounds * 1e3, rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs concurrent bid collection")
+    parser.add_argument('--rounds', type=int, default=20, help='Rounds per method')
+    parser.add_argument('--teams', type=int, default=5, help='Agents per round')
+    parser.add_argument('--delay-ms', type=float, default=50.0,
+                        help='Bid time of the slowest agent; the others take 1/2, 1/3, ... of it')
+    parser.add_argument('--work', choices=['sleep', 'spin'], default='sleep',
+                        help='Sleep (I/O-like) or spin the CPU during a bid')
+    parser.add_argument('--mode', choices=['process', 'thread'], default='process',
+                        help='Agent execution backend')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        delays = [args.delay_ms / 1e3 / (i + 1) for i in range(args.teams)]
+        agent_files = {f"team_{i}": write_agent(directory, delay, args.work == 'spin')
+                       for i, delay in enumerate(delays)}
+
+        sequential_ms, sequential_bids = measure(False, args.mode, agent_files, args.rounds)
+        concurrent_ms, concurrent_bids = measure(True, args.mode, agent_files, args.rounds)
+
+    assert sequential_bids == concurrent_bids, "Bids differ between collection methods"
+
+    print(f"{args.rounds} rounds x {args.teams} {args.work} agents ({args.mode} mode), "
+          f"sum of bid times {sum(delays) * 1e3:.1f} ms, max {max(delays) * 1e3:.1f} ms "
+          f"(bids identical)")
+    print(f"{'Method':<12} {'ms/round':>10}")
+    print(f"{'-'*12} {'-'*10}")
+    print(f"{'sequential':<12} {sequential_ms:>10.1f}")
+    print(f"{'concurrent':<12} {concurrent_ms:>10.1f}")
+    print(f"Speedup: {sequential_ms / concurrent_ms:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark: ELELIL belief update, per-item Belief functions vs the vectorized BeliefState
+
+Simulates games from ValuationGenerator batches: the agent sees its own valuations,
+and each round's price is the second highest valuation in the arena, or for
+every other game a uniform price in [0, 21] (covering prices outside all value
+ranges). Both implementations are timed per update; that they give the same
+probabilities is tested in tests/test_elelil_beliefs.py.
+
+Usage:
+    python -m benchmarks.bench_elelil_beliefs [--games 2000] [--teams 5] [--seed 0]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.valuation_generator import ValuationGenerator
+from teams.ELELIL import bidding_agent as elelil
+
+
+def simulate_games(num_games: int, num_teams: int, seed: int) -> list:
+    """
+    Returns:
+        List of (valuation_vector, [(item_id, price_paid), ...]) per game, from team 0's view
+    """
+    generator = ValuationGenerator(random_seed=seed)
+    batch = generator.generate_batch([f"team_{i}" for i in range(num_teams)], num_games)
+    rng = np.random.default_rng(seed)
+
+    games = []
+    for game in range(num_games):
+        valuation_vector = batch.valuation_vector(game, 0)
+        item_values = batch.values[game].T
+        rounds = []
+        for item_index, item_id in zip(batch.auction_sequences[game].tolist(), batch.auction_sequence(game)):
+            if game % 2 == 0:
+                price = float(np.sort(item_values[item_index])[-2])
+            else:
+                price = float(rng.uniform(0.0, 21.0))
+            rounds.append((item_id, price))
+        games.append((valuation_vector, rounds))
+    return games
+
+
+def reference_beliefs(valuation_vector: dict) -> dict:
+    """Initial beliefs as BiddingAgent computed them with the per-item functions"""
+    return elelil.get_posteriors_from_values(
+        valuation_vector,
+        elelil.Belief(elelil.TOTAL_HIGH / elelil.TOTAL_ITEMS, elelil.TOTAL_MIXED / elelil.TOTAL_ITEMS,
+                      elelil.TOTAL_LOW / elelil.TOTAL_ITEMS),
+        [item_id for item_id, value in valuation_vector.items() if value >= elelil.VALUE_RANGE_HIGH[0]],
+        [item_id for item_id, value in valuation_vector.items() if value <= elelil.VALUE_RANGE_LOW[1]]
+    )
+
+
+def time_updates(games: list, num_bidders: int, vectorized: bool) -> float:
+    """Mean seconds per belief update over all rounds of all games"""
+    updates = 0
+    elapsed = 0.0
+    for valuation_vector, rounds in games:
+        if vectorized:
+            state = elelil.BeliefState(valuation_vector, num_bidders)
+        else:
+            beliefs = reference_beliefs(valuation_vector)
+        seen = set()
+        for item_id, price in rounds:
+            seen.add(item_id)
+            start = time.perf_counter()
+            if vectorized:
+                elelil.update_beliefs_with_price(state, item_id, price)
+            else:
+                try:
+                    beliefs, _ = elelil.get_updated_beliefs_according_to_price(
+                        item_id, price, valuation_vector, beliefs, seen, num_bidders)
+                except ZeroDivisionError:
+                    pass
+            elapsed += time.perf_counter() - start
+            updates += 1
+    return elapsed / updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ELELIL belief update, per-item vs vectorized")
+    parser.add_argument('--games', type=int, default=2000, help='Simulated games')
+    parser.add_argument('--teams', type=int, default=5, help='Teams in the arena')
+    parser.add_argument('--seed', type=int, default=0, help='Valuation seed')
+    args = parser.parse_args()
+
+    games = simulate_games(args.games, args.teams, args.seed)
+    print(f"Games: {args.games}, {args.teams} teams")
+
+    per_item = time_updates(games, args.teams, vectorized=False)
+    vectorized = time_updates(games, args.teams, vectorized=True)
+    print(f"{'Implementation':<16} {'us/update':>10}")
+    print(f"{'-'*16} {'-'*10}")
+    print(f"{'per-item':<16} {per_item * 1e6:>10.1f}")
+    print(f"{'vectorized':<16} {vectorized * 1e6:>10.1f}")
+    print(f"Speedup: {per_item / vectorized:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: memory held by finished games, GameResult dataclasses vs GameRecord
+
+Plays games with trivial inline agents, then measures with tracemalloc how much
+memory stays allocated when the games are kept as GameResult dataclasses
+(per-round dicts, datetimes and valuation dict copies) and as compact GameRecords.
+Both must serialize to the same to_dict().
+
+Usage:
+    python -m benchmarks.bench_game_record [--games 2000] [--teams 5]
+"""
+
+import argparse
+import json
+import logging
+import tracemalloc
+
+from src.agent_manager import AgentManager
+from src.auction_engine import AuctionEngine
+from src.game_manager import GameManager
+from src.random_streams import GameRandomStreams
+from src.valuation_generator import ValuationGenerator
+
+
+def play_games(team_agents: dict, num_games: int, seed: int) -> list:
+    """Play num_games headless games and return their GameRecords"""
+    valuation_generator = ValuationGenerator(random_seed=seed)
+    agent_manager = AgentManager(execution_mode="inline")
+    records = []
+
+    try:
+        for game_num in range(1, num_games + 1):
+            random_streams = GameRandomStreams.for_game(seed, 1, "bench", game_num)
+            game_manager = GameManager(
+                stage=1,
+                arena_id="bench",
+                game_number=game_num,
+                valuation_generator=valuation_generator,
+                auction_engine=AuctionEngine(rng=random_streams.tie_break),
+                agent_manager=agent_manager,
+                random_streams=random_streams,
+                headless=True
+            )
+            records.append(game_manager.run_game(team_agents))
+    finally:
+        agent_manager.shutdown()
+
+    return records
+
+
+def retained_bytes(build) -> tuple:
+    """Return (result of build(), bytes it still holds once built)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Retained memory of GameResult vs GameRecord")
+    parser.add_argument('--games', type=int, default=2000, help='Number of games')
+    parser.add_argument('--teams', type=int, default=5, help='Teams per game')
+    parser.add_argument('--agent', default='examples/truthful_bidder.py', help='Agent used by every team')
+    parser.add_argument('--seed', type=int, default=0, help='Tournament seed')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    team_agents = {f"team_{i}": args.agent for i in range(args.teams)}
+    records = play_games(team_agents, args.games, args.seed)
+
+    dumps = [json.dumps(record.to_dict(), sort_keys=True) for record in records]
+
+    results, result_bytes = retained_bytes(lambda: [record.to_game_result() for record in records])
+    packed, record_bytes = retained_bytes(lambda: [type(record).from_game_result(game) for game, record
+                                                   in zip(results, records)])
+
+    assert dumps == [json.dumps(game.to_dict(), sort_keys=True) for game in results], \
+        "GameResult serialization differs"
+    assert dumps == [json.dumps(record.to_dict(), sort_keys=True) for record in packed], \
+        "GameRecord serialization differs"
+
+    print(f"Games: {args.games} x {args.teams} teams (serialization identical)")
+    print(f"{'Storage':<12} {'MB':>10} {'KB/game':>10}")
+    print(f"{'-'*12} {'-'*10} {'-'*10}")
+    print(f"{'GameResult':<12} {result_bytes / 2**20:>10.1f} {result_bytes / args.games / 1024:>10.2f}")
+    print(f"{'GameRecord':<12} {record_bytes / 2**20:>10.1f} {record_bytes / args.games / 1024:>10.2f}")
+    print(f"Reduction: {result_bytes / record_bytes:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark: per-round cost of OpponentTracker inside an agent
+
+Replays simulated games (random winners and second prices from ValuationGenerator
+batches) through an OpponentTracker and checks every round against budgets
+recomputed from the full round history. Then times the tracker's per-round work,
+one update() and one max_feasible_bid(), next to the ELELIL agent's own
+update_after_each_round and bidding_function for the same rounds.
+
+Usage:
+    python -m benchmarks.bench_opponent_state [--games 2000] [--teams 5] [--seed 0]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.config import INITIAL_BUDGET
+from src.opponent_state import OpponentTracker
+from src.valuation_generator import ValuationGenerator
+from teams.ELELIL.bidding_agent import BiddingAgent
+
+
+def simulate_games(num_games: int, num_teams: int, seed: int) -> list:
+    """
+    Truthful second-price games, with bids capped at the bidder's remaining budget.
+
+    Returns:
+        List of (team_ids, valuation_vector of team 0, [(item_id, winning_team, price_paid), ...]) per game
+    """
+    team_ids = [f"team_{i}" for i in range(num_teams)]
+    batch = ValuationGenerator(random_seed=seed).generate_batch(team_ids, num_games)
+
+    games = []
+    for game in range(num_games):
+        budgets = np.full(num_teams, float(INITIAL_BUDGET))
+        rounds = []
+        for item_index, item_id in zip(batch.auction_sequences[game].tolist(), batch.auction_sequence(game)):
+            bids = np.minimum(batch.values[game, :, item_index], budgets)
+            order = np.argsort(-bids, kind="stable")
+            winner, price = int(order[0]), round(float(bids[order[1]]), 2)
+            budgets[winner] -= price
+            rounds.append((item_id, team_ids[winner], price))
+        games.append((team_ids, batch.valuation_vector(game, 0), rounds))
+    return games
+
+
+def check_against_history(games: list) -> int:
+    """Compare the tracker with budgets recomputed from all rounds so far; return rounds checked"""
+    checked = 0
+    for team_ids, _, rounds in games:
+        opponents = team_ids[1:]
+        tracker = OpponentTracker(opponents)
+        history = []
+        for _, winning_team, price in rounds:
+            tracker.update(winning_team, price)
+            history.append((winning_team, price))
+
+            spent = {team: sum(p for w, p in history if w == team) for team in opponents}
+            won = {team: sum(1 for w, _ in history if w == team) for team in opponents}
+            for team in opponents:
+                assert abs(tracker.remaining_budget(team) - (INITIAL_BUDGET - spent[team])) < 1e-9, team
+                assert tracker.items_won[opponents.index(team)] == won[team], team
+            assert abs(tracker.max_feasible_bid() - max(INITIAL_BUDGET - s for s in spent.values())) < 1e-9
+            checked += 1
+    return checked
+
+
+def time_rounds(games: list) -> tuple:
+    """
+    Returns:
+        Tuple of (mean seconds per round of the tracker, of the ELELIL agent)
+    """
+    tracker_seconds, agent_seconds, rounds_played = 0.0, 0.0, 0
+    for team_ids, valuation_vector, rounds in games:
+        opponents = team_ids[1:]
+        tracker = OpponentTracker(opponents)
+        agent = BiddingAgent(team_ids[0], valuation_vector, INITIAL_BUDGET, opponents)
+        for item_id, winning_team, price in rounds:
+            start = time.perf_counter()
+            tracker.max_feasible_bid()
+            tracker.update(winning_team, price)
+            tracker_seconds += time.perf_counter() - start
+
+            start = time.perf_counter()
+            agent.bidding_function(item_id)
+            agent.update_after_each_round(item_id, winning_team, price)
+            agent_seconds += time.perf_counter() - start
+            rounds_played += 1
+    return tracker_seconds / rounds_played, agent_seconds / rounds_played
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-round cost of OpponentTracker")
+    parser.add_argument('--games', type=int, default=2000, help='Simulated games')
+    parser.add_argument('--teams', type=int, default=5, help='Teams in the arena')
+    parser.add_argument('--seed', type=int, default=0, help='Valuation seed')
+    args = parser.parse_args()
+
+    games = simulate_games(args.games, args.teams, args.seed)
+    print(f"{check_against_history(games)} rounds match budgets recomputed from history")
+
+    tracker, agent = time_rounds(games)
+    print(f"{'Per round':<28} {'us':>8}")
+    print(f"{'-'*28} {'-'*8}")
+    print(f"{'OpponentTracker':<28} {tracker * 1e6:>8.2f}")
+    print(f"{'ELELIL bid + update':<28} {agent * 1e6:>8.2f}")
+    print(f"Tracker share of the agent's round: {tracker / agent:.1%}")
+
+
+if __name__ == '__main__':
+    main()
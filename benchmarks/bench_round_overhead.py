@@ -0,0 +1,132 @@
+"""
+Benchmark: per-round overhead of GameManager, normal vs headless
+
+Plays full games with trivial agents called inline, so what remains is the
+engine's own bookkeeping: logging, timestamps and result construction. All
+modes use the same seeds and must produce the same winners and prices.
+
+Besides normal and headless games at --log-level, a third mode plays normal
+games with the engine loggers at INFO and a NullHandler: every per-round
+message is then formatted and dropped, which is what each round paid before
+the level guards. Modes run interleaved for --repeats rounds and the fastest
+run of each is reported, so ordering and allocator warm-up do not favour one.
+
+At WARNING, headless and normal games differ only in per-round level checks
+and one datetime.now(); expect no measurable difference between them. The
+saving is in the guards, i.e. normal vs INFO.
+
+Usage:
+    python -m benchmarks.bench_round_overhead [--games 2000] [--teams 5] [--repeats 5] [--log-level WARNING]
+"""
+
+import argparse
+import logging
+import time
+
+from src.agent_manager import AgentManager
+from src.auction_engine import AuctionEngine
+from src.config import T_AUCTION_ROUNDS
+from src.game_manager import GameManager
+from src.random_streams import GameRandomStreams
+from src.valuation_generator import ValuationGenerator
+
+
+def play_games(headless: bool, team_agents: dict, num_games: int, seed: int):
+    """
+    Play num_games games and return (seconds, outcomes).
+
+    outcomes holds the (winner_id, price_paid) of every round, for comparing modes.
+    """
+    valuation_generator = ValuationGenerator(random_seed=seed)
+    agent_manager = AgentManager(execution_mode="inline")
+    outcomes = []
+    elapsed = 0.0
+
+    try:
+        for game_num in range(1, num_games + 1):
+            random_streams = GameRandomStreams.for_game(seed, 1, "bench", game_num)
+            game_manager = GameManager(
+                stage=1,
+                arena_id="bench",
+                game_number=game_num,
+                valuation_generator=valuation_generator,
+                auction_engine=AuctionEngine(rng=random_streams.tie_break),
+                agent_manager=agent_manager,
+                random_streams=random_streams,
+                headless=headless
+            )
+
+            start = time.perf_counter()
+            game_result = game_manager.run_game(team_agents)
+            elapsed += time.perf_counter() - start
+
+            outcomes.extend((r.winner_id, r.price_paid) for r in game_result.auction_log)
+    finally:
+        agent_manager.shutdown()
+
+    return elapsed, outcomes
+
+
+# Engine loggers whose per-round messages the level guards skip
+ENGINE_LOGGERS = ("src.game_manager", "src.auction_engine", "src.agent_manager")
+
+
+def play_games_at_info(team_agents: dict, num_games: int, seed: int):
+    """play_games in normal mode with the engine loggers at INFO (messages formatted, then dropped)"""
+    loggers = [logging.getLogger(name) for name in ENGINE_LOGGERS]
+    levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(logging.INFO)
+    try:
+        return play_games(False, team_agents, num_games, seed)
+    finally:
+        for logger, level in zip(loggers, levels):
+            logger.setLevel(level)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GameManager per-round overhead, normal vs headless")
+    parser.add_argument('--games', type=int, default=2000, help='Number of games per mode')
+    parser.add_argument('--teams', type=int, default=5, help='Teams per game')
+    parser.add_argument('--agent', default='examples/truthful_bidder.py', help='Agent used by every team')
+    parser.add_argument('--seed', type=int, default=0, help='Tournament seed')
+    parser.add_argument('--repeats', type=int, default=5, help='Interleaved runs per mode (fastest is kept)')
+    parser.add_argument('--log-level', default='WARNING',
+                        help='Root log level; records are formatted and then dropped by a NullHandler')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, handlers=[logging.NullHandler()])
+
+    team_agents = {f"team_{i}": args.agent for i in range(args.teams)}
+    num_rounds = args.games * T_AUCTION_ROUNDS
+
+    # Warm up the module cache and allocator
+    play_games(False, team_agents, min(50, args.games), args.seed)
+
+    modes = {
+        "normal@INFO": lambda: play_games_at_info(team_agents, args.games, args.seed),
+        "normal": lambda: play_games(False, team_agents, args.games, args.seed),
+        "headless": lambda: play_games(True, team_agents, args.games, args.seed),
+    }
+    best = dict.fromkeys(modes, float('inf'))
+    reference = None
+    for _ in range(max(1, args.repeats)):
+        for mode, run in modes.items():
+            seconds, outcomes = run()
+            best[mode] = min(best[mode], seconds)
+            if reference is None:
+                reference = outcomes
+            assert outcomes == reference, f"Round outcomes differ in mode {mode}"
+
+    print(f"Games: {args.games} x {args.teams} teams x {T_AUCTION_ROUNDS} rounds, "
+          f"log level {args.log_level}, best of {max(1, args.repeats)} (results identical)")
+    print(f"{'Mode':<12} {'seconds':>10} {'us/round':>10}")
+    print(f"{'-'*12} {'-'*10} {'-'*10}")
+    for mode, seconds in best.items():
+        print(f"{mode:<12} {seconds:>10.3f} {seconds / num_rounds * 1e6:>10.1f}")
+    print(f"Guards (normal@INFO / normal): {best['normal@INFO'] / best['normal']:.2f}x")
+    print(f"Headless (normal / headless): {best['normal'] / best['headless']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: full-stage simulation throughput
+
+Splits teams into arenas of ARENA_SIZE and plays every arena's games with
+headless GameManagers and inline agents, as a stage simulation would, then
+reports games and rounds per second (best of --repeat runs). A second table
+compares the auction engine's dict-based execute_round with the team-indexed
+execute_round_indexed used by GameManager on identical bids; both must give
+the same outcomes.
+
+Usage:
+    python -m benchmarks.bench_stage_throughput [--teams 25] [--games 200] [--repeat 3] [--rounds 20000]
+"""
+
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from src.agent_manager import AgentManager
+from src.auction_engine import AuctionEngine
+from src.config import ARENA_SIZE, INITIAL_BUDGET, T_AUCTION_ROUNDS
+from src.game_manager import GameManager
+from src.random_streams import GameRandomStreams
+from src.valuation_generator import ValuationGenerator
+
+
+def run_stage(team_agents: dict, num_games: int, seed: int) -> float:
+    """Play num_games games in every arena; return elapsed seconds"""
+    team_ids = list(team_agents)
+    arenas = {
+        str(a + 1): team_ids[start:start + ARENA_SIZE]
+        for a, start in enumerate(range(0, len(team_ids), ARENA_SIZE))
+    }
+    valuation_generator = ValuationGenerator(random_seed=seed)
+    agent_manager = AgentManager(execution_mode="inline")
+
+    start = time.perf_counter()
+    try:
+        for arena_id, arena_teams in arenas.items():
+            arena_agents = {team_id: team_agents[team_id] for team_id in arena_teams}
+            for game_num in range(1, num_games + 1):
+                random_streams = GameRandomStreams.for_game(seed, 1, arena_id, game_num)
+                GameManager(
+                    stage=1,
+                    arena_id=arena_id,
+                    game_number=game_num,
+                    valuation_generator=valuation_generator,
+                    auction_engine=AuctionEngine(rng=random_streams.tie_break),
+                    agent_manager=agent_manager,
+                    random_streams=random_streams,
+                    headless=True
+                ).run_game(arena_agents)
+    finally:
+        agent_manager.shutdown()
+    return time.perf_counter() - start
+
+
+def compare_engine(num_rounds: int, num_teams: int, seed: int):
+    """
+    Time the dict-based and the indexed engine entry points on the same bids.
+
+    Returns:
+        Tuple of (dict seconds, indexed seconds)
+    """
+    rng = np.random.default_rng(seed)
+    bids = np.floor(rng.uniform(0, 20, size=(num_rounds, num_teams)) * 4).tolist()
+    team_ids = [f"team_{i}" for i in range(num_teams)]
+    budgets = [INITIAL_BUDGET] * num_teams
+    budget_dict = dict(zip(team_ids, budgets))
+    execution_times = dict.fromkeys(team_ids, 0.0)
+
+    engine = AuctionEngine(rng=np.random.default_rng(seed))
+    start = time.perf_counter()
+    dict_outcomes = [
+        (result.winner_id, result.price_paid)
+        for result in (engine.execute_round(r, "item", dict(zip(team_ids, round_bids)), budget_dict,
+                                            execution_times)
+                       for r, round_bids in enumerate(bids))
+    ]
+    dict_seconds = time.perf_counter() - start
+
+    engine = AuctionEngine(rng=np.random.default_rng(seed))
+    start = time.perf_counter()
+    indexed_outcomes = []
+    for r, round_bids in enumerate(bids):
+        _, winner, price = engine.execute_round_indexed(r, "item", round_bids, budgets, team_ids)
+        indexed_outcomes.append((team_ids[winner] if winner >= 0 else None, price))
+    indexed_seconds = time.perf_counter() - start
+
+    assert dict_outcomes == indexed_outcomes, "Engine entry points disagree"
+    return dict_seconds, indexed_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-stage simulation throughput")
+    parser.add_argument('--teams', type=int, default=25, help='Teams in the stage')
+    parser.add_argument('--games', type=int, default=200, help='Games per arena')
+    parser.add_argument('--rounds', type=int, default=20000, help='Rounds for the engine comparison')
+    parser.add_argument('--repeat', type=int, default=3, help='Stage runs; the fastest is reported')
+    parser.add_argument('--agent', default='examples/truthful_bidder.py', help='Agent used by every team')
+    parser.add_argument('--seed', type=int, default=0, help='Tournament seed')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    team_agents = {f"team_{i}": args.agent for i in range(args.teams)}
+    num_arenas = -(-args.teams // ARENA_SIZE)
+    total_games = num_arenas * args.games
+
+    # Warm up the module cache and allocator
+    run_stage(team_agents, min(10, args.games), args.seed)
+    seconds = min(run_stage(team_agents, args.games, args.seed) for _ in range(args.repeat))
+
+    print(f"Stage: {args.teams} teams in {num_arenas} arenas x {args.games} games")
+    print(f"{total_games / seconds:.0f} games/s, {total_games * T_AUCTION_ROUNDS / seconds:.0f} rounds/s "
+          f"({seconds:.2f} s)")
+
+    dict_seconds, indexed_seconds = compare_engine(args.rounds, ARENA_SIZE, args.seed)
+    print()
+    print(f"Auction engine, {args.rounds} rounds x {ARENA_SIZE} teams (outcomes identical)")
+    print(f"{'Entry point':<22} {'us/round':>10}")
+    print(f"{'-'*22} {'-'*10}")
+    print(f"{'execute_round':<22} {dict_seconds / args.rounds * 1e6:>10.2f}")
+    print(f"{'execute_round_indexed':<22} {indexed_seconds / args.rounds * 1e6:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,10 +10,12 @@ from datetime import datetime
 import os
 
 from src.valuation_generator import ValuationGenerator
-from src.results_manager import ResultsManager
+from src.results_manager import ResultsManager, load_run_manifest
 from src.tournament_manager import TournamentManager
 from src.utils import Team, generate_team_id
-from src.config import BID_TIMEOUT_SECONDS, RANDOM_SEED
+from src.config import BID_TIMEOUT_SECONDS, RANDOM_SEED, AGENT_EXECUTION_MODE, RESULT_FORMAT
+from src.result_sinks import RESULT_FORMATS
+from src.scheduler import load_agent_costs
 from typing import Dict, List, Optional
 import json
 
@@ -177,7 +179,68 @@ def load_teams_from_directory(teams_dir: str, registration_file: str = None) ->
     return teams
 
 
-def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: int = None):
+def create_tournament_manager(output_dir: str, timeout: float, seed: Optional[int],
+                              arena_workers: int, execution_mode: str, result_format: str,
+                              resume: bool = False,
+                              latency_report: str = None) -> Optional[TournamentManager]:
+    """
+    Build the tournament components, resuming an interrupted run if requested.
+    
+    A fresh run records its seed in the output directory's manifest. With resume,
+    the seed and result format are taken from that manifest and the games already
+    stored there are reused instead of replayed. Agent latencies measured by a
+    previous run (latency_report) guide arena scheduling.
+    
+    Returns:
+        TournamentManager, or None if the run cannot be resumed
+    """
+    completed_games = {}
+    
+    if resume:
+        manifest = load_run_manifest(output_dir)
+        if manifest is None:
+            logging.error(f"Cannot resume: no run manifest found in {output_dir}")
+            return None
+        if seed is not None and seed != manifest["seed"]:
+            logging.error(f"Cannot resume with --seed {seed}: the run in {output_dir} used seed {manifest['seed']}")
+            return None
+        if result_format != manifest["result_format"]:
+            logging.warning(f"Resuming with the run's result format '{manifest['result_format']}'")
+        
+        seed = manifest["seed"]
+        result_format = manifest["result_format"]
+        logging.info(f"Resuming run started {manifest['started']} (seed {seed})")
+    
+    valuation_generator = ValuationGenerator(random_seed=seed)
+    results_manager = ResultsManager(output_dir=output_dir, result_format=result_format)
+    
+    if resume:
+        completed_games = results_manager.load_completed_games()
+    
+    agent_costs = load_agent_costs(latency_report) if latency_report else None
+    
+    tournament_manager = TournamentManager(
+        valuation_generator=valuation_generator,
+        results_manager=results_manager,
+        timeout_seconds=timeout,
+        arena_workers=arena_workers,
+        execution_mode=execution_mode,
+        completed_games=completed_games,
+        agent_costs=agent_costs
+    )
+    
+    if not resume:
+        results_manager.write_manifest(tournament_manager.seed)
+    
+    return tournament_manager
+
+
+def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: int = None,
+                        arena_workers: int = 1,
+                        execution_mode: str = AGENT_EXECUTION_MODE,
+                        result_format: str = RESULT_FORMAT,
+                        resume: bool = False,
+                        latency_report: str = None):
     """
     Run the complete tournament.
     
@@ -186,6 +249,12 @@ def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: i
         output_dir: Directory for results output
         timeout: Timeout for bid execution
         seed: Random seed for reproducibility
+        arena_workers: Number of worker processes for running arenas
+        execution_mode: Agent execution backend ("thread", "process", "inline" or "async")
+        result_format: Per-game result storage format ("json", "jsonl" or "jsonl.gz")
+        resume: Continue the interrupted run stored in output_dir
+        latency_report: Latency report (or results directory) of a previous run,
+            used to estimate arena costs for scheduling
     """
     logging.info("Loading teams...")
     teams = load_teams_from_directory(teams_dir)
@@ -197,13 +266,11 @@ def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: i
     logging.info(f"Loaded {len(teams)} teams")
     
     # Initialize components
-    valuation_generator = ValuationGenerator(random_seed=seed)
-    results_manager = ResultsManager(output_dir=output_dir)
-    tournament_manager = TournamentManager(
-        valuation_generator=valuation_generator,
-        results_manager=results_manager,
-        timeout_seconds=timeout
-    )
+    tournament_manager = create_tournament_manager(output_dir, timeout, seed, arena_workers,
+                                                   execution_mode, result_format, resume,
+                                                   latency_report)
+    if tournament_manager is None:
+        return
     
     # Run tournament
     try:
@@ -213,7 +280,12 @@ def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: i
         logging.error(f"Tournament failed: {e}", exc_info=True)
 
 
-def run_single_stage(stage: int, teams_dir: str, output_dir: str, timeout: float, seed: int = None):
+def run_single_stage(stage: int, teams_dir: str, output_dir: str, timeout: float, seed: int = None,
+                     arena_workers: int = 1,
+                     execution_mode: str = AGENT_EXECUTION_MODE,
+                     result_format: str = RESULT_FORMAT,
+                     resume: bool = False,
+                     latency_report: str = None):
     """
     Run a single stage only.
     
@@ -223,6 +295,12 @@ def run_single_stage(stage: int, teams_dir: str, output_dir: str, timeout: float
         output_dir: Directory for results output
         timeout: Timeout for bid execution
         seed: Random seed for reproducibility
+        arena_workers: Number of worker processes for running arenas
+        execution_mode: Agent execution backend ("thread", "process", "inline" or "async")
+        result_format: Per-game result storage format ("json", "jsonl" or "jsonl.gz")
+        resume: Continue the interrupted run stored in output_dir
+        latency_report: Latency report (or results directory) of a previous run,
+            used to estimate arena costs for scheduling
     """
     logging.info(f"Loading teams for Stage {stage}...")
     teams = load_teams_from_directory(teams_dir)
@@ -234,13 +312,11 @@ def run_single_stage(stage: int, teams_dir: str, output_dir: str, timeout: float
     logging.info(f"Loaded {len(teams)} teams")
     
     # Initialize components
-    valuation_generator = ValuationGenerator(random_seed=seed)
-    results_manager = ResultsManager(output_dir=output_dir)
-    tournament_manager = TournamentManager(
-        valuation_generator=valuation_generator,
-        results_manager=results_manager,
-        timeout_seconds=timeout
-    )
+    tournament_manager = create_tournament_manager(output_dir, timeout, seed, arena_workers,
+                                                   execution_mode, result_format, resume,
+                                                   latency_report)
+    if tournament_manager is None:
+        return
     
     # Run stage
     try:
@@ -352,6 +428,43 @@ def main():
         help='Random seed for reproducibility'
     )
     
+    parser.add_argument(
+        '--arena-workers',
+        type=int,
+        default=1,
+        help='Number of worker processes for running arenas in parallel (default: 1, sequential)'
+    )
+    
+    parser.add_argument(
+        '--execution-mode',
+        choices=['thread', 'process', 'inline', 'async'],
+        default=AGENT_EXECUTION_MODE,
+        help='Agent execution backend: new thread per bid, persistent worker process per agent, '
+             'direct inline calls (no timeout, trusted agents only), or agent subprocesses '
+             'driven from one asyncio event loop that interleaves many games'
+    )
+    
+    parser.add_argument(
+        '--result-format',
+        choices=list(RESULT_FORMATS),
+        default=RESULT_FORMAT,
+        help='Per-game result storage: indented JSON files per game, or append-only '
+             'JSON Lines per arena (optionally gzipped) for large runs'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Continue an interrupted run in --output-dir: reuse its seed and skip '
+             'games whose results are already stored'
+    )
+    
+    parser.add_argument(
+        '--latency-report',
+        help='Latency report CSV or results directory of a previous run; measured agent '
+             'latencies are used to schedule the most expensive arenas first'
+    )
+    
     parser.add_argument(
         '--log-file',
         help='Log file path'
@@ -371,13 +484,17 @@ def main():
     
     # Execute based on mode
     if args.mode == 'tournament':
-        run_full_tournament(args.teams_dir, args.output_dir, args.timeout, args.seed)
+        run_full_tournament(args.teams_dir, args.output_dir, args.timeout, args.seed,
+                            args.arena_workers, args.execution_mode, args.result_format, args.resume,
+                            args.latency_report)
     
     elif args.mode == 'stage':
         if args.stage is None:
             logging.error("--stage required for stage mode")
             return
-        run_single_stage(args.stage, args.teams_dir, args.output_dir, args.timeout, args.seed)
+        run_single_stage(args.stage, args.teams_dir, args.output_dir, args.timeout, args.seed,
+                         args.arena_workers, args.execution_mode, args.result_format, args.resume,
+                         args.latency_report)
     
     elif args.mode == 'validate':
         if args.validate is None:
@@ -0,0 +1,328 @@
+"""
+AGT Competition Monte-Carlo Estimator
+Estimate each team's chances by replaying the tournament many times
+
+A 5-game arena is a very noisy measurement of an agent. This tool runs N
+replicas of the full tournament (Stage 1 arenas, then the championship), each
+from its own seed and so with its own random arena assignment, in parallel
+worker processes. It reports every team's probability of winning its arena and
+the championship together with its mean Stage 1 utility, each with a bootstrap
+confidence interval. Estimates are printed as replicas complete, and the run
+stops early once every arena win interval is narrower than --ci-width.
+
+Usage:
+    python montecarlo.py --teams-dir teams --replicas 200 --workers 4 [--ci-width 0.1]
+    python montecarlo.py --teams-dir teams --execution-mode inline   # trusted agents, fastest
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from main import load_teams_from_directory
+from src.config import AGENT_EXECUTION_MODE, BID_TIMEOUT_SECONDS
+from src.random_streams import new_base_seed
+from src.tournament_manager import TournamentManager
+from src.utils import Team, format_utility, save_json
+from src.valuation_generator import ValuationGenerator
+
+
+# Spawn key component separating replica seeds from other uses of the base seed
+REPLICA_STREAM = 0x4D43
+
+
+def replica_seed(base_seed: int, replica: int) -> int:
+    """Tournament seed of one replica, derived from the base seed"""
+    seed_sequence = np.random.SeedSequence(entropy=base_seed, spawn_key=(REPLICA_STREAM, replica))
+    return int(seed_sequence.generate_state(1, dtype=np.uint64)[0])
+
+
+def run_replica(teams: List[Team], seed: int, timeout: float,
+                execution_mode: str) -> Dict[str, Tuple[bool, bool, float]]:
+    """
+    Play one full tournament in memory, with headless games.
+
+    Args:
+        teams: All registered teams
+        seed: Tournament seed of this replica
+        timeout: Timeout for agent bid execution
+        execution_mode: Agent execution backend (see AgentManager)
+
+    Returns:
+        Dictionary mapping team_id to (won its arena, won the championship, Stage 1 utility)
+    """
+    tournament_manager = TournamentManager(
+        valuation_generator=ValuationGenerator(random_seed=seed),
+        results_manager=None,
+        timeout_seconds=timeout,
+        execution_mode=execution_mode,
+        headless=True
+    )
+    stage1_result, qualified_teams = tournament_manager.run_stage1(teams)
+    stage2_result = tournament_manager.run_stage2(qualified_teams)
+
+    arena_winners = {team.team_id for team in qualified_teams}
+    champion = stage2_result.leaderboard[0]['team_id'] if stage2_result.leaderboard else None
+    stage1_utility = {entry['team_id']: entry['total_utility'] for entry in stage1_result.leaderboard}
+
+    return {
+        team.team_id: (team.team_id in arena_winners, team.team_id == champion,
+                       stage1_utility.get(team.team_id, 0.0))
+        for team in teams
+    }
+
+
+def _run_replica_in_worker(replica: int, teams: List[Team], base_seed: int, timeout: float,
+                           execution_mode: str) -> Tuple[int, Dict[str, Tuple[bool, bool, float]]]:
+    """Process pool task: run one replica and return (replica, its summary)"""
+    return replica, run_replica(teams, replica_seed(base_seed, replica), timeout, execution_mode)
+
+
+class ReplicaEstimates:
+    """
+    Running estimates over finished replicas, with percentile bootstrap intervals.
+
+    Replicas finish out of order; they are kept by replica number, so the
+    estimates for a given set of replicas do not depend on completion order.
+    Bootstrap resamples use a fixed seed for the same reason.
+    """
+
+    def __init__(self, team_ids: List[str], confidence: float = 0.95,
+                 bootstrap_samples: int = 2000, bootstrap_seed: int = 0):
+        """
+        Args:
+            team_ids: Teams to track, in report order for ties
+            confidence: Confidence level of the intervals
+            bootstrap_samples: Number of bootstrap resamples
+            bootstrap_seed: Seed of the resampling generator
+        """
+        self.team_ids = list(team_ids)
+        self.confidence = confidence
+        self.bootstrap_samples = bootstrap_samples
+        self.bootstrap_seed = bootstrap_seed
+        # replica -> (teams x 3) rows of (arena win, championship win, Stage 1 utility)
+        self._replicas: Dict[int, np.ndarray] = {}
+
+    def add(self, replica: int, summary: Dict[str, Tuple[bool, bool, float]]):
+        """Record the summary of a finished replica"""
+        self._replicas[replica] = np.array([summary[team_id] for team_id in self.team_ids], dtype=float)
+
+    @property
+    def num_replicas(self) -> int:
+        return len(self._replicas)
+
+    def estimates(self) -> List[Dict]:
+        """
+        Point estimates and confidence intervals per team.
+
+        Returns:
+            List of dicts (team_id, arena_win, championship_win, stage1_utility,
+            each metric with *_ci = (low, high)), sorted by arena win probability
+        """
+        if not self._replicas:
+            return []
+
+        # (replicas, teams * 3) in replica order
+        data = np.stack([self._replicas[r] for r in sorted(self._replicas)]).reshape(self.num_replicas, -1)
+        num_replicas = len(data)
+
+        # Each bootstrap resample is a multinomial count per replica, so all
+        # resampled means come from one matrix product
+        rng = np.random.default_rng(self.bootstrap_seed)
+        counts = rng.multinomial(num_replicas, np.full(num_replicas, 1 / num_replicas),
+                                 size=self.bootstrap_samples)
+        resampled = counts @ data / num_replicas
+
+        tail = (1 - self.confidence) / 2
+        low, high = np.quantile(resampled, [tail, 1 - tail], axis=0)
+        means = data.mean(axis=0)
+
+        metrics = ("arena_win", "championship_win", "stage1_utility")
+        estimates = []
+        for t, team_id in enumerate(self.team_ids):
+            entry = {'team_id': team_id}
+            for m, metric in enumerate(metrics):
+                column = t * len(metrics) + m
+                entry[metric] = float(means[column])
+                entry[f"{metric}_ci"] = (float(low[column]), float(high[column]))
+            estimates.append(entry)
+
+        estimates.sort(key=lambda e: (-e['arena_win'], -e['stage1_utility']))
+        return estimates
+
+    @staticmethod
+    def max_interval_width(estimates: List[Dict], metric: str = "arena_win") -> float:
+        """Widest confidence interval of a metric across teams"""
+        return max((e[f"{metric}_ci"][1] - e[f"{metric}_ci"][0] for e in estimates), default=float('inf'))
+
+
+def iter_replicas(teams: List[Team], num_replicas: int, base_seed: int, timeout: float,
+                  execution_mode: str, workers: int) -> Iterator[Tuple[int, Dict]]:
+    """
+    Yield (replica, summary) as replicas complete.
+
+    With workers > 1 replicas run in a process pool, with at most two per
+    worker submitted ahead, so closing the iterator early (once estimates are
+    tight) wastes little work. Failed replicas are logged and skipped.
+    """
+    if workers <= 1:
+        for replica in range(num_replicas):
+            try:
+                yield _run_replica_in_worker(replica, teams, base_seed, timeout, execution_mode)
+            except Exception as e:
+                logging.error(f"Replica {replica} failed: {e}", exc_info=True)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        next_replica = 0
+        pending = set()
+        while next_replica < num_replicas or pending:
+            while next_replica < num_replicas and len(pending) < 2 * workers:
+                pending.add(executor.submit(_run_replica_in_worker, next_replica, teams, base_seed,
+                                            timeout, execution_mode))
+                next_replica += 1
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    yield future.result()
+                except Exception as e:
+                    logging.error(f"Replica worker failed: {e}", exc_info=True)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def print_estimates(estimates: List[Dict], num_replicas: int, confidence: float):
+    """Print the current estimates table"""
+    print(f"\nAfter {num_replicas} replicas ({confidence:.0%} bootstrap intervals)")
+    print(f"{'Team':<25} {'P(arena win)':>22} {'P(champion)':>22} {'Stage 1 utility':>30}")
+    print(f"{'-'*25} {'-'*22} {'-'*22} {'-'*30}")
+    for e in estimates:
+        arena_low, arena_high = e['arena_win_ci']
+        title_low, title_high = e['championship_win_ci']
+        utility_low, utility_high = e['stage1_utility_ci']
+        print(f"{e['team_id']:<25} "
+              f"{e['arena_win']:>6.1%} [{arena_low:>5.1%}, {arena_high:>5.1%}] "
+              f"{e['championship_win']:>6.1%} [{title_low:>5.1%}, {title_high:>5.1%}] "
+              f"{format_utility(e['stage1_utility']):>10} "
+              f"[{format_utility(utility_low)}, {format_utility(utility_high)}]")
+    sys.stdout.flush()
+
+
+def run_estimation(teams: List[Team], num_replicas: int, base_seed: int, timeout: float,
+                   execution_mode: str, workers: int, ci_width: float, min_replicas: int,
+                   report_every: int, confidence: float, bootstrap_samples: int) -> List[Dict]:
+    """
+    Run replicas until num_replicas are done or every arena win interval is
+    narrower than ci_width (after at least min_replicas).
+
+    Returns:
+        Final estimates (see ReplicaEstimates.estimates)
+    """
+    tracker = ReplicaEstimates([team.team_id for team in teams], confidence, bootstrap_samples)
+    estimates = []
+    reported = 0
+    start = time.perf_counter()
+
+    replicas = iter_replicas(teams, num_replicas, base_seed, timeout, execution_mode, workers)
+    try:
+        for replica, summary in replicas:
+            tracker.add(replica, summary)
+            done = tracker.num_replicas
+            report = done % report_every == 0
+            if not report and done < min_replicas:
+                continue
+
+            estimates = tracker.estimates()
+            width = ReplicaEstimates.max_interval_width(estimates)
+            if report:
+                print_estimates(estimates, done, confidence)
+                print(f"Widest arena win interval: {width:.3f} ({time.perf_counter() - start:.1f} s)")
+                reported = done
+
+            if done >= min_replicas and width <= ci_width:
+                print(f"\nAll arena win intervals at most {ci_width} wide, stopping after {done} replicas")
+                break
+    finally:
+        replicas.close()
+
+    if tracker.num_replicas != reported:
+        estimates = tracker.estimates()
+        print_estimates(estimates, tracker.num_replicas, confidence)
+    return estimates
+
+
+def main():
+    """Main entry point for the Monte-Carlo estimator"""
+    parser = argparse.ArgumentParser(
+        description="AGT Competition Monte-Carlo Estimator - replicate the tournament to estimate win probabilities"
+    )
+
+    parser.add_argument('--teams-dir', default='teams', help='Directory containing team submissions')
+    parser.add_argument('--replicas', type=int, default=200, help='Maximum number of tournament replicas')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes running replicas')
+    parser.add_argument('--ci-width', type=float, default=0.1,
+                        help='Stop once every arena win probability interval is at most this wide')
+    parser.add_argument('--min-replicas', type=int, default=30,
+                        help='Replicas to run before stopping early is considered')
+    parser.add_argument('--report-every', type=int, default=10, help='Print estimates every N replicas')
+    parser.add_argument('--confidence', type=float, default=0.95, help='Confidence level of the intervals')
+    parser.add_argument('--bootstrap-samples', type=int, default=2000, help='Bootstrap resamples')
+    parser.add_argument('--seed', type=int, help='Base seed; replica seeds derive from it')
+    parser.add_argument('--timeout', type=float, default=BID_TIMEOUT_SECONDS,
+                        help='Timeout for bid execution (seconds)')
+    parser.add_argument('--execution-mode', choices=['thread', 'process', 'inline'],
+                        default=AGENT_EXECUTION_MODE,
+                        help='Agent execution backend (default: %(default)s; inline is fastest '
+                             'but has no timeout, trusted agents only)')
+    parser.add_argument('--output', help='Write the final estimates to this JSON file')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.ERROR,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+    teams = load_teams_from_directory(args.teams_dir)
+    if len(teams) < 2:
+        print(f"Error: Need at least 2 teams, found {len(teams)}")
+        sys.exit(1)
+
+    base_seed = args.seed if args.seed is not None else new_base_seed()
+
+    print(f"{'='*80}")
+    print("AGT COMPETITION MONTE-CARLO ESTIMATOR")
+    print(f"{'='*80}")
+    print(f"Teams: {len(teams)}")
+    print(f"Replicas: up to {args.replicas} (workers: {args.workers}, mode: {args.execution_mode})")
+    print(f"Base Seed: {base_seed}")
+    print(f"{'='*80}")
+
+    try:
+        estimates = run_estimation(
+            teams, args.replicas, base_seed, args.timeout, args.execution_mode, max(1, args.workers),
+            args.ci_width, args.min_replicas, max(1, args.report_every), args.confidence,
+            args.bootstrap_samples
+        )
+    except KeyboardInterrupt:
+        print("\n\nEstimation interrupted by user")
+        sys.exit(0)
+
+    if args.output and estimates:
+        save_json({'base_seed': base_seed, 'confidence': args.confidence, 'teams': estimates},
+                  os.path.abspath(args.output))
+        print(f"\nEstimates written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
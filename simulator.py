@@ -8,6 +8,7 @@ This simulator allows students to test their agents before submission.
 import argparse
 import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import random
@@ -17,7 +18,8 @@ from src.auction_engine import AuctionEngine
 from src.agent_manager import AgentManager
 from src.game_manager import GameManager
 from src.utils import Team, format_utility
-from src.config import BID_TIMEOUT_SECONDS
+from src.config import BID_TIMEOUT_SECONDS, AGENT_EXECUTION_MODE
+from src.random_streams import GameRandomStreams, new_base_seed
 
 
 def setup_logging(verbose: bool = False):
@@ -30,16 +32,57 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def summarize_game(game_result) -> dict:
+    """
+    Compact per-team summary of a game, cheap to send between processes.
+    
+    Returns:
+        Dictionary mapping team_id to (utility, items_won, budget_spent)
+    """
+    return {
+        team_id: (team_result.utility, len(team_result.items_won), team_result.budget_spent)
+        for team_id, team_result in game_result.team_results.items()
+    }
+
+
+# Per-process simulator used by pool workers (set by _init_worker)
+_worker_simulator = None
+_worker_agents = None
+
+
+def _init_worker(base_seed: int, timeout: float, execution_mode: str, headless: bool,
+                 your_agent_path: str, opponents: list):
+    """Process pool initializer: build one Simulator per worker process"""
+    global _worker_simulator, _worker_agents
+    _worker_simulator = Simulator(seed=base_seed, timeout=timeout, execution_mode=execution_mode,
+                                  headless=headless)
+    _worker_agents = (your_agent_path, opponents)
+
+
+def _simulate_game_in_worker(game_num: int):
+    """Process pool task: run one game and return its compact summary"""
+    game_result = _worker_simulator.simulate_game(*_worker_agents, game_num)
+    return summarize_game(game_result) if game_result is not None else None
+
+
 class Simulator:
     """
     Local simulator for testing bidding agents.
     Students can use this to test against example strategies.
     """
     
-    def __init__(self, seed: int = None, timeout: float = BID_TIMEOUT_SECONDS):
+    def __init__(self, seed: int = None, timeout: float = BID_TIMEOUT_SECONDS,
+                 execution_mode: str = AGENT_EXECUTION_MODE, headless: bool = False):
         self.seed = seed
         self.timeout = timeout
+        self.execution_mode = execution_mode
+        # Headless games skip per-round logging (see GameManager)
+        self.headless = headless
         self.valuation_generator = ValuationGenerator(random_seed=seed)
+        # Each game draws from its own streams derived from this seed
+        self.base_seed = seed if seed is not None else new_base_seed()
+        # Shared across games so agent worker processes are reused
+        self.agent_manager = AgentManager(timeout_seconds=timeout, execution_mode=execution_mode)
         
     def load_example_opponents(self) -> list:
         """Load all example agents as opponents"""
@@ -81,8 +124,8 @@ class Simulator:
             team_agents[opp['team_id']] = opp['agent_file']
         
         # Create game manager
-        auction_engine = AuctionEngine()
-        agent_manager = AgentManager(timeout_seconds=self.timeout)
+        random_streams = GameRandomStreams.for_game(self.base_seed, 1, "simulator", game_num)
+        auction_engine = AuctionEngine(rng=random_streams.tie_break)
         
         game_manager = GameManager(
             stage=1,
@@ -90,7 +133,9 @@ class Simulator:
             game_number=game_num,
             valuation_generator=self.valuation_generator,
             auction_engine=auction_engine,
-            agent_manager=agent_manager
+            agent_manager=self.agent_manager,
+            random_streams=random_streams,
+            headless=self.headless
         )
         
         # Run game
@@ -102,7 +147,7 @@ class Simulator:
             return None
     
     def run_simulation(self, your_agent_path: str, opponents: list = None,
-                      num_games: int = 10) -> dict:
+                      num_games: int = 10, workers: int = 1) -> dict:
         """
         Run multiple games and collect statistics.
         
@@ -110,6 +155,7 @@ class Simulator:
             your_agent_path: Path to your agent file
             opponents: List of opponent agents (uses examples if None)
             num_games: Number of games to simulate
+            workers: Number of worker processes to shard games across
         
         Returns:
             Dictionary with aggregate statistics
@@ -128,6 +174,8 @@ class Simulator:
         print(f"Opponents: {', '.join([o['team_id'] for o in opponents])}")
         print(f"Games: {num_games}")
         print(f"Random Seed: {self.seed if self.seed else 'Random'}")
+        if workers > 1:
+            print(f"Workers: {workers}")
         print(f"{'='*80}\n")
         
         # Statistics tracking
@@ -152,52 +200,81 @@ class Simulator:
             }
         
         # Run games
-        for game_num in range(1, num_games + 1):
+        for game_num, game_summary in enumerate(
+                self._iter_game_summaries(your_agent_path, opponents, num_games, workers), 1):
             print(f"\n--- Game {game_num}/{num_games} ---")
             
-            game_result = self.simulate_game(your_agent_path, opponents, game_num)
-            
-            if game_result is None:
+            if game_summary is None:
                 continue
             
-            # Collect statistics
-            results_list = []
-            for team_id, team_result in game_result.team_results.items():
-                results_list.append((team_id, team_result))
-                
-                if team_id in stats:
-                    stats[team_id]['total_utility'] += team_result.utility
-                    stats[team_id]['total_items'] += len(team_result.items_won)
-                    stats[team_id]['total_spent'] += team_result.budget_spent
-                    stats[team_id]['utilities'].append(team_result.utility)
-            
-            # Sort by utility to find winner
-            results_list.sort(key=lambda x: x[1].utility, reverse=True)
-            
-            winner_id = results_list[0][0]
-            if winner_id in stats:
-                stats[winner_id]['games_won'] += 1
-            
-            # Track your agent's rank
-            for rank, (team_id, _) in enumerate(results_list, 1):
-                if team_id == 'your_agent':
-                    stats['your_agent']['ranks'].append(rank)
-                    break
-            
-            # Print game summary
-            print(f"  Winner: {winner_id} (Utility: {results_list[0][1].utility:.2f})")
-            
-            your_result = game_result.team_results.get('your_agent')
-            if your_result:
-                your_rank = next(i for i, (tid, _) in enumerate(results_list, 1) 
-                               if tid == 'your_agent')
-                print(f"  Your Rank: {your_rank}/{len(results_list)} "
-                      f"(Utility: {your_result.utility:.2f}, "
-                      f"Items: {len(your_result.items_won)}, "
-                      f"Spent: {your_result.budget_spent:.2f})")
+            self._record_game(stats, game_summary)
+        
+        self.agent_manager.shutdown()
         
         return stats
     
+    def _iter_game_summaries(self, your_agent_path: str, opponents: list,
+                             num_games: int, workers: int):
+        """
+        Yield the summary of every game in game order (None for failed games).
+        
+        With workers > 1 games are sharded across a process pool; each game still
+        uses the random streams derived from (seed, game_num), so results match a
+        sequential run.
+        """
+        if workers <= 1:
+            for game_num in range(1, num_games + 1):
+                game_result = self.simulate_game(your_agent_path, opponents, game_num)
+                yield summarize_game(game_result) if game_result is not None else None
+            return
+        
+        chunksize = max(1, num_games // (workers * 8))
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.base_seed, self.timeout, self.execution_mode, self.headless,
+                          your_agent_path, opponents)) as executor:
+            yield from executor.map(_simulate_game_in_worker, range(1, num_games + 1),
+                                    chunksize=chunksize)
+    
+    def _record_game(self, stats: dict, game_summary: dict):
+        """Add one game's summary to the statistics and print its result line"""
+        # Collect statistics
+        results_list = []
+        for team_id, (utility, items_won, budget_spent) in game_summary.items():
+            results_list.append((team_id, utility))
+            
+            if team_id in stats:
+                stats[team_id]['total_utility'] += utility
+                stats[team_id]['total_items'] += items_won
+                stats[team_id]['total_spent'] += budget_spent
+                stats[team_id]['utilities'].append(utility)
+        
+        # Sort by utility to find winner
+        results_list.sort(key=lambda x: x[1], reverse=True)
+        
+        winner_id = results_list[0][0]
+        if winner_id in stats:
+            stats[winner_id]['games_won'] += 1
+        
+        # Track your agent's rank
+        for rank, (team_id, _) in enumerate(results_list, 1):
+            if team_id == 'your_agent':
+                stats['your_agent']['ranks'].append(rank)
+                break
+        
+        # Print game summary
+        print(f"  Winner: {winner_id} (Utility: {results_list[0][1]:.2f})")
+        
+        your_result = game_summary.get('your_agent')
+        if your_result:
+            your_rank = next(i for i, (tid, _) in enumerate(results_list, 1) 
+                           if tid == 'your_agent')
+            print(f"  Your Rank: {your_rank}/{len(results_list)} "
+                  f"(Utility: {your_result[0]:.2f}, "
+                  f"Items: {your_result[1]}, "
+                  f"Spent: {your_result[2]:.2f})")
+    
     def print_summary(self, stats: dict, num_games: int):
         """Print summary statistics"""
         print(f"\n\n{'='*80}")
@@ -310,6 +387,20 @@ def main():
         help='Timeout for bid execution (seconds)'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes to run games in parallel (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--execution-mode',
+        choices=['thread', 'process', 'inline'],
+        default=AGENT_EXECUTION_MODE,
+        help='Agent execution backend (default: %(default)s)'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -345,14 +436,17 @@ def main():
             })
     
     # Create simulator
-    simulator = Simulator(seed=args.seed, timeout=args.timeout)
+    # Per-round game logging is only wanted with --verbose
+    simulator = Simulator(seed=args.seed, timeout=args.timeout, execution_mode=args.execution_mode,
+                          headless=not args.verbose)
     
     # Run simulation
     try:
         stats = simulator.run_simulation(
             your_agent_path=str(your_agent_path.absolute()),
             opponents=opponents,
-            num_games=args.num_games
+            num_games=args.num_games,
+            workers=args.workers
         )
         
         if stats:
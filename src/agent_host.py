@@ -0,0 +1,67 @@
+"""
+Agent Host for AGT Competition
+Subprocess entry point serving one team's agent over a line protocol on stdin/stdout
+"""
+
+import json
+import os
+import sys
+from typing import Optional
+
+from src.utils import json_default
+
+
+class LineConnection:
+    """
+    Pipe-like connection over text streams, one JSON message per line.
+
+    Offers the recv()/send()/close() subset of multiprocessing connections used
+    by the agent worker loop, so the same loop serves agents over a subprocess's
+    stdin and stdout. Tuples are sent as JSON arrays and come back as lists.
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+
+    def recv(self):
+        line = self._reader.readline()
+        if not line:
+            raise EOFError("Connection closed")
+        return tuple(json.loads(line))
+
+    def send(self, message):
+        self._writer.write(json.dumps(message, default=json_default) + "\n")
+        self._writer.flush()
+
+    def close(self):
+        self._writer.close()
+
+
+def main(argv: Optional[list] = None):
+    """
+    Serve one agent: python -m src.agent_host <file_path> <team_id> [memory_limit_mb] [cpu_limit_seconds]
+    (limits as JSON numbers, or null for unlimited)
+
+    Requests and answers are the agent worker's (see agent_worker._worker_main).
+    Anything the agent prints goes to stderr, so it cannot corrupt the protocol.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    file_path, team_id = args[0], args[1]
+    limits = [json.loads(value) for value in args[2:4]]
+    memory_limit_mb, cpu_limit_seconds = limits + [None] * (2 - len(limits))
+
+    # Keep the real stdout for the protocol and point fd 1 at stderr
+    protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    # Imported after the redirect, so nothing printed on import reaches the protocol stream
+    from src.agent_worker import _worker_main
+
+    _worker_main(LineConnection(sys.stdin, protocol_out), file_path, team_id,
+                 memory_limit_mb, cpu_limit_seconds)
+
+
+if __name__ == '__main__':
+    main()
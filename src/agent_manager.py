@@ -4,18 +4,26 @@ Loads, validates, and executes team-submitted bidding agents
 """
 
 import importlib.util
+import hashlib
 import sys
 import os
 import time
 import signal
 import logging
-from typing import Dict, Optional, Any
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Dict, Iterator, Optional, Any, Tuple
 from pathlib import Path
 import multiprocessing as mp
+from multiprocessing.connection import wait as wait_for_connections
 from threading import Thread
 import queue
 
 from examples.truthful_bidder import BiddingAgent
+from src.agent_worker import AgentWorker, AgentWorkerError, AgentLimitExceeded, RemoteAgent
+from src.config import (AGENT_EXECUTION_MODE, MEMORY_LIMIT_MB, CPU_TIME_LIMIT_SECONDS,
+                        UPDATE_TIMEOUT_SECONDS, UPDATE_TIMEOUT_POLICY)
+from src.profiling import LatencyProfiler, timed_call
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +34,102 @@ class TimeoutException(Exception):
     pass
 
 
+@dataclass
+class _CachedAgentModule:
+    """An imported agent module together with the file state it was built from"""
+    mtime_ns: int
+    size: int
+    content_hash: str
+    module: ModuleType
+
+
+class AgentModuleCache:
+    """
+    Process-wide cache of imported agent modules.
+    
+    Each agent file is compiled and executed once per process; later games only
+    instantiate its BiddingAgent class. Entries are keyed on the absolute path and
+    validated against the file's mtime/size and SHA-256 content hash, so an edited
+    file is re-imported while a merely touched file is not.
+    
+    Note that module-level state of an agent is therefore shared between games
+    played in the same process, exactly as with a regular import.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, _CachedAgentModule] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def get_module(self, file_path: str, module_name: str) -> ModuleType:
+        """
+        Return the imported module for an agent file, importing it if needed.
+        
+        Args:
+            file_path: Path to the agent Python file
+            module_name: Name to register in sys.modules on a fresh import
+        
+        Returns:
+            The executed module
+        
+        Raises:
+            ImportError: If no module spec can be created for the file
+            Exception: Anything raised while executing the module
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        entry = self._entries.get(path)
+        
+        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            self.hits += 1
+            return entry.module
+        
+        with open(path, 'rb') as f:
+            source = f.read()
+        content_hash = hashlib.sha256(source).hexdigest()
+        
+        if entry is not None:
+            if entry.content_hash == content_hash:
+                # Touched but unchanged
+                entry.mtime_ns, entry.size = stat.st_mtime_ns, stat.st_size
+                self.hits += 1
+                return entry.module
+            self.invalidations += 1
+            logger.info(f"Agent file changed, re-importing: {path}")
+        
+        self.misses += 1
+        
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Failed to load module spec from {path}")
+        
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        exec(compile(source, path, 'exec'), module.__dict__)
+        
+        self._entries[path] = _CachedAgentModule(stat.st_mtime_ns, stat.st_size, content_hash, module)
+        return module
+    
+    def stats(self) -> Dict[str, int]:
+        """Cache counters for profiling"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'cached_modules': len(self._entries)
+        }
+    
+    def clear(self):
+        """Drop all cached modules and reset counters"""
+        self._entries.clear()
+        self.hits = self.misses = self.invalidations = 0
+
+
+# Shared by all AgentManagers in this process
+agent_module_cache = AgentModuleCache()
+
+
 class AgentManager:
     """
     Manages loading, validation, and execution of team bidding agents.
@@ -35,17 +139,64 @@ class AgentManager:
     - Validate agent interface compliance
     - Execute bids with timeout enforcement
     - Handle errors gracefully
+    
+    Execution modes:
+    - "thread": each bid runs in a new daemon thread (a timed-out thread keeps running)
+    - "process": each agent lives in a long-lived worker process that is reused
+      across games; on timeout the worker is killed and replaced, and the agent is
+      restored by replaying the rounds it had already seen. Workers run under
+      memory and CPU time limits; an agent that exceeds one is disqualified and
+      bids 0 for the rest of this manager's games
+    - "inline": direct calls in the caller's thread, no timeout enforcement
+    
+    Update timeout policies (an update that overruns is always abandoned):
+    - "skip": the agent simply misses that round's results
+    - "penalize": the agent also forfeits its next bid in the same game
+    - "disqualify": the agent bids 0 for the rest of this manager's games
     """
     
-    def __init__(self, timeout_seconds: float = 2.0):
+    EXECUTION_MODES = ("thread", "process", "inline")
+    UPDATE_TIMEOUT_POLICIES = ("skip", "penalize", "disqualify")
+    
+    def __init__(self, timeout_seconds: float = 2.0, execution_mode: str = AGENT_EXECUTION_MODE,
+                 module_cache: AgentModuleCache = None,
+                 memory_limit_mb: Optional[float] = MEMORY_LIMIT_MB,
+                 cpu_limit_seconds: Optional[float] = CPU_TIME_LIMIT_SECONDS,
+                 update_timeout_seconds: float = UPDATE_TIMEOUT_SECONDS,
+                 update_timeout_policy: str = UPDATE_TIMEOUT_POLICY):
         """
         Initialize agent manager.
         
         Args:
             timeout_seconds: Maximum time allowed for bid execution
+            execution_mode: One of EXECUTION_MODES
+            module_cache: Agent module cache (defaults to the process-wide cache)
+            memory_limit_mb: Memory available to each agent, process mode only (None = unlimited)
+            cpu_limit_seconds: CPU time per agent per game, process mode only (None = unlimited)
+            update_timeout_seconds: Maximum time allowed for update_after_each_round
+            update_timeout_policy: One of UPDATE_TIMEOUT_POLICIES
         """
+        if execution_mode not in self.EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
+        if update_timeout_policy not in self.UPDATE_TIMEOUT_POLICIES:
+            raise ValueError(f"Unknown update timeout policy: {update_timeout_policy}")
+        
         self.timeout_seconds = timeout_seconds
+        self.execution_mode = execution_mode
+        self.module_cache = module_cache if module_cache is not None else agent_module_cache
         self.loaded_agents = {}
+        self.memory_limit_mb = memory_limit_mb
+        self.cpu_limit_seconds = cpu_limit_seconds
+        self.update_timeout_seconds = update_timeout_seconds
+        self.update_timeout_policy = update_timeout_policy
+        self._workers: Dict[str, AgentWorker] = {}
+        # team_id -> reason, for agents that exceeded a resource limit
+        self.disqualified: Dict[str, str] = {}
+        # Agents whose next bid is forfeited after an update timeout ("penalize" policy),
+        # keyed by id() of the agent, which is loaded anew for every game and team
+        self.penalized: Dict[int, BiddingAgent] = {}
+        # Latency histograms of every bid and update call, per team
+        self.profiler = LatencyProfiler()
     
     def load_agent(self, file_path: str, team_id: str, 
                    valuation_vector: Dict[str, float],
@@ -64,6 +215,9 @@ class AgentManager:
         Returns:
             Instantiated BiddingAgent or None if loading failed
         """
+        # A penalty for the previous game's last round does not carry over
+        self.penalized = {key: agent for key, agent in self.penalized.items() if agent.team_id != team_id}
+        
         try:
             logger.info(f"Loading agent for team {team_id} from {file_path}")
             
@@ -72,15 +226,12 @@ class AgentManager:
                 logger.error(f"Agent file not found: {file_path}")
                 return None
             
-            # Load module from file
-            spec = importlib.util.spec_from_file_location(f"agent_{team_id}", file_path)
-            if spec is None or spec.loader is None:
-                logger.error(f"Failed to load module spec from {file_path}")
-                return None
+            if self.execution_mode == "process":
+                return self._load_remote_agent(file_path, team_id, valuation_vector,
+                                               budget, opponent_teams)
             
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[f"agent_{team_id}"] = module
-            spec.loader.exec_module(module)
+            # Load module from file (imported once per process, then cached)
+            module = self.module_cache.get_module(file_path, f"agent_{team_id}")
             
             # Find BiddingAgent class in module
             if not hasattr(module, 'BiddingAgent'):
@@ -104,6 +255,85 @@ class AgentManager:
             logger.error(f"Error loading agent for team {team_id}: {e}", exc_info=True)
             return None
     
+    def _load_remote_agent(self, file_path: str, team_id: str,
+                           valuation_vector: Dict[str, float],
+                           budget: float,
+                           opponent_teams: list) -> Optional[RemoteAgent]:
+        """
+        Instantiate a team's agent inside its worker process, starting the worker
+        if the team has none yet.
+        
+        Returns:
+            RemoteAgent proxy or None if loading failed (a disqualified team gets
+            an unavailable proxy without a worker, so its games still run)
+        """
+        if team_id in self.disqualified:
+            agent = RemoteAgent(None, team_id, valuation_vector, budget, opponent_teams)
+            agent.available = False
+            agent.disqualification = self.disqualified[team_id]
+            logger.info(f"Team {team_id} is disqualified ({agent.disqualification}), it will not bid")
+            return agent
+        
+        worker = self._workers.get(team_id)
+        if worker is None or worker.file_path != file_path or not worker.is_alive():
+            if worker is not None:
+                worker.close()
+            worker = AgentWorker(file_path, team_id, self.memory_limit_mb, self.cpu_limit_seconds)
+            self._workers[team_id] = worker
+        
+        agent = RemoteAgent(worker, team_id, valuation_vector, budget, opponent_teams)
+        try:
+            agent.initialize()
+        except AgentLimitExceeded as e:
+            self._disqualify(agent, str(e))
+            return agent
+        except AgentWorkerError as e:
+            logger.error(f"Error loading agent for team {team_id}: {e}")
+            return None
+        
+        logger.info(f"Successfully loaded agent for team {team_id} in worker process")
+        return agent
+    
+    def _disqualify(self, agent: BiddingAgent, reason: str):
+        """Stop a team's agent for good after it exceeded a limit"""
+        logger.error(f"Team {agent.team_id} disqualified: {reason}")
+        self.disqualified[agent.team_id] = reason
+        if isinstance(agent, RemoteAgent):
+            agent.available = False
+            agent.disqualification = reason
+        
+        worker = self._workers.pop(agent.team_id, None)
+        if worker is not None:
+            worker.kill()
+    
+    def get_resource_usage(self, agent: BiddingAgent) -> Optional[Dict[str, float]]:
+        """
+        CPU time and memory peak of an agent in the current game.
+        
+        Returns:
+            Dict with cpu_time_seconds and memory_peak_mb, or None if the agent is
+            not running in a worker process
+        """
+        if not isinstance(agent, RemoteAgent) or not agent.available:
+            return None
+        
+        try:
+            answer = agent.worker.call("usage", timeout=self.timeout_seconds)
+        except AgentWorkerError as e:
+            logger.warning(f"Team {agent.team_id}: could not read resource usage: {e}")
+            return None
+        
+        if answer is None or answer[0] != "success":
+            return None
+        return answer[1]
+    
+    def shutdown(self):
+        """Stop all agent worker processes (no-op for thread and inline modes)"""
+        logger.debug(f"Agent module cache: {self.module_cache.stats()}")
+        for worker in self._workers.values():
+            worker.close()
+        self._workers.clear()
+    
     def validate_agent(self, agent: Any) -> bool:
         """
         Validate that agent implements required interface.
@@ -131,21 +361,38 @@ class AgentManager:
         
         return True
     
-    def _execute_bid_in_thread(self, agent: BiddingAgent, item_id: str, 
-                               result_queue: queue.Queue):
+    def _execute_in_thread(self, func, args: tuple, result_queue: queue.Queue):
         """
-        Execute bid in a separate thread.
+        Execute an agent call in a separate thread.
         
         Args:
-            agent: The bidding agent
-            item_id: Item to bid on
-            result_queue: Queue to put result in
+            func: Bound agent method (bidding_function or update_after_each_round)
+            args: Arguments for func
+            result_queue: Queue to put (status, result, timing, finish_time) in
         """
         try:
-            bid = agent.bidding_function(item_id)
-            result_queue.put(('success', bid))
+            result, timing = timed_call(func, *args)
+            result_queue.put(('success', result, timing, time.perf_counter()))
         except Exception as e:
-            result_queue.put(('error', str(e)))
+            result_queue.put(('error', str(e), None, time.perf_counter()))
+    
+    def _finalize_bid(self, agent: BiddingAgent, status: str, result: Any,
+                      execution_time: float) -> tuple:
+        """
+        Turn a raw (status, result) pair from the agent into the bid tuple.
+        
+        Returns:
+            Tuple of (bid_amount, execution_time, error_msg)
+        """
+        if status == 'success':
+            # Round bid to 2 decimal places
+            rounded_bid = round(float(result), 2)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Team {agent.team_id}: Bid {rounded_bid:.2f} in {execution_time:.3f}s")
+            return rounded_bid, execution_time, None
+        
+        logger.error(f"Team {agent.team_id}: Bid execution error: {result}")
+        return 0.0, execution_time, f"Error: {result}"
     
     def execute_bid_with_timeout(self, agent: BiddingAgent, item_id: str) -> tuple:
         """
@@ -161,45 +408,233 @@ class AgentManager:
             - On timeout: (0.0, timeout_seconds, "Timeout")
             - On error: (0.0, time, error_message)
         """
-        start_time = time.time()
+        unavailable = self._unavailable_bid(agent)
+        if unavailable is not None:
+            return unavailable
+        
+        if isinstance(agent, RemoteAgent):
+            return self._execute_remote_bid(agent, item_id)
+        
+        start_time = time.perf_counter()
         
         try:
+            if self.execution_mode == "inline":
+                try:
+                    result, timing = timed_call(agent.bidding_function, item_id)
+                    status = 'success'
+                    self.profiler.record(agent.team_id, "bid", timing)
+                except Exception as e:
+                    status, result = 'error', str(e)
+                return self._finalize_bid(agent, status, result, time.perf_counter() - start_time)
+            
             # Use threading for timeout (simpler than multiprocessing for this use case)
-            result_queue = queue.Queue()
-            thread = Thread(target=self._execute_bid_in_thread, 
-                          args=(agent, item_id, result_queue))
-            thread.daemon = True
-            thread.start()
+            thread, result_queue = self._start_thread(agent.bidding_function, item_id)
             
             # Wait for result with timeout
             thread.join(timeout=self.timeout_seconds)
-            execution_time = time.time() - start_time
-            
-            if thread.is_alive():
-                # Timeout occurred
-                logger.warning(f"Team {agent.team_id}: Bid execution timeout ({self.timeout_seconds}s)")
-                return 0.0, self.timeout_seconds, "Timeout"
-            
-            # Get result from queue
-            try:
-                status, result = result_queue.get_nowait()
-                if status == 'success':
-                    # Round bid to 2 decimal places
-                    rounded_bid = round(float(result), 2)
-                    logger.debug(f"Team {agent.team_id}: Bid {rounded_bid:.2f} in {execution_time:.3f}s")
-                    return rounded_bid, execution_time, None
-                else:
-                    logger.error(f"Team {agent.team_id}: Bid execution error: {result}")
-                    return 0.0, execution_time, f"Error: {result}"
-            except queue.Empty:
-                logger.error(f"Team {agent.team_id}: No result in queue")
-                return 0.0, execution_time, "No result returned"
+            return self._thread_bid_result(agent, thread, result_queue, start_time)
                 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             logger.error(f"Team {agent.team_id}: Unexpected error in bid execution: {e}", exc_info=True)
             return 0.0, execution_time, f"Exception: {str(e)}"
     
+    def collect_bids(self, agents: Dict[str, BiddingAgent], item_id: str) -> Dict[str, tuple]:
+        """
+        Collect one round's sealed bids from all agents concurrently.
+        
+        Bids are independent, so every agent's bidding_function is started before
+        any answer is awaited, and all share a single deadline timeout_seconds
+        after dispatch: a round takes as long as its slowest agent, not the sum.
+        In process mode each agent runs in its own worker process, so CPU-heavy
+        agents bid in parallel; in thread mode they still share the GIL. Inline
+        mode collects bids one after the other.
+        
+        Args:
+            agents: Dictionary mapping team_id to agent
+            item_id: ID of item being auctioned
+        
+        Returns:
+            Dictionary mapping team_id to (bid_amount, execution_time, error_msg),
+            in the order of agents (see execute_bid_with_timeout)
+        """
+        if self.execution_mode == "inline" or len(agents) <= 1:
+            return {team_id: self.execute_bid_with_timeout(agent, item_id)
+                    for team_id, agent in agents.items()}
+        
+        results = {}
+        remote_pending = {}  # worker connection -> (team_id, agent, request_id)
+        threads = {}         # team_id -> (agent, thread, result_queue)
+        
+        start_time = time.perf_counter()
+        deadline = start_time + self.timeout_seconds
+        
+        # Dispatch every bid before waiting for any
+        for team_id, agent in agents.items():
+            unavailable = self._unavailable_bid(agent)
+            if unavailable is not None:
+                results[team_id] = unavailable
+            elif isinstance(agent, RemoteAgent):
+                try:
+                    request_id = agent.worker.send("bid", item_id)
+                except AgentWorkerError as e:
+                    results[team_id] = self._remote_bid_failed(agent, e, 0.0)
+                    continue
+                remote_pending[agent.worker.connection] = (team_id, agent, request_id)
+            else:
+                thread, result_queue = self._start_thread(agent.bidding_function, item_id)
+                threads[team_id] = (agent, thread, result_queue)
+        
+        for team_id, agent, answer, error in self._await_workers(remote_pending, deadline):
+            execution_time = time.perf_counter() - start_time
+            if error is not None:
+                results[team_id] = self._remote_bid_failed(agent, error, execution_time)
+            else:
+                results[team_id] = self._remote_bid_result(agent, answer, execution_time)
+        
+        for team_id, agent, _ in remote_pending.values():
+            results[team_id] = self._remote_bid_result(agent, None, time.perf_counter() - start_time)
+        
+        for team_id, (agent, thread, result_queue) in threads.items():
+            thread.join(timeout=max(0.0, deadline - time.perf_counter()))
+            results[team_id] = self._thread_bid_result(agent, thread, result_queue, start_time)
+        
+        return {team_id: results[team_id] for team_id in agents}
+    
+    def _await_workers(self, pending: Dict[Any, tuple], deadline: float) -> Iterator[tuple]:
+        """
+        Wait for the answers to requests sent to several workers at once.
+        
+        Args:
+            pending: Worker connection -> (team_id, agent, request_id); answered
+                requests are removed, so what is left at the end timed out
+            deadline: time.perf_counter() value after which to stop waiting
+        
+        Yields:
+            (team_id, agent, answer, error) as each answer arrives, where error is
+            the AgentWorkerError raised by a dead worker (answer is then None)
+        """
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return
+            for connection in wait_for_connections(list(pending), timeout=remaining):
+                team_id, agent, request_id = pending[connection]
+                try:
+                    answer = agent.worker.receive(request_id, timeout=0)
+                except AgentWorkerError as e:
+                    del pending[connection]
+                    yield team_id, agent, None, e
+                    continue
+                if answer is not None:  # None: only a stale answer was waiting
+                    del pending[connection]
+                    yield team_id, agent, answer, None
+    
+    def _start_thread(self, func, *args) -> Tuple[Thread, queue.Queue]:
+        """Start a daemon thread running an agent call"""
+        result_queue = queue.Queue()
+        thread = Thread(target=self._execute_in_thread, 
+                        args=(func, args, result_queue))
+        thread.daemon = True
+        thread.start()
+        return thread, result_queue
+    
+    def _thread_bid_result(self, agent: BiddingAgent, thread: Thread, result_queue: queue.Queue,
+                           start_time: float) -> tuple:
+        """Turn a joined (or abandoned) bid thread, started at start_time, into the bid tuple"""
+        execution_time = time.perf_counter() - start_time
+        if thread.is_alive():
+            # Timeout occurred
+            logger.warning(f"Team {agent.team_id}: Bid execution timeout ({self.timeout_seconds}s)")
+            self.profiler.record_timeout(agent.team_id, "bid", int(execution_time * 1e9))
+            return 0.0, self.timeout_seconds, "Timeout"
+        
+        # Get result from queue
+        try:
+            status, result, timing, finish_time = result_queue.get_nowait()
+        except queue.Empty:
+            logger.error(f"Team {agent.team_id}: No result in queue")
+            return 0.0, execution_time, "No result returned"
+        
+        # Threads are joined in turn, so time the bid to when it finished
+        execution_time = finish_time - start_time
+        
+        self.profiler.record(agent.team_id, "bid", timing)
+        try:
+            return self._finalize_bid(agent, status, result, execution_time)
+        except Exception as e:
+            logger.error(f"Team {agent.team_id}: Invalid bid returned: {e}")
+            return 0.0, execution_time, f"Exception: {str(e)}"
+    
+    def _replacement_timeout(self, agent: RemoteAgent) -> float:
+        """Time allowed for a replacement worker to re-create and replay an agent"""
+        return self.timeout_seconds + self.update_timeout_seconds * len(agent.history)
+    
+    def _replace_worker(self, agent: RemoteAgent):
+        """Replace a failed worker, disqualifying the agent if the replay hits a limit"""
+        agent.replace_worker(self._replacement_timeout(agent))
+        if agent.disqualification:
+            self._disqualify(agent, agent.disqualification)
+    
+    def _unavailable_bid(self, agent: BiddingAgent) -> Optional[tuple]:
+        """Bid tuple for an agent that cannot bid this round, or None if it can"""
+        if agent.team_id in self.disqualified:
+            return 0.0, 0.0, f"Disqualified: {self.disqualified[agent.team_id]}"
+        if isinstance(agent, RemoteAgent) and not agent.available:
+            return 0.0, 0.0, "Agent unavailable"
+        if self.penalized.pop(id(agent), None) is not None:
+            return 0.0, 0.0, "Penalized: update timeout"
+        return None
+    
+    def _execute_remote_bid(self, agent: RemoteAgent, item_id: str) -> tuple:
+        """
+        Execute a bid in the agent's worker process.
+        
+        A worker that times out or dies is killed and replaced, so the agent
+        cannot keep running (and mutating its state) past the deadline.
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            answer = agent.worker.call("bid", item_id, timeout=self.timeout_seconds)
+        except AgentWorkerError as e:
+            return self._remote_bid_failed(agent, e, time.perf_counter() - start_time)
+        
+        return self._remote_bid_result(agent, answer, time.perf_counter() - start_time)
+    
+    def _remote_bid_failed(self, agent: RemoteAgent, error: AgentWorkerError,
+                           execution_time: float) -> tuple:
+        """Handle a worker that died or hit a resource limit while bidding"""
+        if isinstance(error, AgentLimitExceeded):
+            self._disqualify(agent, str(error))
+            return 0.0, execution_time, f"Disqualified: {error}"
+        
+        logger.error(f"Team {agent.team_id}: Agent worker failed: {error}")
+        self._replace_worker(agent)
+        return 0.0, execution_time, f"Exception: {str(error)}"
+    
+    def _remote_bid_result(self, agent: RemoteAgent, answer: Optional[tuple],
+                           execution_time: float) -> tuple:
+        """Turn a worker's answer to a bid (None on timeout) into the bid tuple"""
+        if answer is None:
+            logger.warning(f"Team {agent.team_id}: Bid execution timeout ({self.timeout_seconds}s), "
+                           f"replacing worker")
+            self.profiler.record_timeout(agent.team_id, "bid", int(execution_time * 1e9))
+            self._replace_worker(agent)
+            return 0.0, self.timeout_seconds, "Timeout"
+        
+        self.profiler.record(agent.team_id, "bid", answer[2])
+        
+        if answer[0] == "limit":
+            self._disqualify(agent, answer[1])
+            return 0.0, execution_time, f"Disqualified: {answer[1]}"
+        
+        try:
+            return self._finalize_bid(agent, answer[0], answer[1], execution_time)
+        except Exception as e:
+            logger.error(f"Team {agent.team_id}: Invalid bid returned: {e}")
+            return 0.0, execution_time, f"Exception: {str(e)}"
+    
     def update_agent_after_round(self, agent: BiddingAgent, item_id: str, 
                                 winning_team: str, price_paid: float) -> bool:
         """
@@ -214,9 +649,115 @@ class AgentManager:
         Returns:
             True if update successful, False otherwise
         """
-        try:
-            agent.update_after_each_round(item_id, winning_team, price_paid)
-            return True
-        except Exception as e:
-            logger.error(f"Team {agent.team_id}: Error in update_after_each_round: {e}", exc_info=True)
+        return self.update_agents_after_round({agent.team_id: agent}, item_id,
+                                              winning_team, price_paid)[agent.team_id]
+    
+    def update_agents_after_round(self, agents: Dict[str, BiddingAgent], item_id: str,
+                                  winning_team: str, price_paid: float) -> Dict[str, bool]:
+        """
+        Update all agents with round results concurrently, under one deadline.
+        
+        Every agent's update_after_each_round is started before any is awaited,
+        and all must finish within update_timeout_seconds of dispatch. An agent
+        that overruns is handled by update_timeout_policy (see UPDATE_TIMEOUT_POLICIES).
+        In process mode its worker is killed and replaced without the abandoned
+        update, unless the agent is disqualified; in thread mode the update thread
+        keeps running. Inline mode updates one agent after the other, without
+        a deadline.
+        
+        Args:
+            agents: Dictionary mapping team_id to agent
+            item_id: Item that was auctioned
+            winning_team: ID of winning team
+            price_paid: Price paid by winner
+        
+        Returns:
+            Dictionary mapping team_id to True if its update succeeded
+        """
+        args = (item_id, winning_team, price_paid)
+        results = {}
+        remote_pending = {}  # worker connection -> (team_id, agent, request_id)
+        threads = {}         # team_id -> (agent, thread, result_queue)
+        
+        start_time = time.perf_counter()
+        deadline = start_time + self.update_timeout_seconds
+        
+        for team_id, agent in agents.items():
+            if team_id in self.disqualified or (isinstance(agent, RemoteAgent) and not agent.available):
+                results[team_id] = False
+            elif isinstance(agent, RemoteAgent):
+                try:
+                    request_id = agent.worker.send("update", *args)
+                except AgentWorkerError as e:
+                    results[team_id] = self._remote_update_failed(agent, e)
+                    continue
+                remote_pending[agent.worker.connection] = (team_id, agent, request_id)
+            elif self.execution_mode == "inline":
+                try:
+                    _, timing = timed_call(agent.update_after_each_round, *args)
+                    self.profiler.record(team_id, "update", timing)
+                    results[team_id] = True
+                except Exception as e:
+                    logger.error(f"Team {team_id}: Error in update_after_each_round: {e}", exc_info=True)
+                    results[team_id] = False
+            else:
+                thread, result_queue = self._start_thread(agent.update_after_each_round, *args)
+                threads[team_id] = (agent, thread, result_queue)
+        
+        for team_id, agent, answer, error in self._await_workers(remote_pending, deadline):
+            if error is not None:
+                results[team_id] = self._remote_update_failed(agent, error)
+                continue
+            
+            self.profiler.record(team_id, "update", answer[2])
+            try:
+                agent.record_update(*args, answer)
+                results[team_id] = True
+            except AgentLimitExceeded as e:
+                self._disqualify(agent, str(e))
+                results[team_id] = False
+            except AgentWorkerError as e:
+                logger.error(f"Team {team_id}: Error in update_after_each_round: {e}")
+                results[team_id] = False
+        
+        for team_id, agent, _ in remote_pending.values():
+            results[team_id] = self._update_timed_out(agent, time.perf_counter() - start_time)
+        
+        for team_id, (agent, thread, result_queue) in threads.items():
+            thread.join(timeout=max(0.0, deadline - time.perf_counter()))
+            if thread.is_alive():
+                results[team_id] = self._update_timed_out(agent, time.perf_counter() - start_time)
+                continue
+            
+            status, result, timing, _ = result_queue.get_nowait()
+            self.profiler.record(team_id, "update", timing)
+            if status != 'success':
+                logger.error(f"Team {team_id}: Error in update_after_each_round: {result}")
+            results[team_id] = status == 'success'
+        
+        return {team_id: results[team_id] for team_id in agents}
+    
+    def _remote_update_failed(self, agent: RemoteAgent, error: AgentWorkerError) -> bool:
+        """Handle a worker that died or hit a resource limit while updating"""
+        if isinstance(error, AgentLimitExceeded):
+            self._disqualify(agent, str(error))
+        else:
+            logger.error(f"Team {agent.team_id}: Agent worker failed during update: {error}")
+            self._replace_worker(agent)
+        return False
+    
+    def _update_timed_out(self, agent: BiddingAgent, elapsed: float) -> bool:
+        """Apply update_timeout_policy to an agent whose update overran the deadline"""
+        logger.warning(f"Team {agent.team_id}: Update timeout ({self.update_timeout_seconds}s), "
+                       f"policy '{self.update_timeout_policy}'")
+        self.profiler.record_timeout(agent.team_id, "update", int(elapsed * 1e9))
+        
+        if self.update_timeout_policy == "disqualify":
+            self._disqualify(agent, f"Update timeout ({self.update_timeout_seconds}s)")
             return False
+        
+        if isinstance(agent, RemoteAgent):
+            self._replace_worker(agent)
+        if self.update_timeout_policy == "penalize":
+            self.penalized[id(agent)] = agent
+        return False
@@ -0,0 +1,392 @@
+"""
+Agent Worker for AGT Competition
+Runs a team's bidding agent inside a long-lived worker process
+"""
+
+import itertools
+import logging
+import math
+import multiprocessing as mp
+import os
+import signal
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.profiling import timed_call
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: limits are not enforced there
+    resource = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class AgentWorkerError(Exception):
+    """Raised when an agent worker process dies or cannot serve a request"""
+    pass
+
+
+class AgentLimitExceeded(AgentWorkerError):
+    """Raised when an agent exceeds its memory or CPU time limit"""
+    pass
+
+
+def _address_space_bytes() -> Optional[int]:
+    """Current virtual address space of this process (Linux only)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _reset_memory_peak():
+    """Reset the peak resident memory counter (Linux only; elsewhere the peak covers the process lifetime)"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _memory_peak_mb() -> Optional[float]:
+    """Peak resident memory of this process since the last _reset_memory_peak()"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _apply_memory_limit(memory_limit_mb: Optional[float]):
+    """
+    Cap the worker's address space at its current size plus memory_limit_mb,
+    so the agent itself gets memory_limit_mb whatever the interpreter and
+    libraries inherited from the parent already map. Allocations beyond the cap
+    raise MemoryError inside the agent.
+    """
+    if resource is None:
+        return
+    # A crash on a resource limit should not leave core dumps behind
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+    if not memory_limit_mb:
+        return
+    baseline = _address_space_bytes()
+    if baseline is None:
+        logger.warning("Cannot measure the worker's address space, memory limit not enforced")
+        return
+    limit = baseline + int(memory_limit_mb * 1024 * 1024)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _apply_cpu_limit(cpu_limit_seconds: Optional[float]):
+    """
+    Allow cpu_limit_seconds more CPU time from now. The kernel sends SIGXCPU,
+    which terminates the worker, once the soft limit is reached.
+    """
+    if resource is None or not cpu_limit_seconds:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime + cpu_limit_seconds)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, file_path: str, team_id: str,
+                 memory_limit_mb: Optional[float] = None,
+                 cpu_limit_seconds: Optional[float] = None):
+    """
+    Worker process loop.
+
+    Receives (request_id, command, args) tuples over the pipe and answers each
+    with (request_id, status, result, timing). The agent instance lives here for
+    the whole game, so bids and updates are plain method calls, and timing holds
+    their (wall_ns, thread_cpu_ns) as measured here (None for other commands).
+
+    Each "init" starts a new game: the CPU limit is re-armed for another
+    cpu_limit_seconds, and the CPU time and memory peak reported by "usage" are
+    measured from there. Status "limit" reports an exceeded memory limit.
+    """
+    # Imported here to avoid a circular import at module load time
+    from src.agent_manager import AgentManager
+
+    loader = AgentManager(execution_mode="inline")
+    agent = None
+    cpu_start = time.process_time()
+
+    _apply_memory_limit(memory_limit_mb)
+
+    while True:
+        try:
+            request_id, command, args = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+
+        if command == "close":
+            break
+
+        timing = None
+        try:
+            if command == "init":
+                _apply_cpu_limit(cpu_limit_seconds)
+                _reset_memory_peak()
+                cpu_start = time.process_time()
+                valuation_vector, budget, opponent_teams = args
+                agent = loader.load_agent(file_path, team_id, valuation_vector, budget, opponent_teams)
+                if agent is None:
+                    raise AgentWorkerError(f"Failed to load agent from {file_path}")
+                result = None
+            elif command == "bid":
+                result, timing = timed_call(agent.bidding_function, *args)
+            elif command == "update":
+                result, timing = timed_call(agent.update_after_each_round, *args)
+            elif command == "replay":
+                for update_args in args[0]:
+                    agent.update_after_each_round(*update_args)
+                result = None
+            elif command == "usage":
+                result = {
+                    "cpu_time_seconds": time.process_time() - cpu_start,
+                    "memory_peak_mb": _memory_peak_mb()
+                }
+            else:
+                raise AgentWorkerError(f"Unknown command: {command}")
+            conn.send((request_id, "success", result, timing))
+        except MemoryError:
+            conn.send((request_id, "limit", f"Memory limit exceeded ({memory_limit_mb} MB)", None))
+        except Exception as e:
+            conn.send((request_id, "error", str(e), None))
+
+    conn.close()
+
+
+class AgentWorker:
+    """
+    Parent-side handle of a worker process hosting one team's agent.
+
+    The process is reused across games (each game re-instantiates the agent with
+    an "init" request). Every request carries an id, so a late answer to a request
+    that already timed out is discarded instead of being mistaken for a new one.
+    """
+
+    def __init__(self, file_path: str, team_id: str,
+                 memory_limit_mb: Optional[float] = None,
+                 cpu_limit_seconds: Optional[float] = None):
+        """
+        Start the worker process.
+
+        Args:
+            file_path: Path to the team's agent Python file
+            team_id: Unique team identifier
+            memory_limit_mb: Memory available to the agent (None = unlimited)
+            cpu_limit_seconds: CPU time available to the agent per game (None = unlimited)
+        """
+        self.file_path = file_path
+        self.team_id = team_id
+        self.memory_limit_mb = memory_limit_mb
+        self.cpu_limit_seconds = cpu_limit_seconds
+        self._request_ids = itertools.count(1)
+        self._start()
+
+    def _start(self):
+        """Spawn a fresh worker process and pipe"""
+        ctx = mp.get_context()
+        self._conn, child_conn = ctx.Pipe(duplex=True)
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.file_path, self.team_id,
+                  self.memory_limit_mb, self.cpu_limit_seconds),
+            name=f"agent-worker-{self.team_id}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+    @property
+    def connection(self):
+        """Parent end of the pipe, for waiting on several workers at once"""
+        return self._conn
+
+    def is_alive(self) -> bool:
+        """Check whether the worker process is running"""
+        return self.process.is_alive()
+
+    def send(self, command: str, *args) -> int:
+        """
+        Send a request without waiting for the answer.
+
+        Returns:
+            Request id to pass to receive()
+        """
+        request_id = next(self._request_ids)
+        try:
+            self._conn.send((request_id, command, args))
+        except (BrokenPipeError, EOFError, OSError) as e:
+            raise AgentWorkerError(f"Worker for team {self.team_id} is not reachable: {e}")
+        return request_id
+
+    def receive(self, request_id: int, timeout: Optional[float]) -> Optional[Tuple[str, Any, Any]]:
+        """
+        Wait for the answer to a request.
+
+        Args:
+            request_id: Id returned by send()
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            (status, result, timing) tuple, or None if the timeout expired
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            try:
+                if not self._conn.poll(remaining):
+                    return None
+                answer_id, status, result, timing = self._conn.recv()
+            except (EOFError, OSError) as e:
+                raise self._death_error(e)
+
+            if answer_id == request_id:
+                return status, result, timing
+            # Stale answer from an earlier timed-out request
+
+    def _death_error(self, error: Exception) -> AgentWorkerError:
+        """Explain why the worker process died"""
+        self.process.join(timeout=1.0)
+        sigxcpu = getattr(signal, "SIGXCPU", None)
+        if sigxcpu is not None and self.process.exitcode == -sigxcpu:
+            return AgentLimitExceeded(f"CPU time limit exceeded ({self.cpu_limit_seconds}s per game)")
+        return AgentWorkerError(f"Worker for team {self.team_id} died: {error}")
+
+    def call(self, command: str, *args, timeout: Optional[float] = None) -> Optional[Tuple[str, Any, Any]]:
+        """Send a request and wait for its answer"""
+        return self.receive(self.send(command, *args), timeout)
+
+    def kill(self):
+        """Terminate the worker process immediately"""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1.0)
+        self._conn.close()
+
+    def restart(self):
+        """Kill the current worker process and start a replacement"""
+        self.kill()
+        self._start()
+
+    def close(self):
+        """Ask the worker to exit, killing it if it does not comply"""
+        if self.process.is_alive():
+            try:
+                self._conn.send((0, "close", ()))
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=1.0)
+        self.kill()
+
+
+class RemoteAgent:
+    """
+    Proxy for an agent living in an AgentWorker.
+
+    Exposes the attributes checked by AgentManager.validate_agent and keeps the
+    public round history, so a killed worker can be replaced and brought back to
+    the same state by replaying the updates the agent had already received.
+    """
+
+    def __init__(self, worker: AgentWorker, team_id: str,
+                 valuation_vector: Dict[str, float], budget: float,
+                 opponent_teams: list):
+        self.worker = worker
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.opponent_teams = opponent_teams
+        self.history: List[Tuple[str, str, float]] = []
+        self.available = True
+        self.disqualification: Optional[str] = None
+        # (wall_ns, thread_cpu_ns) of the last bid or update, measured in the worker
+        self.last_timing: Optional[Tuple[int, int]] = None
+
+    def initialize(self, timeout: Optional[float] = None):
+        """
+        Instantiate the agent in the worker and replay the known history.
+
+        Raises:
+            AgentWorkerError: If the worker fails or does not answer in time
+        """
+        answer = self.worker.call("init", self.valuation_vector, self.budget, self.opponent_teams,
+                                  timeout=timeout)
+        self._check_answer("init", answer)
+
+        if self.history:
+            answer = self.worker.call("replay", self.history, timeout=timeout)
+            self._check_answer("replay", answer)
+
+    def _check_answer(self, command: str, answer: Optional[Tuple[str, Any, Any]]):
+        """Raise AgentWorkerError unless the worker answered successfully"""
+        if answer is None:
+            raise AgentWorkerError(f"Team {self.team_id}: '{command}' timed out")
+        status, result, _ = answer
+        if status == "limit":
+            raise AgentLimitExceeded(f"Team {self.team_id}: {result}")
+        if status != "success":
+            raise AgentWorkerError(f"Team {self.team_id}: '{command}' failed: {result}")
+
+    def replace_worker(self, timeout: Optional[float] = None) -> bool:
+        """
+        Kill the worker and restore the agent in a fresh process.
+
+        Returns:
+            True if the replacement is ready, False if the agent is now unavailable
+        """
+        try:
+            self.worker.restart()
+            self.initialize(timeout)
+            return True
+        except AgentWorkerError as e:
+            logger.error(f"Team {self.team_id}: could not replace agent worker: {e}")
+            self.available = False
+            if isinstance(e, AgentLimitExceeded):
+                self.disqualification = str(e)
+            return False
+
+    def bidding_function(self, item_id: str) -> float:
+        answer = self.worker.call("bid", item_id)
+        self.last_timing = answer[2]
+        if answer[0] == "limit":
+            raise AgentLimitExceeded(answer[1])
+        if answer[0] != "success":
+            raise AgentWorkerError(answer[1])
+        return answer[1]
+
+    def update_after_each_round(self, item_id: str, winning_team: str, price_paid: float):
+        answer = self.worker.call("update", item_id, winning_team, price_paid)
+        return self.record_update(item_id, winning_team, price_paid, answer)
+
+    def record_update(self, item_id: str, winning_team: str, price_paid: float,
+                      answer: Tuple[str, Any, Any]):
+        """Account for the worker's answer to an update request sent separately"""
+        self.last_timing = answer[2]
+        # The agent saw this update even if it raised, so it is part of its history
+        self.history.append((item_id, winning_team, price_paid))
+        if answer[0] == "limit":
+            raise AgentLimitExceeded(answer[1])
+        if answer[0] != "success":
+            raise AgentWorkerError(answer[1])
+        return answer[1]
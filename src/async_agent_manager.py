@@ -0,0 +1,453 @@
+"""
+Async Agent Manager for AGT Competition
+Agents as asyncio subprocess endpoints, so many games can share one event loop
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.agent_manager import AgentManager
+from src.agent_worker import AgentLimitExceeded, AgentWorkerError, RemoteAgent
+from src.config import (MEMORY_LIMIT_MB, CPU_TIME_LIMIT_SECONDS,
+                        UPDATE_TIMEOUT_SECONDS, UPDATE_TIMEOUT_POLICY)
+from src.utils import json_default
+
+
+logger = logging.getLogger(__name__)
+
+
+# Directory containing the src package, so agent hosts can import it from any cwd
+_PACKAGE_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+class AsyncAgentWorker:
+    """
+    Event-loop handle of an agent host subprocess (python -m src.agent_host).
+
+    Same requests and answers as AgentWorker, one JSON message per line over the
+    subprocess's stdin and stdout. Waiting for an answer only suspends the
+    calling coroutine, so an idle agent costs the loop nothing.
+    """
+
+    def __init__(self, file_path: str, team_id: str,
+                 memory_limit_mb: Optional[float] = None,
+                 cpu_limit_seconds: Optional[float] = None):
+        """
+        Describe the worker; call start() to launch its process.
+
+        Args:
+            file_path: Path to the team's agent Python file
+            team_id: Unique team identifier
+            memory_limit_mb: Memory available to the agent (None = unlimited)
+            cpu_limit_seconds: CPU time available to the agent per game (None = unlimited)
+        """
+        self.file_path = file_path
+        self.team_id = team_id
+        self.memory_limit_mb = memory_limit_mb
+        self.cpu_limit_seconds = cpu_limit_seconds
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._request_ids = itertools.count(1)
+
+    async def start(self):
+        """Spawn a fresh agent host process"""
+        limits = [json.dumps(limit) for limit in (self.memory_limit_mb, self.cpu_limit_seconds)]
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [_PACKAGE_ROOT, env.get("PYTHONPATH")]))
+        self.process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "src.agent_host", self.file_path, self.team_id, *limits,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=env
+        )
+
+    def is_alive(self) -> bool:
+        """Check whether the host process is running"""
+        return self.process is not None and self.process.returncode is None
+
+    async def send(self, command: str, *args) -> int:
+        """
+        Send a request without waiting for the answer.
+
+        Returns:
+            Request id to pass to receive()
+        """
+        request_id = next(self._request_ids)
+        line = json.dumps((request_id, command, args), default=json_default) + "\n"
+        try:
+            self.process.stdin.write(line.encode("utf-8"))
+            await self.process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError, OSError) as e:
+            raise AgentWorkerError(f"Worker for team {self.team_id} is not reachable: {e}")
+        return request_id
+
+    async def receive(self, request_id: int, timeout: Optional[float]) -> Optional[Tuple[str, Any, Any]]:
+        """
+        Wait for the answer to a request.
+
+        Args:
+            request_id: Id returned by send()
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            (status, result, timing) tuple, or None if the timeout expired
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            try:
+                line = await asyncio.wait_for(self.process.stdout.readline(), remaining)
+            except asyncio.TimeoutError:
+                return None
+            except (ValueError, OSError) as e:  # Oversized or broken line
+                raise AgentWorkerError(f"Worker for team {self.team_id} sent an invalid answer: {e}")
+
+            if not line:
+                raise await self._death_error()
+
+            answer_id, status, result, timing = json.loads(line)
+            if answer_id == request_id:
+                return status, result, tuple(timing) if timing is not None else None
+            # Stale answer from an earlier timed-out request
+
+    async def _death_error(self) -> AgentWorkerError:
+        """Explain why the host process died"""
+        try:
+            returncode = await asyncio.wait_for(self.process.wait(), 1.0)
+        except asyncio.TimeoutError:
+            returncode = None
+        sigxcpu = getattr(signal, "SIGXCPU", None)
+        if sigxcpu is not None and returncode == -sigxcpu:
+            return AgentLimitExceeded(f"CPU time limit exceeded ({self.cpu_limit_seconds}s per game)")
+        return AgentWorkerError(f"Worker for team {self.team_id} died (exit code {returncode})")
+
+    async def call(self, command: str, *args, timeout: Optional[float] = None) -> Optional[Tuple[str, Any, Any]]:
+        """Send a request and wait for its answer"""
+        return await self.receive(await self.send(command, *args), timeout)
+
+    def kill(self):
+        """Terminate the host process immediately (the event loop reaps it)"""
+        if self.is_alive():
+            self.process.kill()
+
+    async def restart(self):
+        """Kill the current host process and start a replacement"""
+        self.kill()
+        if self.process is not None:
+            await self.process.wait()
+        await self.start()
+
+    async def close(self):
+        """Ask the host to exit, killing it if it does not comply"""
+        if self.is_alive():
+            try:
+                await self.send("close")
+                self.process.stdin.close()
+                await asyncio.wait_for(self.process.wait(), 1.0)
+            except (AgentWorkerError, asyncio.TimeoutError):
+                pass
+        self.kill()
+        if self.process is not None:
+            await self.process.wait()
+
+
+class AsyncRemoteAgent(RemoteAgent):
+    """RemoteAgent proxy whose worker is an AsyncAgentWorker; every call is awaited"""
+
+    async def initialize(self, timeout: Optional[float] = None):
+        """
+        Instantiate the agent in the host and replay the known history.
+
+        Raises:
+            AgentWorkerError: If the host fails or does not answer in time
+        """
+        answer = await self.worker.call("init", self.valuation_vector, self.budget, self.opponent_teams,
+                                        timeout=timeout)
+        self._check_answer("init", answer)
+
+        if self.history:
+            answer = await self.worker.call("replay", self.history, timeout=timeout)
+            self._check_answer("replay", answer)
+
+    async def replace_worker(self, timeout: Optional[float] = None) -> bool:
+        """
+        Kill the host and restore the agent in a fresh process.
+
+        Returns:
+            True if the replacement is ready, False if the agent is now unavailable
+        """
+        try:
+            await self.worker.restart()
+            await self.initialize(timeout)
+            return True
+        except AgentWorkerError as e:
+            logger.error(f"Team {self.team_id}: could not replace agent worker: {e}")
+            self.available = False
+            if isinstance(e, AgentLimitExceeded):
+                self.disqualification = str(e)
+            return False
+
+
+class AsyncAgentManager(AgentManager):
+    """
+    Agent manager for the asyncio game driver (see AsyncGameManager).
+
+    Each agent runs in its own host subprocess, as in "process" mode, under the
+    same memory and CPU limits, timeouts, replacement and update timeout
+    policies. Bids and updates are gathered with asyncio.wait_for instead of
+    blocking waits, so one event loop can drive hundreds of interleaved games.
+    A host is bound to one game at a time; when a game ends its hosts are
+    released and reused by the team's next game, so concurrent games of an
+    arena each get their own hosts.
+    """
+
+    def __init__(self, timeout_seconds: float = 2.0,
+                 memory_limit_mb: Optional[float] = MEMORY_LIMIT_MB,
+                 cpu_limit_seconds: Optional[float] = CPU_TIME_LIMIT_SECONDS,
+                 update_timeout_seconds: float = UPDATE_TIMEOUT_SECONDS,
+                 update_timeout_policy: str = UPDATE_TIMEOUT_POLICY):
+        """
+        Initialize async agent manager.
+
+        Args:
+            timeout_seconds: Maximum time allowed for bid execution
+            memory_limit_mb: Memory available to each agent (None = unlimited)
+            cpu_limit_seconds: CPU time per agent per game (None = unlimited)
+            update_timeout_seconds: Maximum time allowed for update_after_each_round
+            update_timeout_policy: One of UPDATE_TIMEOUT_POLICIES
+        """
+        super().__init__(timeout_seconds=timeout_seconds, execution_mode="process",
+                         memory_limit_mb=memory_limit_mb, cpu_limit_seconds=cpu_limit_seconds,
+                         update_timeout_seconds=update_timeout_seconds,
+                         update_timeout_policy=update_timeout_policy)
+        # (team_id, file_path) -> hosts not bound to a running game
+        self._idle: Dict[Tuple[str, str], List[AsyncAgentWorker]] = {}
+        self._all_workers: List[AsyncAgentWorker] = []
+
+    async def load_agent(self, file_path: str, team_id: str,
+                         valuation_vector: Dict[str, float],
+                         budget: float,
+                         opponent_teams: list) -> Optional[AsyncRemoteAgent]:
+        """
+        Instantiate a team's agent in an idle host, starting one if needed.
+
+        Returns:
+            AsyncRemoteAgent proxy or None if loading failed (a disqualified team
+            gets an unavailable proxy without a host, so its games still run)
+        """
+        logger.info(f"Loading agent for team {team_id} from {file_path}")
+        if not os.path.exists(file_path):
+            logger.error(f"Agent file not found: {file_path}")
+            return None
+
+        if team_id in self.disqualified:
+            agent = AsyncRemoteAgent(None, team_id, valuation_vector, budget, opponent_teams)
+            agent.available = False
+            agent.disqualification = self.disqualified[team_id]
+            logger.info(f"Team {team_id} is disqualified ({agent.disqualification}), it will not bid")
+            return agent
+
+        idle = self._idle.get((team_id, file_path), [])
+        while idle and not idle[-1].is_alive():
+            idle.pop()
+        if idle:
+            worker = idle.pop()
+        else:
+            worker = AsyncAgentWorker(file_path, team_id, self.memory_limit_mb, self.cpu_limit_seconds)
+            await worker.start()
+            self._all_workers.append(worker)
+
+        agent = AsyncRemoteAgent(worker, team_id, valuation_vector, budget, opponent_teams)
+        try:
+            await agent.initialize()
+        except AgentLimitExceeded as e:
+            self._disqualify(agent, str(e))
+            return agent
+        except AgentWorkerError as e:
+            logger.error(f"Error loading agent for team {team_id}: {e}")
+            worker.kill()
+            return None
+
+        logger.info(f"Successfully loaded agent for team {team_id} in host process")
+        return agent
+
+    def release(self, agent: AsyncRemoteAgent):
+        """Return the host of a finished game's agent for reuse and drop its pending penalty"""
+        self.penalized.pop(id(agent), None)
+        worker = agent.worker
+        if worker is not None and agent.available and worker.is_alive():
+            self._idle.setdefault((worker.team_id, worker.file_path), []).append(worker)
+
+    def _disqualify(self, agent: AsyncRemoteAgent, reason: str):
+        """Stop a team's agent for good after it exceeded a limit"""
+        super()._disqualify(agent, reason)
+        if agent.worker is not None:
+            agent.worker.kill()
+
+    async def get_resource_usage(self, agent: AsyncRemoteAgent) -> Optional[Dict[str, float]]:
+        """
+        CPU time and memory peak of an agent in the current game.
+
+        Returns:
+            Dict with cpu_time_seconds and memory_peak_mb, or None if unavailable
+        """
+        if not agent.available:
+            return None
+
+        try:
+            answer = await agent.worker.call("usage", timeout=self.timeout_seconds)
+        except AgentWorkerError as e:
+            logger.warning(f"Team {agent.team_id}: could not read resource usage: {e}")
+            return None
+
+        if answer is None or answer[0] != "success":
+            return None
+        return answer[1]
+
+    async def shutdown(self):
+        """Stop all agent host processes"""
+        await asyncio.gather(*(worker.close() for worker in self._all_workers))
+        self._all_workers.clear()
+        self._idle.clear()
+
+    async def _replace_worker(self, agent: AsyncRemoteAgent):
+        """Replace a failed host, disqualifying the agent if the replay hits a limit"""
+        await agent.replace_worker(self._replacement_timeout(agent))
+        if agent.disqualification:
+            self._disqualify(agent, agent.disqualification)
+
+    async def collect_bids(self, agents: Dict[str, AsyncRemoteAgent], item_id: str) -> Dict[str, tuple]:
+        """
+        Collect one round's sealed bids from all agents under one deadline.
+
+        Every request is sent before any answer is awaited; the round takes as
+        long as its slowest agent, at most timeout_seconds.
+
+        Args:
+            agents: Dictionary mapping team_id to agent
+            item_id: ID of item being auctioned
+
+        Returns:
+            Dictionary mapping team_id to (bid_amount, execution_time, error_msg),
+            in the order of agents (see AgentManager.execute_bid_with_timeout)
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + self.timeout_seconds
+
+        async def bid(agent: AsyncRemoteAgent) -> tuple:
+            unavailable = self._unavailable_bid(agent)
+            if unavailable is not None:
+                return unavailable
+            try:
+                answer = await agent.worker.call("bid", item_id, timeout=deadline - time.perf_counter())
+            except AgentWorkerError as e:
+                return await self._remote_bid_failed(agent, e, time.perf_counter() - start_time)
+            return await self._remote_bid_result(agent, answer, time.perf_counter() - start_time)
+
+        results = await asyncio.gather(*(bid(agent) for agent in agents.values()))
+        return dict(zip(agents, results))
+
+    async def _remote_bid_failed(self, agent: AsyncRemoteAgent, error: AgentWorkerError,
+                                 execution_time: float) -> tuple:
+        """Handle a host that died or hit a resource limit while bidding"""
+        if isinstance(error, AgentLimitExceeded):
+            self._disqualify(agent, str(error))
+            return 0.0, execution_time, f"Disqualified: {error}"
+
+        logger.error(f"Team {agent.team_id}: Agent worker failed: {error}")
+        await self._replace_worker(agent)
+        return 0.0, execution_time, f"Exception: {str(error)}"
+
+    async def _remote_bid_result(self, agent: AsyncRemoteAgent, answer: Optional[tuple],
+                                 execution_time: float) -> tuple:
+        """Turn a host's answer to a bid (None on timeout) into the bid tuple"""
+        if answer is None:
+            logger.warning(f"Team {agent.team_id}: Bid execution timeout ({self.timeout_seconds}s), "
+                           f"replacing worker")
+            self.profiler.record_timeout(agent.team_id, "bid", int(execution_time * 1e9))
+            await self._replace_worker(agent)
+            return 0.0, self.timeout_seconds, "Timeout"
+
+        self.profiler.record(agent.team_id, "bid", answer[2])
+
+        if answer[0] == "limit":
+            self._disqualify(agent, answer[1])
+            return 0.0, execution_time, f"Disqualified: {answer[1]}"
+
+        try:
+            return self._finalize_bid(agent, answer[0], answer[1], execution_time)
+        except Exception as e:
+            logger.error(f"Team {agent.team_id}: Invalid bid returned: {e}")
+            return 0.0, execution_time, f"Exception: {str(e)}"
+
+    async def update_agents_after_round(self, agents: Dict[str, AsyncRemoteAgent], item_id: str,
+                                        winning_team: str, price_paid: float) -> Dict[str, bool]:
+        """
+        Update all agents with round results under one deadline.
+
+        An agent that overruns update_timeout_seconds is handled by
+        update_timeout_policy, as in process mode.
+
+        Returns:
+            Dictionary mapping team_id to True if its update succeeded
+        """
+        args = (item_id, winning_team, price_paid)
+        start_time = time.perf_counter()
+        deadline = start_time + self.update_timeout_seconds
+
+        async def update(team_id: str, agent: AsyncRemoteAgent) -> bool:
+            if team_id in self.disqualified or not agent.available:
+                return False
+            try:
+                answer = await agent.worker.call("update", *args, timeout=deadline - time.perf_counter())
+            except AgentWorkerError as e:
+                return await self._remote_update_failed(agent, e)
+
+            if answer is None:
+                return await self._update_timed_out(agent, time.perf_counter() - start_time)
+
+            self.profiler.record(team_id, "update", answer[2])
+            try:
+                agent.record_update(*args, answer)
+                return True
+            except AgentLimitExceeded as e:
+                self._disqualify(agent, str(e))
+                return False
+            except AgentWorkerError as e:
+                logger.error(f"Team {team_id}: Error in update_after_each_round: {e}")
+                return False
+
+        results = await asyncio.gather(*(update(team_id, agent) for team_id, agent in agents.items()))
+        return dict(zip(agents, results))
+
+    async def _remote_update_failed(self, agent: AsyncRemoteAgent, error: AgentWorkerError) -> bool:
+        """Handle a host that died or hit a resource limit while updating"""
+        if isinstance(error, AgentLimitExceeded):
+            self._disqualify(agent, str(error))
+        else:
+            logger.error(f"Team {agent.team_id}: Agent worker failed during update: {error}")
+            await self._replace_worker(agent)
+        return False
+
+    async def _update_timed_out(self, agent: AsyncRemoteAgent, elapsed: float) -> bool:
+        """Apply update_timeout_policy to an agent whose update overran the deadline"""
+        logger.warning(f"Team {agent.team_id}: Update timeout ({self.update_timeout_seconds}s), "
+                       f"policy '{self.update_timeout_policy}'")
+        self.profiler.record_timeout(agent.team_id, "update", int(elapsed * 1e9))
+
+        if self.update_timeout_policy == "disqualify":
+            self._disqualify(agent, f"Update timeout ({self.update_timeout_seconds}s)")
+            return False
+
+        await self._replace_worker(agent)
+        if self.update_timeout_policy == "penalize":
+            self.penalized[id(agent)] = agent
+        return False
@@ -0,0 +1,126 @@
+"""
+Async Game Manager for AGT Competition
+Runs a single game as a coroutine, so many games can be interleaved on one event loop
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict
+
+from src.config import T_AUCTION_ROUNDS, INITIAL_BUDGET
+from src.auction_engine import NO_WINNER
+from src.game_manager import GameManager
+from src.game_record import GameRecord, RoundResultView, TeamResultView
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGameManager(GameManager):
+    """
+    GameManager driven by an AsyncAgentManager.
+
+    Valuations, auction rules, budgets and the game record are GameManager's
+    own, so a game plays out exactly as in "process" mode; only talking to the
+    agents is awaited instead of blocking. Bids are always collected from all
+    agents at once. Use run_game_async() instead of run_game().
+    """
+
+    async def initialize_game_async(self, team_agents: Dict[str, str], game_inputs: tuple = None) -> bool:
+        """
+        Initialize game with teams and their agent files (see initialize_game).
+
+        Returns:
+            True if initialization successful, False otherwise
+        """
+        try:
+            self._prepare_game(team_agents, game_inputs)
+            team_ids = self.teams.names
+
+            agents = await asyncio.gather(*(
+                self.agent_manager.load_agent(
+                    file_path=agent_file,
+                    team_id=team_id,
+                    valuation_vector=self.valuations[team_id],
+                    budget=INITIAL_BUDGET,
+                    opponent_teams=[tid for tid in team_ids if tid != team_id]
+                )
+                for team_id, agent_file in team_agents.items()
+            ))
+
+            # Keep loaded agents even on failure, so their hosts are released
+            self.agents = {team_id: agent for team_id, agent in zip(team_agents, agents) if agent is not None}
+            for team_id, agent in zip(team_agents, agents):
+                if agent is None:
+                    logger.error(f"Failed to load agent for team {team_id}")
+                    return False
+
+            if not self.headless and logger.isEnabledFor(logging.INFO):
+                logger.info(f"Successfully initialized {len(self.agents)} agents")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error initializing game: {e}", exc_info=True)
+            return False
+
+    async def execute_auction_round_async(self, round_number: int, item_id: str) -> RoundResultView:
+        """
+        Execute a single auction round and store it in the game record
+        (see execute_auction_round).
+
+        Returns:
+            View of the stored round (AuctionRoundResult interface)
+        """
+        if not self.headless and logger.isEnabledFor(logging.INFO):
+            logger.info(f"=== Round {round_number}/{T_AUCTION_ROUNDS}: Item {item_id} ===")
+
+        bid_results = await self.agent_manager.collect_bids(self.agents, item_id)
+        winner, price = self._settle_round(round_number, item_id, bid_results)
+
+        winner_id = self.teams.name(winner) if winner != NO_WINNER else ""
+        await self.agent_manager.update_agents_after_round(self.agents, item_id, winner_id, price)
+
+        return RoundResultView(self.record, self.record.rounds_played - 1)
+
+    async def run_game_async(self, team_agents: Dict[str, str], game_inputs: tuple = None) -> GameRecord:
+        """
+        Run a complete game (see run_game).
+
+        The agents' host processes are released to the agent manager when the
+        game ends, for the teams' next games.
+
+        Returns:
+            GameRecord with complete game information (read like a GameResult)
+        """
+        if not self.headless:
+            logger.info(f"======== Starting Game {self.game_id} ========")
+        self.start_time = datetime.now()
+
+        try:
+            if not await self.initialize_game_async(team_agents, game_inputs):
+                logger.error("Game initialization failed")
+                raise Exception("Game initialization failed")
+
+            self.record = self._new_record()
+
+            for round_number in range(1, T_AUCTION_ROUNDS + 1):
+                item_id = self.auction_sequence[round_number - 1]
+                await self.execute_auction_round_async(round_number, item_id)
+
+            team_results = await self._calculate_final_results_async()
+        finally:
+            for agent in self.agents.values():
+                self.agent_manager.release(agent)
+
+        if not self.headless and logger.isEnabledFor(logging.INFO):
+            logger.info(f"======== Game {self.game_id} Complete ========")
+            self._log_game_summary(team_results)
+
+        return self.record
+
+    async def _calculate_final_results_async(self) -> Dict[str, TeamResultView]:
+        """Calculate final results for all teams (see _calculate_final_results)"""
+        usages = await asyncio.gather(*(self.agent_manager.get_resource_usage(agent)
+                                        for agent in self.agents.values()))
+        return self._store_usage(usages)
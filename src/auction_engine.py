@@ -4,7 +4,7 @@ Executes single auction rounds using second-price sealed-bid mechanism
 """
 
 import numpy as np
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Sequence
 from datetime import datetime
 import logging
 
@@ -14,6 +14,10 @@ from src.utils import AuctionRoundResult
 logger = logging.getLogger(__name__)
 
 
+# Winner index of a round without valid bids
+NO_WINNER = -1
+
+
 class AuctionEngine:
     """
     Executes a single auction round using second-price sealed-bid (Vickrey) mechanism.
@@ -25,9 +29,14 @@ class AuctionEngine:
     4. Handle ties randomly
     """
     
-    def __init__(self):
-        """Initialize auction engine"""
-        pass
+    def __init__(self, rng: np.random.Generator = None):
+        """
+        Initialize auction engine.
+        
+        Args:
+            rng: Random generator for tie-breaking (fresh unseeded one if None)
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
     
     def validate_bid(self, bid: float, budget: float, team_id: str) -> Tuple[float, bool]:
         """
@@ -68,49 +77,67 @@ class AuctionEngine:
             - If no valid bids, returns (None, 0.0, [])
             - price_paid is the second-highest bid (or 0 if only one bidder)
         """
-        if not bids:
-            return None, 0.0, []
+        team_ids = list(bids)
+        winner, price_paid, tied = self.determine_winner_indexed(list(bids.values()), team_ids)
+        winner_id = team_ids[winner] if winner != NO_WINNER else None
+        return winner_id, price_paid, [team_ids[t] for t in tied]
+    
+    def determine_winner_indexed(self, bids: Sequence[float],
+                                 team_ids: Sequence[str] = None) -> Tuple[int, float, List[int]]:
+        """
+        Determine auction winner and price on bids indexed by team.
         
-        # Filter out zero or negative bids
-        valid_bids = {team_id: bid for team_id, bid in bids.items() if bid > 0}
+        Args:
+            bids: Bid amount per team index
+            team_ids: Team names per index, for log messages only
         
-        if not valid_bids:
-            logger.info("No valid bids in this round")
-            return None, 0.0, []
+        Returns:
+            Tuple of (winner, price_paid, tied) as team indices
+            - If no valid bids, returns (NO_WINNER, 0.0, [])
+            - price_paid is the second-highest bid (or 0 if only one bidder)
+        """
+        # Filter out zero or negative bids
+        valid = [t for t, bid in enumerate(bids) if bid > 0]
         
-        # Sort bids in descending order
-        sorted_bids = sorted(valid_bids.items(), key=lambda x: x[1], reverse=True)
+        if not valid:
+            if bids and logger.isEnabledFor(logging.INFO):
+                logger.info("No valid bids in this round")
+            return NO_WINNER, 0.0, []
         
-        # Get highest bid(s) - may have ties
-        highest_bid = sorted_bids[0][1]
-        highest_bidders = [team_id for team_id, bid in sorted_bids if bid == highest_bid]
+        # Get highest bid(s) - may have ties, kept in team order
+        highest_bid = max(bids[t] for t in valid)
+        highest_bidders = [t for t in valid if bids[t] == highest_bid]
         
         # Handle ties with random selection
         if len(highest_bidders) > 1:
-            winner_id = np.random.choice(highest_bidders)
-            logger.info(f"Tie broken randomly among {highest_bidders}, winner: {winner_id}")
+            winner = highest_bidders[self.rng.integers(len(highest_bidders))]
+            if logger.isEnabledFor(logging.INFO):
+                names = team_ids if team_ids is not None else range(len(bids))
+                logger.info(f"Tie broken randomly among {[names[t] for t in highest_bidders]}, "
+                            f"winner: {names[winner]}")
         else:
-            winner_id = highest_bidders[0]
+            winner = highest_bidders[0]
         
         # Calculate second-price
-        if len(sorted_bids) == 1:
+        if len(valid) == 1:
             # Only one bidder - pays 0 (or minimum bid if we want to set one)
             price_paid = 0.0
-            logger.info(f"Single bidder {winner_id}, pays 0")
+            if logger.isEnabledFor(logging.INFO):
+                names = team_ids if team_ids is not None else range(len(bids))
+                logger.info(f"Single bidder {names[winner]}, pays 0")
+        elif len(highest_bidders) > 1:
+            # If there's a tie for highest, winner pays the tied amount
+            price_paid = highest_bid
         else:
-            # Second-highest bid (or highest if tied)
-            if len(highest_bidders) > 1:
-                # If there's a tie for highest, winner pays the tied amount
-                price_paid = highest_bid
-            else:
-                # Winner pays second-highest bid
-                price_paid = sorted_bids[1][1]
+            # Winner pays second-highest bid
+            price_paid = max(bids[t] for t in valid if t != winner)
         
-        return winner_id, price_paid, highest_bidders if len(highest_bidders) > 1 else []
+        return winner, price_paid, highest_bidders if len(highest_bidders) > 1 else []
     
     def execute_round(self, round_number: int, item_id: str, 
                      bids: Dict[str, float], budgets: Dict[str, float],
-                     execution_times: Dict[str, float]) -> AuctionRoundResult:
+                     execution_times: Dict[str, float],
+                     timestamp: datetime = None) -> AuctionRoundResult:
         """
         Execute a complete auction round.
         
@@ -120,47 +147,75 @@ class AuctionEngine:
             bids: Dictionary mapping team_id to bid amount
             budgets: Dictionary mapping team_id to available budget
             execution_times: Dictionary mapping team_id to bid execution time
+            timestamp: Round timestamp (datetime.now() if None)
         
         Returns:
             AuctionRoundResult with complete round information
         """
-        logger.info(f"Round {round_number}: Auctioning {item_id}")
+        team_ids = list(bids)
+        validated_bids, winner, price_paid = self.execute_round_indexed(
+            round_number, item_id, list(bids.values()),
+            [budgets.get(team_id, 0) for team_id in team_ids], team_ids
+        )
+        
+        return AuctionRoundResult(
+            round_number=round_number,
+            item_id=item_id,
+            winner_id=team_ids[winner] if winner != NO_WINNER else None,
+            price_paid=price_paid,
+            all_bids=dict(zip(team_ids, validated_bids)),
+            timestamp=timestamp if timestamp is not None else datetime.now(),
+            execution_times=execution_times
+        )
+    
+    def execute_round_indexed(self, round_number: int, item_id: str,
+                              bids: Sequence[float], budgets: Sequence[float],
+                              team_ids: Sequence[str]) -> Tuple[List[float], int, float]:
+        """
+        Execute a complete auction round on per-team-index bids and budgets.
+        
+        Args:
+            round_number: Sequential round number (1-15)
+            item_id: ID of item being auctioned
+            bids: Raw bid per team index
+            budgets: Available budget per team index
+            team_ids: Team names per index, for log messages
+        
+        Returns:
+            Tuple of (validated_bids, winner, price_paid), winner being a team
+            index or NO_WINNER
+        """
+        # Formatting the messages below costs more than the auction itself,
+        # so skip it entirely when the level is disabled
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"Round {round_number}: Auctioning {item_id}")
         
         # Validate and cap all bids
-        validated_bids = {}
+        validated_bids = []
         capped_teams = []
         
-        for team_id, bid in bids.items():
-            budget = budgets.get(team_id, 0)
-            validated_bid, was_capped = self.validate_bid(bid, budget, team_id)
-            validated_bids[team_id] = validated_bid
+        for t, bid in enumerate(bids):
+            validated_bid, was_capped = self.validate_bid(bid, budgets[t], team_ids[t])
+            validated_bids.append(validated_bid)
             
             if was_capped:
-                capped_teams.append(team_id)
+                capped_teams.append(team_ids[t])
         
-        logger.debug(f"Validated bids: {validated_bids}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Validated bids: {dict(zip(team_ids, validated_bids))}")
         if capped_teams:
             logger.warning(f"Teams with capped bids: {capped_teams}")
         
         # Determine winner and price
-        winner_id, price_paid, tied_teams = self.determine_winner(validated_bids)
-        
-        if winner_id:
-            logger.info(f"Winner: {winner_id}, Price: {price_paid:.2f}")
-            if tied_teams:
-                logger.info(f"Tie broken among: {tied_teams}")
-        else:
-            logger.info("No winner (no valid bids)")
+        winner, price_paid, tied = self.determine_winner_indexed(validated_bids, team_ids)
         
-        # Create result object
-        result = AuctionRoundResult(
-            round_number=round_number,
-            item_id=item_id,
-            winner_id=winner_id,
-            price_paid=price_paid,
-            all_bids=validated_bids,
-            timestamp=datetime.now(),
-            execution_times=execution_times
-        )
+        if log_info:
+            if winner != NO_WINNER:
+                logger.info(f"Winner: {team_ids[winner]}, Price: {price_paid:.2f}")
+                if tied:
+                    logger.info(f"Tie broken among: {[team_ids[t] for t in tied]}")
+            else:
+                logger.info("No winner (no valid bids)")
         
-        return result
+        return validated_bids, winner, price_paid
@@ -0,0 +1,155 @@
+"""
+Batch Auction Engine for AGT Competition
+Runs one second-price auction round for many independent games at once
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+def round_cents(values: np.ndarray) -> np.ndarray:
+    """
+    Round to 2 decimal places exactly as Python's round(x, 2).
+
+    np.round scales by 100 first, which can carry a value just below a half cent
+    (2.675 is 2.67499...) over it. Only values that close to a half cent can
+    differ, so those are rounded in Python.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100.0
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(value, 2) for value in values[near_half].tolist()]
+    return rounded
+
+
+@dataclass
+class BatchRoundResult:
+    """Results of one auction round across a batch of games"""
+    validated_bids: np.ndarray  # (n_games, n_teams) bids after validation and capping
+    winners: np.ndarray         # (n_games,) winning team index, -1 if no valid bids
+    prices: np.ndarray          # (n_games,) price paid by the winner
+    tied: np.ndarray            # (n_games, n_teams) teams tied for the highest bid (all False if no tie)
+
+
+class BatchAuctionEngine:
+    """
+    Vectorized counterpart of AuctionEngine for running games in lockstep.
+
+    Bids for one round of many games are given as an (n_games, n_teams) matrix.
+    Validation, winner selection and pricing follow AuctionEngine exactly:
+    - Invalid (NaN) or negative bids become 0, bids above budget are capped to
+      the budget, everything is rounded to 2 decimal places
+    - Only bids > 0 take part; no such bid means no winner and price 0
+    - A single valid bidder pays 0
+    - Ties for the highest bid are broken uniformly at random and the winner pays
+      the tied amount; otherwise the winner pays the second-highest bid
+
+    Tie-breaks draw from a dedicated np.random.Generator, as in AuctionEngine,
+    although the number of draws per round differs between the two engines.
+    """
+
+    def __init__(self, rng: np.random.Generator = None):
+        """
+        Initialize batch auction engine.
+
+        Args:
+            rng: Random generator for tie-breaking (fresh unseeded one if None)
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def validate_bids(self, bids: np.ndarray, budgets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Validate and cap bids to available budgets.
+
+        Args:
+            bids: (n_games, n_teams) raw bids
+            budgets: (n_games, n_teams) available budgets
+
+        Returns:
+            Tuple of (validated_bids, capped_mask)
+        """
+        bids = np.asarray(bids, dtype=np.float64)
+        budgets = np.asarray(budgets, dtype=np.float64)
+
+        invalid = np.isnan(bids) | (bids < 0)
+        capped = ~invalid & (bids > budgets)
+
+        validated = np.where(capped, budgets, bids)
+        validated = round_cents(np.where(invalid, 0.0, validated))
+        return validated, capped
+
+    def determine_winners(self, bids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Determine winners and prices for a batch of games.
+
+        Args:
+            bids: (n_games, n_teams) validated bids
+
+        Returns:
+            Tuple of (winners, prices, tied)
+            - winners: (n_games,) team index, -1 where no valid bids
+            - prices: (n_games,) second-price payments
+            - tied: (n_games, n_teams) mask of teams tied for the highest bid
+        """
+        bids = np.asarray(bids, dtype=np.float64)
+        n_games, n_teams = bids.shape
+
+        valid = bids > 0
+        masked = np.where(valid, bids, 0.0)
+        num_valid = valid.sum(axis=1)
+
+        # Highest and second-highest bid per game
+        if n_teams >= 2:
+            top_two = np.partition(masked, n_teams - 2, axis=1)[:, -2:]
+            second, highest = top_two[:, 0], top_two[:, 1]
+        else:
+            highest, second = masked[:, 0], np.zeros(n_games)
+
+        is_highest = valid & (masked == highest[:, None])
+        num_highest = is_highest.sum(axis=1)
+        has_tie = num_highest > 1
+
+        # Uniform tie-break: random key per team, best key among the highest bidders wins
+        keys = np.where(is_highest, self.rng.random((n_games, n_teams)), -1.0)
+        winners = np.where(num_valid > 0, np.argmax(keys, axis=1), -1)
+
+        prices = np.where(has_tie, highest, second)
+        prices = np.where(num_valid > 1, prices, 0.0)
+
+        tied = is_highest & has_tie[:, None]
+        return winners, prices, tied
+
+    def execute_round(self, bids: np.ndarray, budgets: np.ndarray) -> BatchRoundResult:
+        """
+        Execute one auction round for every game in the batch.
+
+        Args:
+            bids: (n_games, n_teams) raw bids
+            budgets: (n_games, n_teams) available budgets (not modified)
+
+        Returns:
+            BatchRoundResult for the round
+        """
+        validated_bids, _ = self.validate_bids(bids, budgets)
+        winners, prices, tied = self.determine_winners(validated_bids)
+        return BatchRoundResult(
+            validated_bids=validated_bids,
+            winners=winners,
+            prices=prices,
+            tied=tied
+        )
+
+    @staticmethod
+    def charge_winners(budgets: np.ndarray, result: BatchRoundResult):
+        """
+        Deduct each game's price from its winner's budget, in place.
+
+        Args:
+            budgets: (n_games, n_teams) budgets to update
+            result: Round result from execute_round
+        """
+        games = np.flatnonzero(result.winners >= 0)
+        budgets[games, result.winners[games]] -= result.prices[games]
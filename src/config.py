@@ -21,9 +21,45 @@ STAGE1_GAMES = 5
 STAGE2_GAMES = 5
 ARENA_SIZE = 5
 
+# Stage 1 arena assignment: teams are shuffled with the tournament seed (False:
+# in team_id order) and split into arenas whose sizes differ by at most one.
+# Measured agent latencies only order arena execution, never the assignment
+SHUFFLE_ARENAS = True
+
 # Execution Limits
+# Memory and CPU limits are enforced per agent in "process" execution mode
+# (Unix only); an agent that exceeds one is disqualified for the rest of the arena
 BID_TIMEOUT_SECONDS = 2.0
 MEMORY_LIMIT_MB = 256
+CPU_TIME_LIMIT_SECONDS = 30  # CPU time per agent per game
+
+# Deadline for all agents' update_after_each_round calls of a round, and what
+# happens to an agent that overruns it: "skip" (the update is abandoned),
+# "penalize" (abandoned, and the agent forfeits its next bid in that game) or "disqualify"
+UPDATE_TIMEOUT_SECONDS = 2.0
+UPDATE_TIMEOUT_POLICY = "skip"
+
+# Agent execution backend: "thread" (new thread per bid), "process" (long-lived
+# worker process per agent, killed and replaced on timeout) or "inline" (direct
+# calls without timeout enforcement, for trusted local agents only)
+AGENT_EXECUTION_MODE = "process"
+
+# "async" mode (tournaments only): agents run as line-protocol subprocesses
+# driven from one asyncio event loop, which interleaves up to this many games
+# (each game holds one process and two pipes per team, mind the open file limit)
+ASYNC_MAX_CONCURRENT_GAMES = 64
+
+# Collect each round's bids from all agents at once under a single deadline
+# (round latency is the slowest agent's, not the sum); False asks them in turn
+CONCURRENT_BID_COLLECTION = True
+
+# Per-game result storage: "json" (indented detailed + public file per game),
+# "jsonl" or "jsonl.gz" (append-only JSON Lines per arena, optionally gzipped)
+RESULT_FORMAT = "json"
+
+# Games a JSONL result sink keeps in memory before appending (and fsyncing) them;
+# 1 makes every finished game a checkpoint that --resume can reuse after a crash
+RESULT_BUFFER_GAMES = 1
 
 # Bid Precision
 BID_DECIMAL_PLACES = 2  # Bids rounded to 2 decimal places
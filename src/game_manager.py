@@ -5,14 +5,17 @@ Orchestrates a single game (15 auction rounds)
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import copy
 
-from src.config import T_AUCTION_ROUNDS, INITIAL_BUDGET
+from src.config import T_AUCTION_ROUNDS, INITIAL_BUDGET, CONCURRENT_BID_COLLECTION
 from src.valuation_generator import ValuationGenerator
-from src.auction_engine import AuctionEngine
+from src.auction_engine import AuctionEngine, NO_WINNER
 from src.agent_manager import AgentManager
-from src.utils import GameResult, TeamGameResult, AuctionRoundResult, generate_game_id
+from src.random_streams import GameRandomStreams
+from src.game_record import GameRecord, RoundResultView, TeamResultView
+from src.interning import Interner
+from src.utils import generate_game_id
 
 
 logger = logging.getLogger(__name__)
@@ -34,7 +37,10 @@ class GameManager:
     def __init__(self, stage: int, arena_id: str, game_number: int,
                  valuation_generator: ValuationGenerator,
                  auction_engine: AuctionEngine,
-                 agent_manager: AgentManager):
+                 agent_manager: AgentManager,
+                 random_streams: GameRandomStreams = None,
+                 headless: bool = False,
+                 concurrent_bids: bool = CONCURRENT_BID_COLLECTION):
         """
         Initialize game manager.
         
@@ -45,6 +51,12 @@ class GameManager:
             valuation_generator: Valuation generator instance
             auction_engine: Auction engine instance
             agent_manager: Agent manager instance
+            random_streams: Optional per-game generators for valuations and auction
+                sequence (the generator's own stream is used if None)
+            headless: Bulk-simulation mode: no per-round or summary logging, and every
+                round is stamped with the game start time instead of datetime.now()
+            concurrent_bids: Collect each round's bids from all agents at once with
+                AgentManager.collect_bids instead of one agent after the other
         """
         self.stage = stage
         self.arena_id = arena_id
@@ -54,42 +66,33 @@ class GameManager:
         self.valuation_generator = valuation_generator
         self.auction_engine = auction_engine
         self.agent_manager = agent_manager
+        self.random_streams = random_streams
+        self.headless = headless
+        self.concurrent_bids = concurrent_bids
         
         self.agents = {}
-        self.budgets = {}
+        self.teams = Interner()
+        self.budgets = []  # Remaining budget per team index
         self.valuations = {}
-        self.items_won = {}
-        self.auction_log = []
         self.auction_sequence = []
+        self.record = None
+        self.start_time = None
     
-    def initialize_game(self, team_agents: Dict[str, str]) -> bool:
+    def initialize_game(self, team_agents: Dict[str, str], game_inputs: tuple = None) -> bool:
         """
         Initialize game with teams and their agent files.
         
         Args:
             team_agents: Dictionary mapping team_id to agent_file_path
+            game_inputs: Optional pre-generated (valuations, item_categories, auction_sequence),
+                e.g. from ValuationBatch.game_inputs(); generated on the fly if None
         
         Returns:
             True if initialization successful, False otherwise
         """
-        logger.info(f"Initializing game {self.game_id}")
-        logger.info(f"Teams: {list(team_agents.keys())}")
-        
         try:
-            # Generate valuations for all teams
-            team_ids = list(team_agents.keys())
-            self.valuations, item_categories = self.valuation_generator.generate_arena_valuations(team_ids)
-            logger.info(f"Generated valuations for {len(team_ids)} teams")
-            logger.debug(f"Item categories: High={item_categories[0]}, Low={item_categories[1]}, Mixed={item_categories[2]}")
-            
-            # Generate auction sequence
-            self.auction_sequence = self.valuation_generator.get_random_auction_sequence(T_AUCTION_ROUNDS)
-            logger.info(f"Auction sequence: {self.auction_sequence}")
-            
-            # Initialize budgets and items_won tracking
-            for team_id in team_ids:
-                self.budgets[team_id] = INITIAL_BUDGET
-                self.items_won[team_id] = []
+            self._prepare_game(team_agents, game_inputs)
+            team_ids = self.teams.names
             
             # Load and initialize agents
             for team_id, agent_file in team_agents.items():
@@ -110,162 +113,215 @@ class GameManager:
                 
                 self.agents[team_id] = agent
             
-            logger.info(f"Successfully initialized {len(self.agents)} agents")
+            if not self.headless and logger.isEnabledFor(logging.INFO):
+                logger.info(f"Successfully initialized {len(self.agents)} agents")
             return True
             
         except Exception as e:
             logger.error(f"Error initializing game: {e}", exc_info=True)
             return False
     
-    def execute_auction_round(self, round_number: int, item_id: str) -> AuctionRoundResult:
+    def _prepare_game(self, team_agents: Dict[str, str], game_inputs: tuple = None):
         """
-        Execute a single auction round.
+        Generate (or take) the game's valuations and auction sequence and reset
+        budgets; everything in initialize_game except loading the agents.
+        """
+        log_info = not self.headless and logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(f"Initializing game {self.game_id}")
+            logger.info(f"Teams: {list(team_agents.keys())}")
+        
+        team_ids = list(team_agents.keys())
+        if game_inputs is not None:
+            self.valuations, item_categories, self.auction_sequence = game_inputs
+        else:
+            streams = self.random_streams
+            
+            # Generate valuations for all teams
+            self.valuations, item_categories = self.valuation_generator.generate_arena_valuations(
+                team_ids, rng=streams.valuations if streams else None
+            )
+            
+            # Generate auction sequence
+            self.auction_sequence = self.valuation_generator.get_random_auction_sequence(
+                T_AUCTION_ROUNDS, rng=streams.auction_sequence if streams else None
+            )
+        
+        if log_info:
+            logger.info(f"Generated valuations for {len(team_ids)} teams")
+            logger.debug(f"Item categories: High={item_categories[0]}, Low={item_categories[1]}, Mixed={item_categories[2]}")
+            logger.info(f"Auction sequence: {self.auction_sequence}")
+        
+        # Initialize budgets
+        self.teams = Interner(team_ids)
+        self.budgets = [INITIAL_BUDGET] * len(team_ids)
+    
+    def execute_auction_round(self, round_number: int, item_id: str) -> RoundResultView:
+        """
+        Execute a single auction round and store it in the game record.
+        
+        Teams are handled by index internally; team ids are only used to talk
+        to the agents and in log messages.
         
         Args:
             round_number: Sequential round number (1-15)
             item_id: Item being auctioned
         
         Returns:
-            AuctionRoundResult with complete round information
+            View of the stored round (AuctionRoundResult interface)
         """
-        logger.info(f"=== Round {round_number}/{T_AUCTION_ROUNDS}: Item {item_id} ===")
+        if not self.headless and logger.isEnabledFor(logging.INFO):
+            logger.info(f"=== Round {round_number}/{T_AUCTION_ROUNDS}: Item {item_id} ===")
+        
+        # Collect bids from all agents (results come back in agent order)
+        if self.concurrent_bids:
+            bid_results = self.agent_manager.collect_bids(self.agents, item_id)
+        else:
+            bid_results = {team_id: self.agent_manager.execute_bid_with_timeout(agent, item_id)
+                           for team_id, agent in self.agents.items()}
         
-        # Collect bids from all agents
-        bids = {}
-        execution_times = {}
+        winner, price = self._settle_round(round_number, item_id, bid_results)
         
-        for team_id, agent in self.agents.items():
-            bid, exec_time, error = self.agent_manager.execute_bid_with_timeout(agent, item_id)
-            bids[team_id] = bid
-            execution_times[team_id] = exec_time
+        # Update all agents with round results
+        winner_id = self.teams.name(winner) if winner != NO_WINNER else ""
+        self.agent_manager.update_agents_after_round(self.agents, item_id, winner_id, price)
+        
+        return RoundResultView(self.record, self.record.rounds_played - 1)
+    
+    def _settle_round(self, round_number: int, item_id: str,
+                      bid_results: Dict[str, tuple]) -> Tuple[int, float]:
+        """
+        Run the auction on a round's collected bids, charge the winner and store
+        the round in the game record.
+        
+        Args:
+            round_number: Sequential round number (1-15)
+            item_id: Item being auctioned
+            bid_results: (bid, execution_time, error) per team, in agent order
+        
+        Returns:
+            Tuple of (winning team index or NO_WINNER, price paid)
+        """
+        log_info = not self.headless and logger.isEnabledFor(logging.INFO)
+        log_debug = not self.headless and logger.isEnabledFor(logging.DEBUG)
+        
+        bids = []
+        execution_times = []
+        
+        for t, (bid, exec_time, error) in enumerate(bid_results.values()):
+            bids.append(bid)
+            execution_times.append(exec_time)
             
             if error:
-                logger.warning(f"Team {team_id} bid error: {error}")
+                logger.warning(f"Team {self.teams.name(t)} bid error: {error}")
             
-            logger.debug(f"Team {team_id}: Bid={bid:.2f}, Budget={self.budgets[team_id]:.2f}, Time={exec_time:.3f}s")
+            if log_debug:
+                logger.debug(f"Team {self.teams.name(t)}: Bid={bid:.2f}, Budget={self.budgets[t]:.2f}, Time={exec_time:.3f}s")
         
         # Execute auction
-        round_result = self.auction_engine.execute_round(
+        validated_bids, winner, price = self.auction_engine.execute_round_indexed(
             round_number=round_number,
             item_id=item_id,
             bids=bids,
             budgets=self.budgets,
-            execution_times=execution_times
+            team_ids=self.teams.names
         )
         
         # Update game state
-        if round_result.winner_id:
-            winner_id = round_result.winner_id
-            price = round_result.price_paid
-            
+        if winner != NO_WINNER:
             # Update budget
-            self.budgets[winner_id] -= price
+            self.budgets[winner] -= price
             
-            # Track items won
-            self.items_won[winner_id].append(item_id)
-            
-            logger.info(f"Winner: {winner_id}, Price: {price:.2f}, Remaining budget: {self.budgets[winner_id]:.2f}")
-        else:
+            if log_info:
+                logger.info(f"Winner: {self.teams.name(winner)}, Price: {price:.2f}, Remaining budget: {self.budgets[winner]:.2f}")
+        elif log_info:
             logger.info("No winner this round")
         
-        # Update all agents with round results
-        for team_id, agent in self.agents.items():
-            winner = round_result.winner_id if round_result.winner_id else ""
-            price = round_result.price_paid
-            self.agent_manager.update_agent_after_round(agent, item_id, winner, price)
-        
-        return round_result
+        self.record.add_round(
+            bids=validated_bids,
+            execution_times=execution_times,
+            winner=winner,
+            price_paid=price,
+            timestamp=self.start_time if self.headless else datetime.now()
+        )
+        return winner, price
     
-    def run_game(self, team_agents: Dict[str, str]) -> GameResult:
+    def run_game(self, team_agents: Dict[str, str], game_inputs: tuple = None) -> GameRecord:
         """
         Run a complete game.
         
         Args:
             team_agents: Dictionary mapping team_id to agent_file_path
+            game_inputs: Optional pre-generated game inputs (see initialize_game)
         
         Returns:
-            GameResult with complete game information
+            GameRecord with complete game information (read like a GameResult)
         """
-        logger.info(f"======== Starting Game {self.game_id} ========")
-        start_time = datetime.now()
+        if not self.headless:
+            logger.info(f"======== Starting Game {self.game_id} ========")
+        self.start_time = datetime.now()
         
         # Initialize game
-        if not self.initialize_game(team_agents):
+        if not self.initialize_game(team_agents, game_inputs):
             logger.error("Game initialization failed")
             raise Exception("Game initialization failed")
         
+        self.record = self._new_record()
+        
         # Execute all auction rounds
         for round_number in range(1, T_AUCTION_ROUNDS + 1):
             item_id = self.auction_sequence[round_number - 1]
-            round_result = self.execute_auction_round(round_number, item_id)
-            self.auction_log.append(round_result)
+            self.execute_auction_round(round_number, item_id)
         
         # Calculate final results
         team_results = self._calculate_final_results()
         
-        # Create game result
-        game_result = GameResult(
+        if not self.headless and logger.isEnabledFor(logging.INFO):
+            logger.info(f"======== Game {self.game_id} Complete ========")
+            self._log_game_summary(team_results)
+        
+        return self.record
+    
+    def _new_record(self) -> GameRecord:
+        """Empty game record for the initialized game"""
+        return GameRecord(
             game_id=self.game_id,
             arena_id=self.arena_id,
             stage=self.stage,
             game_number=self.game_number,
-            timestamp=start_time,
-            team_results=team_results,
-            auction_log=self.auction_log,
+            timestamp=self.start_time,
+            teams=self.teams,
+            valuations=self.valuations,
             auction_sequence=self.auction_sequence
         )
-        
-        logger.info(f"======== Game {self.game_id} Complete ========")
-        self._log_game_summary(team_results)
-        
-        return game_result
     
-    def _calculate_final_results(self) -> Dict[str, TeamGameResult]:
+    def _calculate_final_results(self) -> Dict[str, TeamResultView]:
         """
         Calculate final results for all teams.
         
+        Utility, spending and items won follow from the rounds stored in the
+        game record; only resource usage and disqualifications are added here.
+        
         Returns:
-            Dictionary mapping team_id to TeamGameResult
+            Dictionary mapping team_id to its result view
         """
-        team_results = {}
-        
-        for team_id, agent in self.agents.items():
-            # Calculate total valuation of won items
-            total_valuation_won = sum(
-                self.valuations[team_id][item_id] 
-                for item_id in self.items_won[team_id]
-            )
-            
-            # Calculate total spent
-            budget_spent = INITIAL_BUDGET - self.budgets[team_id]
-            
-            # Calculate utility
-            utility = total_valuation_won - budget_spent
-            
-            # Find max single item utility
-            max_item_utility = 0.0
-            if self.items_won[team_id]:
-                max_item_utility = max(
-                    self.valuations[team_id][item_id] 
-                    for item_id in self.items_won[team_id]
-                )
-            
-            team_result = TeamGameResult(
-                team_id=team_id,
-                utility=utility,
-                budget_spent=budget_spent,
-                budget_remaining=self.budgets[team_id],
-                items_won=self.items_won[team_id].copy(),
-                valuation_vector=self.valuations[team_id].copy(),
-                max_single_item_utility=max_item_utility,
-                total_valuation_won=total_valuation_won
+        usages = [self.agent_manager.get_resource_usage(agent) for agent in self.agents.values()]
+        return self._store_usage(usages)
+    
+    def _store_usage(self, usages: List[Optional[Dict[str, float]]]) -> Dict[str, TeamResultView]:
+        """Store each team's resource usage (in agent order) and disqualification"""
+        for t, (team_id, usage) in enumerate(zip(self.agents, usages)):
+            usage = usage or {}
+            self.record.set_team_usage(
+                t,
+                cpu_time_seconds=usage.get("cpu_time_seconds"),
+                memory_peak_mb=usage.get("memory_peak_mb"),
+                disqualification=self.agent_manager.disqualified.get(team_id)
             )
-            
-            team_results[team_id] = team_result
         
-        return team_results
+        return self.record.team_results
     
-    def _log_game_summary(self, team_results: Dict[str, TeamGameResult]):
+    def _log_game_summary(self, team_results: Dict[str, TeamResultView]):
         """Log summary of game results"""
         logger.info("=== Game Summary ===")
         
@@ -0,0 +1,365 @@
+"""
+Game Record for AGT Competition
+Compact array-backed storage of a finished game, with read-only result views
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.auction_engine import NO_WINNER
+from src.config import INITIAL_BUDGET
+from src.interning import ITEM_INTERNER, Interner
+from src.utils import AuctionRoundResult, GameResult, TeamGameResult
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(timestamp: datetime) -> int:
+    """Exact microseconds since the (naive) epoch"""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _item_interner(valuations: Dict[str, Dict[str, float]]) -> Interner:
+    """Item axis for a game's valuations: the shared ITEM_INTERNER whenever it covers them"""
+    keys = {}
+    for valuation_vector in valuations.values():
+        keys.update(dict.fromkeys(valuation_vector))
+    if all(item_id in ITEM_INTERNER for item_id in keys):
+        return ITEM_INTERNER
+    return Interner(keys)
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
+class GameRecord:
+    """
+    One game stored as a handful of NumPy arrays instead of per-round and
+    per-team objects.
+
+    Teams and items are identified by their index in the teams and items
+    interners; the per-round bid and execution time tables are (rounds x teams)
+    arrays, and the valuations a (teams x items) array. Team results (utility, items won, ...)
+    are derived from the rounds on access, with the same arithmetic as
+    GameManager, so to_dict() matches the GameResult it replaces.
+
+    A GameRecord can be used wherever a GameResult is read: game_id, stage,
+    team_results, auction_log, to_dict() etc. are provided through lightweight
+    views (TeamResultView, RoundResultView) created on access.
+    """
+
+    __slots__ = ("game_id", "arena_id", "stage", "game_number", "timestamp",
+                 "teams", "items", "sequence", "valuations",
+                 "bids", "execution_times", "winners", "prices", "round_times",
+                 "rounds_played", "cpu_time_seconds", "memory_peak_mb", "disqualifications")
+
+    def __init__(self, game_id: str, arena_id: str, stage: int, game_number: int,
+                 timestamp: datetime, teams: Interner,
+                 valuations: Dict[str, Dict[str, float]], auction_sequence: List[str]):
+        """
+        Create an empty record, to be filled with add_round() and set_team_usage().
+
+        Args:
+            game_id: Game identifier
+            arena_id: Arena identifier
+            stage: Competition stage
+            game_number: Game number within the stage
+            timestamp: Game start time
+            teams: Team interner, in agent order
+            valuations: {team_id: {item_id: valuation}}
+            auction_sequence: Item IDs in auction order
+        """
+        self.game_id = game_id
+        self.arena_id = arena_id
+        self.stage = stage
+        self.game_number = game_number
+        self.timestamp = timestamp
+        self.teams = teams
+        self.items = _item_interner(valuations)
+
+        num_teams, num_rounds = len(teams), len(auction_sequence)
+
+        self.sequence = np.array(self.items.indices(auction_sequence), dtype=np.int16)
+        self.valuations = np.full((num_teams, len(self.items)), np.nan)
+        for t, team_id in enumerate(teams):
+            valuation_vector = valuations[team_id]
+            self.valuations[t, self.items.indices(valuation_vector)] = list(valuation_vector.values())
+
+        self.bids = np.zeros((num_rounds, num_teams))
+        self.execution_times = np.zeros((num_rounds, num_teams))
+        self.winners = np.full(num_rounds, NO_WINNER, dtype=np.int16)
+        self.prices = np.zeros(num_rounds)
+        self.round_times = np.zeros(num_rounds, dtype=np.int64)
+        self.rounds_played = 0
+
+        self.cpu_time_seconds = np.full(num_teams, np.nan)
+        self.memory_peak_mb = np.full(num_teams, np.nan)
+        self.disqualifications: Dict[int, str] = {}
+
+    def add_round(self, bids: List[float], execution_times: List[float], winner: int,
+                  price_paid: float, timestamp: datetime):
+        """
+        Store the next round (rounds must be added in order).
+
+        Args:
+            bids: Validated bid per team index
+            execution_times: Bid execution time per team index
+            winner: Winning team index, NO_WINNER if none
+            price_paid: Price paid by the winner
+            timestamp: Round timestamp
+        """
+        r = self.rounds_played
+        self.bids[r] = bids
+        self.execution_times[r] = execution_times
+        self.winners[r] = winner
+        self.prices[r] = price_paid
+        self.round_times[r] = _to_micros(timestamp)
+        self.rounds_played += 1
+
+    def add_round_result(self, round_result: AuctionRoundResult):
+        """Store the next round given as an AuctionRoundResult"""
+        team_ids = self.teams.names
+        self.add_round(
+            bids=[round_result.all_bids[team_id] for team_id in team_ids],
+            execution_times=[round_result.execution_times[team_id] for team_id in team_ids],
+            winner=self.teams.index(round_result.winner_id) if round_result.winner_id else NO_WINNER,
+            price_paid=round_result.price_paid,
+            timestamp=round_result.timestamp
+        )
+
+    def set_team_usage(self, t: int, cpu_time_seconds: Optional[float] = None,
+                       memory_peak_mb: Optional[float] = None,
+                       disqualification: Optional[str] = None):
+        """Store the resource usage and disqualification reason, if any, of team index t"""
+        if cpu_time_seconds is not None:
+            self.cpu_time_seconds[t] = cpu_time_seconds
+        if memory_peak_mb is not None:
+            self.memory_peak_mb[t] = memory_peak_mb
+        if disqualification is not None:
+            self.disqualifications[t] = disqualification
+
+    @classmethod
+    def from_game_result(cls, game: GameResult) -> "GameRecord":
+        """Pack an existing GameResult"""
+        record = cls(
+            game_id=game.game_id,
+            arena_id=game.arena_id,
+            stage=game.stage,
+            game_number=game.game_number,
+            timestamp=game.timestamp,
+            teams=Interner(game.team_results),
+            valuations={team_id: tr.valuation_vector for team_id, tr in game.team_results.items()},
+            auction_sequence=game.auction_sequence
+        )
+        for round_result in game.auction_log:
+            record.add_round_result(round_result)
+        for t, tr in enumerate(game.team_results.values()):
+            record.set_team_usage(t, tr.cpu_time_seconds, tr.memory_peak_mb, tr.disqualification)
+        return record
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameRecord":
+        """Pack a stored game (GameResult.to_dict() layout)"""
+        return cls.from_game_result(GameResult.from_dict(data))
+
+    def to_game_result(self) -> GameResult:
+        """Unpack into the equivalent GameResult dataclasses"""
+        return GameResult(
+            game_id=self.game_id,
+            arena_id=self.arena_id,
+            stage=self.stage,
+            game_number=self.game_number,
+            timestamp=self.timestamp,
+            team_results={team_id: view.to_team_game_result() for team_id, view in self.team_results.items()},
+            auction_log=[view.to_auction_round_result() for view in self.auction_log],
+            auction_sequence=self.auction_sequence
+        )
+
+    @property
+    def team_ids(self) -> List[str]:
+        return self.teams.names
+
+    @property
+    def item_ids(self) -> List[str]:
+        return self.items.names
+
+    @property
+    def auction_sequence(self) -> List[str]:
+        return [self.items.name(i) for i in self.sequence.tolist()]
+
+    @property
+    def team_results(self) -> Dict[str, "TeamResultView"]:
+        return {team_id: TeamResultView(self, t) for t, team_id in enumerate(self.teams)}
+
+    @property
+    def auction_log(self) -> List["RoundResultView"]:
+        return [RoundResultView(self, r) for r in range(self.rounds_played)]
+
+    def to_dict(self) -> dict:
+        return {
+            "game_id": self.game_id,
+            "arena_id": self.arena_id,
+            "stage": self.stage,
+            "game_number": self.game_number,
+            "timestamp": self.timestamp.isoformat(),
+            "team_results": {tid: tr.to_dict() for tid, tr in self.team_results.items()},
+            "auction_log": [ar.to_dict() for ar in self.auction_log],
+            "auction_sequence": self.auction_sequence
+        }
+
+
+class RoundResultView:
+    """Read-only AuctionRoundResult interface onto one round of a GameRecord"""
+
+    __slots__ = ("_record", "_round")
+
+    def __init__(self, record: GameRecord, round_index: int):
+        self._record = record
+        self._round = round_index
+
+    @property
+    def round_number(self) -> int:
+        return self._round + 1
+
+    @property
+    def item_id(self) -> str:
+        return self._record.items.name(self._record.sequence[self._round])
+
+    @property
+    def winner_id(self) -> Optional[str]:
+        winner = int(self._record.winners[self._round])
+        return None if winner == NO_WINNER else self._record.teams.name(winner)
+
+    @property
+    def price_paid(self) -> float:
+        return float(self._record.prices[self._round])
+
+    @property
+    def all_bids(self) -> Dict[str, float]:
+        return dict(zip(self._record.team_ids, self._record.bids[self._round].tolist()))
+
+    @property
+    def timestamp(self) -> datetime:
+        return _from_micros(int(self._record.round_times[self._round]))
+
+    @property
+    def execution_times(self) -> Dict[str, float]:
+        return dict(zip(self._record.team_ids, self._record.execution_times[self._round].tolist()))
+
+    def to_auction_round_result(self) -> AuctionRoundResult:
+        return AuctionRoundResult(
+            round_number=self.round_number,
+            item_id=self.item_id,
+            winner_id=self.winner_id,
+            price_paid=self.price_paid,
+            all_bids=self.all_bids,
+            timestamp=self.timestamp,
+            execution_times=self.execution_times
+        )
+
+    def to_dict(self) -> dict:
+        return self.to_auction_round_result().to_dict()
+
+    def to_public_dict(self) -> dict:
+        """Public information only (for teams)"""
+        return {
+            "round_number": self.round_number,
+            "item_id": self.item_id,
+            "winner_id": self.winner_id,
+            "price_paid": self.price_paid
+        }
+
+
+class TeamResultView:
+    """Read-only TeamGameResult interface onto one team of a GameRecord"""
+
+    __slots__ = ("_record", "_team")
+
+    def __init__(self, record: GameRecord, team_index: int):
+        self._record = record
+        self._team = team_index
+
+    def _won_rounds(self) -> List[int]:
+        record = self._record
+        return np.flatnonzero(record.winners[:record.rounds_played] == self._team).tolist()
+
+    def _won_values(self) -> List[float]:
+        items = self._record.sequence[self._won_rounds()]
+        return self._record.valuations[self._team, items].tolist()
+
+    @property
+    def team_id(self) -> str:
+        return self._record.teams.name(self._team)
+
+    @property
+    def items_won(self) -> List[str]:
+        record = self._record
+        return [record.items.name(record.sequence[r]) for r in self._won_rounds()]
+
+    @property
+    def valuation_vector(self) -> Dict[str, float]:
+        values = self._record.valuations[self._team]
+        return {item_id: value for item_id, value in zip(self._record.item_ids, values.tolist())
+                if value == value}  # NaN: item not valued by this team
+
+    @property
+    def budget_remaining(self) -> float:
+        # Same sequence of subtractions as GameManager, so the result is identical
+        budget = INITIAL_BUDGET
+        for price in self._record.prices[self._won_rounds()].tolist():
+            budget -= price
+        return budget
+
+    @property
+    def budget_spent(self) -> float:
+        return INITIAL_BUDGET - self.budget_remaining
+
+    @property
+    def total_valuation_won(self) -> float:
+        return sum(self._won_values())
+
+    @property
+    def utility(self) -> float:
+        return self.total_valuation_won - self.budget_spent
+
+    @property
+    def max_single_item_utility(self) -> float:
+        return max(self._won_values(), default=0.0)
+
+    @property
+    def cpu_time_seconds(self) -> Optional[float]:
+        return _optional(self._record.cpu_time_seconds[self._team])
+
+    @property
+    def memory_peak_mb(self) -> Optional[float]:
+        return _optional(self._record.memory_peak_mb[self._team])
+
+    @property
+    def disqualification(self) -> Optional[str]:
+        return self._record.disqualifications.get(self._team)
+
+    def to_team_game_result(self) -> TeamGameResult:
+        return TeamGameResult(
+            team_id=self.team_id,
+            utility=self.utility,
+            budget_spent=self.budget_spent,
+            budget_remaining=self.budget_remaining,
+            items_won=self.items_won,
+            valuation_vector=self.valuation_vector,
+            max_single_item_utility=self.max_single_item_utility,
+            total_valuation_won=self.total_valuation_won,
+            cpu_time_seconds=self.cpu_time_seconds,
+            memory_peak_mb=self.memory_peak_mb,
+            disqualification=self.disqualification
+        )
+
+    def to_dict(self) -> dict:
+        return self.to_team_game_result().to_dict()
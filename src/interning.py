@@ -0,0 +1,63 @@
+"""
+Id Interning for AGT Competition
+Dense integer indices for the string ids of teams and items
+"""
+
+from typing import Dict, Iterable, Iterator, List
+
+from src.valuation_generator import ITEM_IDS
+
+
+class Interner:
+    """
+    Two-way mapping between string ids and dense indices 0..n-1.
+
+    The engine keeps per-team and per-item state in lists and arrays indexed by
+    these integers, and only converts back to strings at the agent boundary, in
+    log messages and when serializing results. Indices follow insertion order.
+    """
+
+    __slots__ = ("names", "_indices")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self._indices: Dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        """Index of name, assigning the next free one if it is new"""
+        index = self._indices.get(name)
+        if index is None:
+            index = self._indices[name] = len(self.names)
+            self.names.append(name)
+        return index
+
+    def index(self, name: str) -> int:
+        """Index of a known name (KeyError if unknown)"""
+        return self._indices[name]
+
+    def indices(self, names: Iterable[str]) -> List[int]:
+        return [self._indices[name] for name in names]
+
+    def name(self, index: int) -> str:
+        return self.names[index]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._indices
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __reduce__(self):
+        # The shared item interner unpickles as the module's instance, not a copy
+        if self is ITEM_INTERNER:
+            return "ITEM_INTERNER"
+        return Interner, (self.names,)
+
+
+# Every item of the competition, indexed as in ValuationBatch arrays
+ITEM_INTERNER = Interner(ITEM_IDS)
@@ -0,0 +1,137 @@
+"""
+Leaderboard for AGT Competition
+Incremental per-team aggregation of game results with the competition tiebreakers
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+from src.utils import GameResult
+
+
+class LeaderboardAccumulator:
+    """
+    Running per-team totals, updated as each game finishes.
+
+    add_game() costs O(teams) per game, so a leaderboard is available at any
+    time without rescanning stored games. Accumulators built in separate worker
+    processes (e.g. one per arena) can be combined with merge().
+
+    Teams are kept in first-seen order, which is the order the original
+    full-scan leaderboard used for entries that tie on every criterion. Merging
+    accumulators in game order whose teams are disjoint (such as arenas) gives
+    exactly the totals of a single sequential pass; for teams present in both,
+    the floating-point sums may differ in the last bits.
+    """
+
+    def __init__(self):
+        self._teams: Dict[str, dict] = {}
+        self.games_added = 0
+
+    @classmethod
+    def from_games(cls, games: Iterable[GameResult]) -> "LeaderboardAccumulator":
+        """Build an accumulator from already finished games"""
+        accumulator = cls()
+        for game in games:
+            accumulator.add_game(game)
+        return accumulator
+
+    def _entry(self, team_id: str) -> dict:
+        if team_id not in self._teams:
+            self._teams[team_id] = {
+                'team_id': team_id,
+                'total_utility': 0.0,
+                'max_single_item_utility': 0.0,
+                'total_items_won': 0,
+                'games_played': 0,
+                'total_spent': 0.0,
+                'total_valuation_won': 0.0
+            }
+        return self._teams[team_id]
+
+    def add_game(self, game: GameResult):
+        """
+        Add one game's team results to the totals.
+
+        Args:
+            game: Finished game
+        """
+        for team_id, team_result in game.team_results.items():
+            agg = self._entry(team_id)
+            agg['total_utility'] += team_result.utility
+            agg['max_single_item_utility'] = max(
+                agg['max_single_item_utility'],
+                team_result.max_single_item_utility
+            )
+            agg['total_items_won'] += len(team_result.items_won)
+            agg['games_played'] += 1
+            agg['total_spent'] += team_result.budget_spent
+            agg['total_valuation_won'] += team_result.total_valuation_won
+
+        self.games_added += 1
+
+    def merge(self, other: "LeaderboardAccumulator") -> "LeaderboardAccumulator":
+        """
+        Add another accumulator's totals into this one.
+
+        Args:
+            other: Accumulator covering games played after this one's
+
+        Returns:
+            self, for chaining
+        """
+        for team_id, other_agg in other._teams.items():
+            agg = self._entry(team_id)
+            agg['total_utility'] += other_agg['total_utility']
+            agg['max_single_item_utility'] = max(
+                agg['max_single_item_utility'],
+                other_agg['max_single_item_utility']
+            )
+            agg['total_items_won'] += other_agg['total_items_won']
+            agg['games_played'] += other_agg['games_played']
+            agg['total_spent'] += other_agg['total_spent']
+            agg['total_valuation_won'] += other_agg['total_valuation_won']
+
+        self.games_added += other.games_added
+        return self
+
+    def leaderboard(self, team_registration_times: Dict[str, datetime] = None) -> List[Dict]:
+        """
+        Rank teams with the competition tiebreakers.
+
+        Ranking criteria:
+        1. Total utility across all games
+        2. Highest single item utility captured
+        3. Most items won
+        4. Team registration timestamp (earliest wins)
+
+        Args:
+            team_registration_times: Optional dict of team_id -> registration time
+
+        Returns:
+            List of dicts with team rankings (fresh copies; the totals are not modified)
+        """
+        entries = [dict(agg) for agg in self._teams.values()]
+
+        for entry in entries:
+            if team_registration_times:
+                entry['registration_time'] = team_registration_times.get(
+                    entry['team_id'], datetime.max
+                ).timestamp()
+            else:
+                entry['registration_time'] = 0
+
+        leaderboard = sorted(
+            entries,
+            key=lambda x: (
+                -x['total_utility'],                    # Primary: highest utility
+                -x['max_single_item_utility'],          # Tiebreaker 1
+                -x['total_items_won'],                  # Tiebreaker 2
+                x['registration_time']                  # Tiebreaker 3: earliest
+            )
+        )
+
+        for rank, entry in enumerate(leaderboard, 1):
+            entry['rank'] = rank
+
+        return leaderboard
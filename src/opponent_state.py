@@ -0,0 +1,90 @@
+"""
+Opponent State for AGT Competition
+Opponents' budgets and spending, tracked by agents from the public round results
+"""
+
+from typing import List
+
+import numpy as np
+
+from src.config import INITIAL_BUDGET
+
+
+class OpponentTracker:
+    """
+    Remaining budget, items won and spending of every opponent in a game.
+
+    An agent learns the winner and the price of every round in
+    update_after_each_round; passing them on to update() keeps each opponent's
+    state in NumPy arrays indexed like opponent_teams. An update only touches
+    the winner's entries. The opponent with the largest remaining budget is
+    cached: budgets only go down, so it can only change when that opponent wins.
+
+    Bids are capped at the bidder's remaining budget (see
+    AuctionEngine.validate_bid), so max_feasible_bid() bounds any opponent's
+    bid, and with it the price paid when this agent wins.
+
+    Usage in an agent:
+        self.opponents = OpponentTracker(opponent_teams)          # __init__
+        self.opponents.update(winning_team, price_paid)           # update_after_each_round
+        ceiling = self.opponents.max_feasible_bid()               # bidding_function
+    """
+
+    __slots__ = ("team_ids", "initial_budget", "remaining", "items_won", "rounds_observed",
+                 "_indices", "_richest")
+
+    def __init__(self, opponent_teams: List[str], initial_budget: float = INITIAL_BUDGET):
+        """
+        Initialize tracker at the start of a game.
+
+        Args:
+            opponent_teams: Opponent team IDs, as passed to the agent
+            initial_budget: Budget every team starts the game with
+        """
+        self.team_ids = list(opponent_teams)
+        self.initial_budget = float(initial_budget)
+        self.remaining = np.full(len(self.team_ids), self.initial_budget)
+        self.items_won = np.zeros(len(self.team_ids), dtype=np.int32)
+        self.rounds_observed = 0
+
+        self._indices = {team_id: i for i, team_id in enumerate(self.team_ids)}
+        self._richest = 0
+
+    def update(self, winning_team: str, price_paid: float):
+        """
+        Record one round's public result.
+
+        Args:
+            winning_team: Team ID of the winner (empty string if no winner)
+            price_paid: Price the winner paid
+        """
+        self.rounds_observed += 1
+        i = self._indices.get(winning_team)
+        if i is None:  # no winner, or this agent won
+            return
+
+        self.remaining[i] -= price_paid
+        self.items_won[i] += 1
+        if i == self._richest:
+            self._richest = int(self.remaining.argmax())
+
+    def max_feasible_bid(self) -> float:
+        """Highest bid any opponent can still make (0 without opponents)"""
+        if not self.team_ids:
+            return 0.0
+        return self.remaining.item(self._richest)
+
+    def feasible_bidders(self, amount: float) -> int:
+        """Number of opponents that can still bid at least amount"""
+        return int(np.count_nonzero(self.remaining >= amount))
+
+    def remaining_budget(self, team_id: str) -> float:
+        return self.remaining.item(self._indices[team_id])
+
+    def spending_rates(self) -> np.ndarray:
+        """Budget spent per observed round, per opponent"""
+        return (self.initial_budget - self.remaining) / max(1, self.rounds_observed)
+
+    def spending_rate(self, team_id: str) -> float:
+        i = self._indices[team_id]
+        return (self.initial_budget - self.remaining.item(i)) / max(1, self.rounds_observed)
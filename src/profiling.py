@@ -0,0 +1,178 @@
+"""
+Latency Profiling for AGT Competition
+Streaming per-agent histograms of bid and update latencies
+"""
+
+import math
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Histogram resolution: buckets per power of two (bucket edges ~9% apart)
+BUCKETS_PER_OCTAVE = 8
+
+# Teams whose slowest call used at least this fraction of the timeout are flagged
+NEAR_TIMEOUT_FRACTION = 0.5
+
+# Operations profiled per agent
+OPERATIONS = ("bid", "update")
+
+
+def timed_call(func: Callable, *args) -> Tuple[object, Tuple[int, int]]:
+    """
+    Call func(*args) and measure it.
+
+    Returns:
+        Tuple of (result, (wall_ns, thread_cpu_ns)); exceptions propagate unmeasured
+    """
+    wall_start = time.perf_counter_ns()
+    cpu_start = time.thread_time_ns()
+    result = func(*args)
+    return result, (time.perf_counter_ns() - wall_start, time.thread_time_ns() - cpu_start)
+
+
+class LatencyHistogram:
+    """
+    Streaming histogram of durations in nanoseconds.
+
+    Values fall into logarithmic buckets, so memory stays bounded and
+    percentiles are accurate to one bucket width (~9%) whatever the number of
+    samples. Exact count, total and maximum are kept alongside.
+    """
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns: int):
+        index = math.floor(math.log2(value_ns) * BUCKETS_PER_OCTAVE) if value_ns > 0 else -1
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def merge(self, other: "LatencyHistogram"):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def percentile(self, q: float) -> int:
+        """
+        Approximate q-th percentile (0-100) in nanoseconds: the upper edge of the
+        bucket holding it, capped at the observed maximum.
+        """
+        if self.count == 0:
+            return 0
+
+        rank = math.ceil(q / 100 * self.count)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= max(rank, 1):
+                upper = 0 if index < 0 else 2 ** ((index + 1) / BUCKETS_PER_OCTAVE)
+                return min(int(upper), self.max_ns)
+        return self.max_ns
+
+
+class AgentProfile:
+    """Wall-clock and CPU latency histograms of one agent, per operation"""
+
+    def __init__(self):
+        self.wall = {operation: LatencyHistogram() for operation in OPERATIONS}
+        self.cpu = {operation: LatencyHistogram() for operation in OPERATIONS}
+        self.timeouts = {operation: 0 for operation in OPERATIONS}
+
+    def merge(self, other: "AgentProfile"):
+        for operation in OPERATIONS:
+            self.wall[operation].merge(other.wall[operation])
+            self.cpu[operation].merge(other.cpu[operation])
+            self.timeouts[operation] += other.timeouts[operation]
+
+
+class LatencyProfiler:
+    """
+    Per-team latency profiles collected by an AgentManager.
+
+    Wall time is measured around the agent call itself (in the worker process
+    or thread running it, so it excludes IPC and thread start-up), CPU time is
+    the calling thread's CPU time. Profilers from different arenas or worker
+    processes are combined with merge().
+    """
+
+    def __init__(self):
+        self.profiles: Dict[str, AgentProfile] = {}
+
+    def _profile(self, team_id: str) -> AgentProfile:
+        if team_id not in self.profiles:
+            self.profiles[team_id] = AgentProfile()
+        return self.profiles[team_id]
+
+    def record(self, team_id: str, operation: str, timing: Optional[Tuple[int, int]]):
+        """
+        Record one measured call.
+
+        Args:
+            team_id: Team whose agent was called
+            operation: "bid" or "update"
+            timing: (wall_ns, thread_cpu_ns) from timed_call, or None if unmeasured
+        """
+        if timing is None:
+            return
+        profile = self._profile(team_id)
+        profile.wall[operation].record(timing[0])
+        profile.cpu[operation].record(timing[1])
+
+    def record_timeout(self, team_id: str, operation: str, elapsed_ns: int):
+        """Record a call abandoned at the timeout (wall time as observed by the caller)"""
+        profile = self._profile(team_id)
+        profile.wall[operation].record(elapsed_ns)
+        profile.timeouts[operation] += 1
+
+    def merge(self, other: "LatencyProfiler") -> "LatencyProfiler":
+        for team_id, profile in other.profiles.items():
+            self._profile(team_id).merge(profile)
+        return self
+
+    def report(self, timeouts: Dict[str, float]) -> List[Dict]:
+        """
+        Per-team latency summary, slowest agents (closest to the timeout) first.
+
+        Args:
+            timeouts: Timeout in seconds of each operation, e.g.
+                {"bid": BID_TIMEOUT_SECONDS, "update": UPDATE_TIMEOUT_SECONDS};
+                each row's worst call is expressed as a fraction of its operation's
+
+        Returns:
+            List of dicts, one per (team, operation) with calls, timeouts, wall and
+            CPU mean/p50/p95/p99/max in milliseconds, and max_timeout_fraction
+        """
+        rows = []
+        for team_id, profile in self.profiles.items():
+            for operation in OPERATIONS:
+                wall, cpu = profile.wall[operation], profile.cpu[operation]
+                if wall.count == 0:
+                    continue
+
+                row = {
+                    'team_id': team_id,
+                    'operation': operation,
+                    'calls': wall.count,
+                    'timeouts': profile.timeouts[operation]
+                }
+                for label, histogram in (('wall', wall), ('cpu', cpu)):
+                    # Timed-out calls only have a wall time, so CPU may have no samples
+                    mean_ns = histogram.total_ns / histogram.count if histogram.count else 0
+                    row[f'{label}_mean_ms'] = round(mean_ns / 1e6, 3)
+                    for q in (50, 95, 99):
+                        row[f'{label}_p{q}_ms'] = round(histogram.percentile(q) / 1e6, 3)
+                    row[f'{label}_max_ms'] = round(histogram.max_ns / 1e6, 3)
+                row['max_timeout_fraction'] = round(wall.max_ns / 1e9 / timeouts[operation], 4)
+                rows.append(row)
+
+        rows.sort(key=lambda row: -row['max_timeout_fraction'])
+        return rows
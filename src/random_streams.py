@@ -0,0 +1,83 @@
+"""
+Random Streams for AGT Competition
+Independent, reproducible random generators per game and engine component
+"""
+
+import zlib
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# Component index appended to a game's seed key
+STREAM_VALUATIONS = 0
+STREAM_AUCTION_SEQUENCE = 1
+STREAM_TIE_BREAK = 2
+
+# Second spawn key component of a stage's arena assignment stream
+STREAM_ARENA_ASSIGNMENT = 0x41524E41
+
+
+def new_base_seed() -> int:
+    """Draw a fresh tournament seed from OS entropy (log it to reproduce the run)"""
+    return int(np.random.SeedSequence().entropy)
+
+
+def arena_key(arena_id: str) -> int:
+    """Stable integer key for an arena ID (Python's hash() is salted per process)"""
+    return zlib.crc32(arena_id.encode("utf-8"))
+
+
+def game_seed_sequence(base_seed: int, stage: int, arena_id: str, game_number: int,
+                       component: int) -> np.random.SeedSequence:
+    """
+    Seed sequence of one component of one game.
+
+    The (stage, arena, game, component) tuple is used as the spawn key under the
+    tournament seed, so every stream is statistically independent of the others
+    and depends only on its own coordinates, never on execution order.
+    """
+    return np.random.SeedSequence(
+        entropy=base_seed,
+        spawn_key=(stage, arena_key(arena_id), game_number, component)
+    )
+
+
+def arena_assignment_rng(base_seed: int, stage: int) -> np.random.Generator:
+    """Generator used to assign a stage's teams to arenas"""
+    return np.random.default_rng(np.random.SeedSequence(
+        entropy=base_seed,
+        spawn_key=(stage, STREAM_ARENA_ASSIGNMENT)
+    ))
+
+
+@dataclass
+class GameRandomStreams:
+    """Dedicated random generators for the engine components of one game"""
+    valuations: np.random.Generator
+    auction_sequence: np.random.Generator
+    tie_break: np.random.Generator
+
+    @classmethod
+    def for_game(cls, base_seed: int, stage: int, arena_id: str,
+                 game_number: int) -> "GameRandomStreams":
+        """
+        Build the streams of one game from the tournament seed.
+
+        Args:
+            base_seed: Tournament-level seed (e.g. --seed)
+            stage: Competition stage
+            arena_id: Arena identifier
+            game_number: Game number within the arena
+
+        Returns:
+            GameRandomStreams for that game
+        """
+        def make(component: int) -> np.random.Generator:
+            return np.random.default_rng(game_seed_sequence(base_seed, stage, arena_id, game_number, component))
+
+        return cls(
+            valuations=make(STREAM_VALUATIONS),
+            auction_sequence=make(STREAM_AUCTION_SEQUENCE),
+            tie_break=make(STREAM_TIE_BREAK)
+        )
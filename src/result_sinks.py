@@ -0,0 +1,305 @@
+"""
+Result Sinks for AGT Competition
+Storage backends for per-game results and a lazy loader for reading them back
+"""
+
+import glob
+import gzip
+import json
+import logging
+import os
+import re
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+from src.utils import GameResult, save_json_atomic
+
+
+logger = logging.getLogger(__name__)
+
+
+# Supported values of ResultsManager(result_format=...)
+RESULT_FORMATS = ("json", "jsonl", "jsonl.gz")
+
+# Games buffered in memory by JsonlSink before appending to disk (for bulk writes;
+# ResultsManager passes RESULT_BUFFER_GAMES so tournament games are checkpoints)
+DEFAULT_BUFFER_GAMES = 64
+
+DETAILED_JSONL = "games_detailed.jsonl"
+PUBLIC_JSONL = "games_public.jsonl"
+
+_GAME_FILE_PATTERN = re.compile(r"game_(\d+)_detailed\.json$")
+
+
+def arena_dir(output_dir: str, stage: int, arena_id: str) -> str:
+    """Directory holding the results of one arena"""
+    return os.path.join(output_dir, f"stage{stage}", f"arena_{arena_id}")
+
+
+def public_game_dict(game_result: GameResult) -> dict:
+    """Team-visible results of a game (winner + price per round only)"""
+    return {
+        "game_id": game_result.game_id,
+        "stage": game_result.stage,
+        "game_number": game_result.game_number,
+        "rounds": [round_result.to_public_dict() for round_result in game_result.auction_log]
+    }
+
+
+class ResultSink:
+    """Destination for finished games. Subclasses define the on-disk format."""
+
+    # Whether stage summaries must embed full games (False if the sink already keeps them)
+    embeds_games_in_stage = True
+
+    def write_game(self, game_result: GameResult):
+        raise NotImplementedError
+
+    def flush(self):
+        """Write out anything buffered in memory"""
+        pass
+
+
+class JsonFilesSink(ResultSink):
+    """
+    Original layout: one indented detailed file and one public file per game.
+
+    Files are replaced atomically and the detailed file is written last, so a
+    readable detailed file always marks a completely stored game.
+    """
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+
+    def write_game(self, game_result: GameResult):
+        directory = arena_dir(self.output_dir, game_result.stage, game_result.arena_id)
+        os.makedirs(directory, exist_ok=True)
+
+        team_filepath = os.path.join(directory, f"game_{game_result.game_number}_public.json")
+        save_json_atomic(public_game_dict(game_result), team_filepath)
+        logger.info(f"Saved public game results to {team_filepath}")
+
+        filepath = os.path.join(directory, f"game_{game_result.game_number}_detailed.json")
+        save_json_atomic(game_result.to_dict(), filepath)
+        logger.info(f"Saved detailed game results to {filepath}")
+
+
+class JsonlSink(ResultSink):
+    """
+    Append-only JSON Lines: one compact line per game in two files per arena,
+    games_detailed.jsonl and games_public.jsonl (with a .gz suffix if compressed).
+
+    Lines are buffered in memory and appended in batches, and files are only
+    open while appending. A pickled copy (e.g. sent to an arena worker process)
+    starts with empty buffers, so every game is written by exactly one process.
+    Each compressed batch is a separate gzip member, which gzip readers
+    transparently concatenate.
+
+    Every flush is fsynced, public lines before detailed ones, so a game found in
+    games_detailed is durably stored. A crash can at worst leave a damaged tail,
+    which readers skip and repair_jsonl() removes.
+    """
+
+    embeds_games_in_stage = False
+
+    def __init__(self, output_dir: str, compress: bool = False,
+                 buffer_games: int = DEFAULT_BUFFER_GAMES):
+        """
+        Args:
+            output_dir: Base results directory
+            compress: Gzip the JSONL files
+            buffer_games: Number of games kept in memory before appending to disk
+        """
+        self.output_dir = output_dir
+        self.compress = compress
+        self.buffer_games = buffer_games
+        self._pending: Dict[str, List[str]] = {}
+        self._pending_games = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pending"] = {}
+        state["_pending_games"] = 0
+        return state
+
+    def _path(self, directory: str, filename: str) -> str:
+        return os.path.join(directory, filename + (".gz" if self.compress else ""))
+
+    def write_game(self, game_result: GameResult):
+        directory = arena_dir(self.output_dir, game_result.stage, game_result.arena_id)
+        lines = (
+            (PUBLIC_JSONL, public_game_dict(game_result)),
+            (DETAILED_JSONL, game_result.to_dict()),
+        )
+        for filename, data in lines:
+            self._pending.setdefault(self._path(directory, filename), []).append(
+                json.dumps(data, separators=(",", ":")) + "\n"
+            )
+
+        self._pending_games += 1
+        if self._pending_games >= self.buffer_games:
+            self.flush()
+
+    def flush(self):
+        for path, lines in self._pending.items():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = "".join(lines).encode("utf-8")
+            if self.compress:
+                data = gzip.compress(data)
+            with open(path, "ab") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            logger.debug(f"Appended {len(lines)} games to {path}")
+
+        self._pending = {}
+        self._pending_games = 0
+
+
+def make_result_sink(result_format: str, output_dir: str,
+                     buffer_games: int = DEFAULT_BUFFER_GAMES) -> ResultSink:
+    """
+    Create the sink for a result format.
+
+    Args:
+        result_format: One of RESULT_FORMATS
+        output_dir: Base results directory
+        buffer_games: Games a JSONL sink keeps in memory before appending to disk
+
+    Returns:
+        ResultSink instance
+    """
+    if result_format == "json":
+        return JsonFilesSink(output_dir)
+    if result_format in ("jsonl", "jsonl.gz"):
+        return JsonlSink(output_dir, compress=result_format.endswith(".gz"), buffer_games=buffer_games)
+    raise ValueError(f"Unknown result format '{result_format}', expected one of {RESULT_FORMATS}")
+
+
+def _iter_jsonl(path: str, damage: Optional[list] = None) -> Iterator[dict]:
+    """
+    Yield the records of a JSONL file, skipping damaged lines and stopping at a
+    truncated gzip stream. Problems are logged and, if given, appended to damage.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    try:
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping damaged line {line_number} of {path}")
+                    if damage is not None:
+                        damage.append(line_number)
+    except (EOFError, OSError, zlib.error) as e:
+        logger.warning(f"{path} is truncated or damaged, ignoring the rest: {e}")
+        if damage is not None:
+            damage.append(e)
+
+
+def repair_jsonl(path: str) -> bool:
+    """
+    Rewrite a damaged JSONL file with only its readable records.
+
+    Needed before appending to a gzip file whose last member was cut off by a
+    crash, since readers cannot get past it to later members.
+
+    Returns:
+        True if the file was damaged and has been rewritten
+    """
+    damage = []
+    records = list(_iter_jsonl(path, damage))
+    if not damage:
+        return False
+
+    data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records).encode("utf-8")
+    if path.endswith(".gz"):
+        data = gzip.compress(data)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    logger.warning(f"Repaired {path}: kept {len(records)} readable records")
+    return True
+
+
+def repair_results(output_dir: str) -> int:
+    """
+    Repair every damaged JSONL result file under output_dir.
+
+    Returns:
+        Number of files rewritten
+    """
+    paths = []
+    for pattern in ("*.jsonl", "*.jsonl.gz"):
+        paths.extend(glob.glob(os.path.join(output_dir, "stage*", "arena_*", pattern)))
+    return sum(repair_jsonl(path) for path in sorted(paths))
+
+
+def _iter_arena_records(directory: str) -> Iterator[dict]:
+    """Yield the detailed game dicts stored in one arena directory, any format"""
+    for filename in (DETAILED_JSONL, DETAILED_JSONL + ".gz"):
+        path = os.path.join(directory, filename)
+        if os.path.exists(path):
+            yield from _iter_jsonl(path)
+
+    game_files = []
+    for path in glob.glob(os.path.join(directory, "game_*_detailed.json")):
+        match = _GAME_FILE_PATTERN.search(path)
+        if match:
+            game_files.append((int(match.group(1)), path))
+
+    for _, path in sorted(game_files):
+        try:
+            with open(path, "r") as f:
+                record = json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping damaged game file {path}")
+            continue
+        yield record
+
+
+def iter_game_records(output_dir: str, stage: Optional[int] = None,
+                      arena_id: Optional[str] = None) -> Iterator[dict]:
+    """
+    Lazily read stored games as plain dicts (GameResult.to_dict() layout).
+
+    Works for every result format, one game in memory at a time.
+
+    Args:
+        output_dir: Base results directory
+        stage: Only read this stage (all stages if None)
+        arena_id: Only read this arena (all arenas if None)
+
+    Yields:
+        Detailed game dicts, arena by arena
+    """
+    stage_pattern = f"stage{stage}" if stage is not None else "stage*"
+    arena_pattern = f"arena_{glob.escape(arena_id)}" if arena_id is not None else "arena_*"
+
+    for directory in sorted(glob.glob(os.path.join(output_dir, stage_pattern, arena_pattern))):
+        if os.path.isdir(directory):
+            yield from _iter_arena_records(directory)
+
+
+def iter_game_results(output_dir: str, stage: Optional[int] = None,
+                      arena_id: Optional[str] = None) -> Iterator[GameResult]:
+    """
+    Lazily reconstruct stored games as GameResult objects.
+
+    Args:
+        output_dir: Base results directory
+        stage: Only read this stage (all stages if None)
+        arena_id: Only read this arena (all arenas if None)
+
+    Yields:
+        GameResult objects, arena by arena
+    """
+    for record in iter_game_records(output_dir, stage, arena_id):
+        yield GameResult.from_dict(record)
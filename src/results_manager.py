@@ -7,17 +7,38 @@ import json
 import os
 import logging
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import pandas as pd
 
-from src.utils import GameResult, StageResult, save_json, format_utility
-from src.config import RESULTS_DIR, LOGS_DIR
+from src.utils import GameResult, StageResult, save_json, save_json_atomic, load_json, format_utility
+from src.config import RESULTS_DIR, LOGS_DIR, RESULT_FORMAT, RESULT_BUFFER_GAMES
+from src.game_record import GameRecord
+from src.result_sinks import make_result_sink, iter_game_results, repair_results
+from src.leaderboard import LeaderboardAccumulator
+from src.profiling import NEAR_TIMEOUT_FRACTION
 
 
 logger = logging.getLogger(__name__)
 
 
+# Written at the start of a run; identifies the seed and format to resume with
+MANIFEST_FILE = "run_manifest.json"
+
+
+def load_run_manifest(output_dir: str) -> Optional[dict]:
+    """
+    Load the manifest of a previous run in output_dir.
+    
+    Returns:
+        Manifest dict (seed, result_format, started), or None if there is none
+    """
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return None
+    return load_json(manifest_path)
+
+
 class ResultsManager:
     """
     Manages all competition results: logging, storage, and reporting.
@@ -30,15 +51,22 @@ class ResultsManager:
     - Generate analytics reports
     """
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, result_format: str = RESULT_FORMAT,
+                 buffer_games: int = RESULT_BUFFER_GAMES):
         """
         Initialize results manager.
         
         Args:
             output_dir: Base directory for results (default from config)
+            result_format: Per-game storage format: "json" (two indented files per
+                game), "jsonl" or "jsonl.gz" (append-only lines per arena)
+            buffer_games: Games a JSONL sink keeps in memory before appending them;
+                games still buffered when a run dies are replayed on resume
         """
         self.output_dir = output_dir if output_dir else RESULTS_DIR
         self.logs_dir = LOGS_DIR
+        self.result_format = result_format
+        self.sink = make_result_sink(result_format, self.output_dir, buffer_games)
         
         # Create directories
         os.makedirs(self.output_dir, exist_ok=True)
@@ -48,34 +76,56 @@ class ResultsManager:
         """
         Save complete game results (detailed for course staff).
         
+        Detailed and team-visible (winner + price only) results are both written
+        through the configured sink. With the default buffer_games=1 the game is
+        durably on disk when this returns.
+        
         Args:
             game_result: Complete game results
         """
-        # Create directory structure
-        stage_dir = os.path.join(self.output_dir, f"stage{game_result.stage}")
-        arena_dir = os.path.join(stage_dir, f"arena_{game_result.arena_id}")
-        os.makedirs(arena_dir, exist_ok=True)
-        
-        # Save full game results
-        filename = f"game_{game_result.game_number}_detailed.json"
-        filepath = os.path.join(arena_dir, filename)
-        
-        save_json(game_result.to_dict(), filepath)
-        logger.info(f"Saved detailed game results to {filepath}")
-        
-        # Save team-visible results (winner + price only)
-        team_visible_file = f"game_{game_result.game_number}_public.json"
-        team_filepath = os.path.join(arena_dir, team_visible_file)
-        
-        public_data = {
-            "game_id": game_result.game_id,
-            "stage": game_result.stage,
-            "game_number": game_result.game_number,
-            "rounds": [round_result.to_public_dict() for round_result in game_result.auction_log]
+        self.sink.write_game(game_result)
+    
+    def flush(self):
+        """Write out any game results still buffered by the sink"""
+        self.sink.flush()
+    
+    def write_manifest(self, seed: int):
+        """
+        Record what is needed to resume this run (see load_run_manifest).
+        
+        Args:
+            seed: Tournament seed every game's random streams derive from
+        """
+        manifest = {
+            "seed": seed,
+            "result_format": self.result_format,
+            "started": datetime.now().isoformat()
         }
+        save_json_atomic(manifest, os.path.join(self.output_dir, MANIFEST_FILE))
+    
+    def load_completed_games(self) -> Dict[Tuple[int, str, int], GameResult]:
+        """
+        Load the games already stored by an interrupted run.
+        
+        A game is a checkpoint once its sink has written it out: JSON files are
+        written as each game finishes, JSONL lines every buffer_games games (each
+        game by default). Games that were still buffered when the run died are not
+        found here and get replayed. Damaged JSONL tails left by a crash are
+        repaired first, so new games can be appended after them.
         
-        save_json(public_data, team_filepath)
-        logger.info(f"Saved public game results to {team_filepath}")
+        Returns:
+            Dictionary mapping (stage, arena_id, game_number) to a compact GameRecord
+        """
+        repaired = repair_results(self.output_dir)
+        if repaired:
+            logger.warning(f"Repaired {repaired} damaged result files in {self.output_dir}")
+        
+        completed = {}
+        for game in iter_game_results(self.output_dir):
+            completed[(game.stage, game.arena_id, game.game_number)] = GameRecord.from_game_result(game)
+        
+        logger.info(f"Found {len(completed)} completed games in {self.output_dir}")
+        return completed
     
     def save_stage_result(self, stage_result: StageResult):
         """
@@ -87,11 +137,14 @@ class ResultsManager:
         stage_dir = os.path.join(self.output_dir, f"stage{stage_result.stage}")
         os.makedirs(stage_dir, exist_ok=True)
         
-        # Save full stage results
+        # Make sure every game referenced by the stage is on disk
+        self.flush()
+        
+        # Save full stage results (games are only referenced by ID when the sink stores them)
         filename = f"stage{stage_result.stage}_complete.json"
         filepath = os.path.join(stage_dir, filename)
         
-        save_json(stage_result.to_dict(), filepath)
+        save_json(stage_result.to_dict(include_games=self.sink.embeds_games_in_stage), filepath)
         logger.info(f"Saved stage results to {filepath}")
         
         # Save leaderboard as CSV
@@ -102,11 +155,38 @@ class ResultsManager:
         df.to_csv(leaderboard_path, index=False)
         logger.info(f"Saved leaderboard to {leaderboard_path}")
     
+    def save_latency_report(self, stage: int, latency_report: List[Dict]):
+        """
+        Save the per-team agent latency report of a stage as CSV, next to the
+        leaderboard, and warn about agents that came close to a bid or update timeout.
+        
+        Args:
+            stage: Competition stage
+            latency_report: Rows from LatencyProfiler.report()
+        """
+        stage_dir = os.path.join(self.output_dir, f"stage{stage}")
+        os.makedirs(stage_dir, exist_ok=True)
+        
+        report_path = os.path.join(stage_dir, f"stage{stage}_latency.csv")
+        pd.DataFrame(latency_report).to_csv(report_path, index=False)
+        logger.info(f"Saved latency report to {report_path}")
+        
+        for row in latency_report:
+            if row['max_timeout_fraction'] >= NEAR_TIMEOUT_FRACTION or row['timeouts']:
+                logger.warning(
+                    f"Team {row['team_id']} {row['operation']}: slowest call {row['wall_max_ms']:.1f}ms "
+                    f"({row['max_timeout_fraction']:.0%} of {row['operation']} timeout), p99 {row['wall_p99_ms']:.1f}ms, "
+                    f"{row['timeouts']} timeouts"
+                )
+    
     def generate_leaderboard(self, arena_games: List[GameResult], 
                             team_registration_times: Dict[str, datetime] = None) -> List[Dict]:
         """
         Generate leaderboard from multiple games with proper tiebreakers.
         
+        Rescans every game; use a LeaderboardAccumulator to maintain a leaderboard
+        incrementally while games are played.
+        
         Ranking criteria:
         1. Total utility across all games
         2. Highest single item utility captured
@@ -120,68 +200,19 @@ class ResultsManager:
         Returns:
             List of dicts with team rankings
         """
-        # Aggregate results across all games
-        team_aggregates = {}
-        
-        for game in arena_games:
-            for team_id, team_result in game.team_results.items():
-                if team_id not in team_aggregates:
-                    team_aggregates[team_id] = {
-                        'team_id': team_id,
-                        'total_utility': 0.0,
-                        'max_single_item_utility': 0.0,
-                        'total_items_won': 0,
-                        'games_played': 0,
-                        'total_spent': 0.0,
-                        'total_valuation_won': 0.0
-                    }
-                
-                agg = team_aggregates[team_id]
-                agg['total_utility'] += team_result.utility
-                agg['max_single_item_utility'] = max(
-                    agg['max_single_item_utility'], 
-                    team_result.max_single_item_utility
-                )
-                agg['total_items_won'] += len(team_result.items_won)
-                agg['games_played'] += 1
-                agg['total_spent'] += team_result.budget_spent
-                agg['total_valuation_won'] += team_result.total_valuation_won
-        
-        # Add registration times if provided
-        if team_registration_times:
-            for team_id, agg in team_aggregates.items():
-                agg['registration_time'] = team_registration_times.get(
-                    team_id, datetime.max
-                ).timestamp()
-        else:
-            for agg in team_aggregates.values():
-                agg['registration_time'] = 0
-        
-        # Sort with tiebreakers
-        leaderboard = sorted(
-            team_aggregates.values(),
-            key=lambda x: (
-                -x['total_utility'],                    # Primary: highest utility
-                -x['max_single_item_utility'],          # Tiebreaker 1
-                -x['total_items_won'],                  # Tiebreaker 2
-                x['registration_time']                  # Tiebreaker 3: earliest
-            )
-        )
-        
-        # Add ranks
-        for rank, entry in enumerate(leaderboard, 1):
-            entry['rank'] = rank
-        
-        return leaderboard
+        return LeaderboardAccumulator.from_games(arena_games).leaderboard(team_registration_times)
     
     def generate_final_report(self, stage1_result: StageResult, 
-                             stage2_result: StageResult = None) -> str:
+                             stage2_result: StageResult = None,
+                             arena_leaderboards: Dict[str, List[Dict]] = None) -> str:
         """
         Generate final competition report.
         
         Args:
             stage1_result: Results from Stage 1
             stage2_result: Optional results from Stage 2
+            arena_leaderboards: Optional Stage 1 leaderboard per arena (recomputed
+                from the arena's games if not given)
         
         Returns:
             Path to generated report file
@@ -201,7 +232,10 @@ class ResultsManager:
         
         report_lines.append("Top Team from Each Arena (Advanced to Stage 2):")
         for arena_id, games in stage1_result.arena_results.items():
-            leaderboard = self.generate_leaderboard(games)
+            if arena_leaderboards and arena_id in arena_leaderboards:
+                leaderboard = arena_leaderboards[arena_id]
+            else:
+                leaderboard = self.generate_leaderboard(games)
             if leaderboard:
                 winner = leaderboard[0]
                 report_lines.append(
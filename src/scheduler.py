@@ -0,0 +1,164 @@
+"""
+Arena Scheduler for AGT Competition
+Balanced arena assignment and cost-based execution planning for a stage
+"""
+
+import heapq
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.config import ARENA_SIZE, SHUFFLE_ARENAS, T_AUCTION_ROUNDS
+from src.utils import Team
+
+
+logger = logging.getLogger(__name__)
+
+
+# Estimated seconds per round for a team with no measured latency, used when
+# no team has been measured at all (otherwise the median measured cost is used)
+DEFAULT_AGENT_COST_SECONDS = 1e-3
+
+
+def load_agent_costs(path: str) -> Dict[str, float]:
+    """
+    Estimated seconds per auction round of each team, from a previous run's
+    latency reports (see ResultsManager.save_latency_report).
+
+    A team's cost is its mean bid plus mean update wall time; reports written
+    before mean columns existed fall back to the medians.
+
+    Args:
+        path: A stageN_latency.csv file, or a results directory whose stage
+            reports are all read (a team measured in both stages is averaged)
+
+    Returns:
+        Dictionary mapping team_id to seconds per round
+    """
+    if os.path.isdir(path):
+        paths = [os.path.join(path, f"stage{stage}", f"stage{stage}_latency.csv") for stage in (1, 2)]
+        paths = [p for p in paths if os.path.exists(p)]
+    else:
+        paths = [path]
+
+    if not paths:
+        logger.warning(f"No latency reports found in {path}")
+        return {}
+
+    report = pd.concat([pd.read_csv(p) for p in paths], ignore_index=True)
+    column = 'wall_mean_ms' if 'wall_mean_ms' in report else 'wall_p50_ms'
+    per_operation = report.groupby(['team_id', 'operation'])[column].mean()
+    costs = per_operation.groupby(level='team_id').sum() / 1e3
+
+    logger.info(f"Loaded latency estimates for {len(costs)} teams from {', '.join(paths)}")
+    return {str(team_id): float(cost) for team_id, cost in costs.items()}
+
+
+def plan_execution(arena_costs: Dict[str, float], workers: int) -> Tuple[List[str], float]:
+    """
+    Longest-processing-time-first plan for running arenas on a worker pool.
+
+    A pool hands each queued arena to the first free worker, so submitting the
+    arenas from most to least expensive is exactly the LPT list schedule, whose
+    makespan is at most 4/3 of the optimum.
+
+    Args:
+        arena_costs: Estimated seconds per arena
+        workers: Number of worker processes
+
+    Returns:
+        Tuple of (arena_ids in submission order, estimated makespan in seconds)
+    """
+    order = sorted(arena_costs, key=lambda arena_id: -arena_costs[arena_id])
+    loads = [0.0] * max(1, workers)
+    for arena_id in order:
+        heapq.heapreplace(loads, loads[0] + arena_costs[arena_id])
+    return order, max(loads)
+
+
+class ArenaScheduler:
+    """
+    Assigns a stage's teams to arenas and plans the order arenas run in.
+
+    Teams are split into the fewest arenas of at most arena_size teams, with
+    sizes differing by at most one (13 teams give 5, 4, 4 rather than 5, 5, 3).
+    Before splitting, teams are put in team_id order and, with shuffle, in a
+    random order drawn from the stage's arena assignment stream, so the
+    assignment depends on the seed rather than on directory listing order.
+
+    An arena's cost is estimated as games x rounds x the summed per-round
+    latency of its agents. Costs only decide the order arenas run in (plan);
+    who plays whom never depends on them, so slow agents are neither grouped
+    nor split to save wall time. Fairness across assignments comes from
+    re-drawing them with new seeds (see montecarlo.py).
+    """
+
+    def __init__(self, agent_costs: Optional[Dict[str, float]] = None, workers: int = 1,
+                 arena_size: int = ARENA_SIZE, shuffle: bool = SHUFFLE_ARENAS):
+        """
+        Initialize arena scheduler.
+
+        Args:
+            agent_costs: Estimated seconds per round per team (see load_agent_costs)
+            workers: Number of worker processes running arenas
+            arena_size: Maximum teams per arena
+            shuffle: Shuffle teams before splitting them into arenas
+        """
+        self.agent_costs = agent_costs or {}
+        self.workers = max(1, workers)
+        self.arena_size = arena_size
+        self.shuffle = shuffle
+
+        measured = list(self.agent_costs.values())
+        self.default_cost = float(np.median(measured)) if measured else DEFAULT_AGENT_COST_SECONDS
+
+    def arena_sizes(self, num_teams: int) -> List[int]:
+        """Sizes of the fewest arenas holding num_teams, differing by at most one"""
+        num_arenas = -(-num_teams // self.arena_size)
+        base, extra = divmod(num_teams, num_arenas) if num_arenas else (0, 0)
+        return [base + 1] * extra + [base] * (num_arenas - extra)
+
+    def team_cost(self, team_id: str) -> float:
+        return self.agent_costs.get(team_id, self.default_cost)
+
+    def arena_cost(self, arena_teams: List[Team], num_games: int) -> float:
+        """Estimated seconds to play num_games games in an arena"""
+        return num_games * T_AUCTION_ROUNDS * sum(self.team_cost(team.team_id) for team in arena_teams)
+
+    def _split(self, teams: List[Team]) -> Dict[str, List[Team]]:
+        arenas = {}
+        start = 0
+        for a, size in enumerate(self.arena_sizes(len(teams))):
+            arenas[str(a + 1)] = teams[start:start + size]
+            start += size
+        return arenas
+
+    def assign(self, teams: List[Team], rng: np.random.Generator) -> Dict[str, List[Team]]:
+        """
+        Divide teams into balanced arenas.
+
+        Args:
+            teams: Teams of the stage
+            rng: The stage's arena assignment generator
+
+        Returns:
+            Dictionary mapping arena_id to list of teams
+        """
+        ordered = sorted(teams, key=lambda team: team.team_id)
+        if self.shuffle:
+            ordered = [ordered[i] for i in rng.permutation(len(ordered))]
+        return self._split(ordered)
+
+    def plan(self, arenas: Dict[str, List[Team]], num_games: int) -> Tuple[List[str], float]:
+        """
+        Order in which to submit arenas to the worker pool (see plan_execution).
+
+        Returns:
+            Tuple of (arena_ids in submission order, estimated makespan in seconds)
+        """
+        arena_costs = {arena_id: self.arena_cost(arena_teams, num_games)
+                       for arena_id, arena_teams in arenas.items()}
+        return plan_execution(arena_costs, self.workers)
@@ -3,30 +3,66 @@ Tournament Manager for AGT Competition
 Manages tournament stages and arenas
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import os
 
-from src.config import STAGE1_GAMES, STAGE2_GAMES, ARENA_SIZE
+from src.config import (STAGE1_GAMES, STAGE2_GAMES, AGENT_EXECUTION_MODE, ASYNC_MAX_CONCURRENT_GAMES,
+                        UPDATE_TIMEOUT_SECONDS)
 from src.game_manager import GameManager
 from src.valuation_generator import ValuationGenerator
 from src.auction_engine import AuctionEngine
 from src.agent_manager import AgentManager
+from src.async_agent_manager import AsyncAgentManager
+from src.async_game_manager import AsyncGameManager
 from src.results_manager import ResultsManager
+from src.leaderboard import LeaderboardAccumulator
+from src.profiling import LatencyProfiler
+from src.random_streams import GameRandomStreams, arena_assignment_rng, new_base_seed
+from src.scheduler import ArenaScheduler
 from src.utils import GameResult, StageResult, Team
 
 
 logger = logging.getLogger(__name__)
 
 
+def _run_arena_in_worker(arena_id: str, arena_teams: List[Team], stage: int, num_games: int,
+                         base_seed: int, results_manager: Optional[ResultsManager],
+                         timeout_seconds: float, execution_mode: str,
+                         completed_games: Dict[Tuple[int, str, int], GameResult],
+                         headless: bool = False
+                         ) -> Tuple[List[GameResult], LeaderboardAccumulator, LatencyProfiler]:
+    """
+    Process pool entry point: run all games of one arena in a worker process.
+    
+    Builds a sequential TournamentManager with the same base seed, so the arena's
+    games draw from exactly the random streams they would use in a sequential run.
+    
+    Returns:
+        Tuple of (game_results, the arena's leaderboard accumulator, its latency profiler)
+    """
+    tournament_manager = TournamentManager(
+        valuation_generator=ValuationGenerator(random_seed=base_seed),
+        results_manager=results_manager,
+        timeout_seconds=timeout_seconds,
+        execution_mode=execution_mode,
+        completed_games=completed_games,
+        headless=headless
+    )
+    game_results = tournament_manager.run_arena_games(arena_id, arena_teams, stage, num_games)
+    key = (stage, arena_id)
+    return game_results, tournament_manager.arena_accumulators[key], tournament_manager.arena_profilers[key]
+
+
 class TournamentManager:
     """
     Manages the complete tournament including both stages.
     
     Stage 1: Qualification Round
-    - Divide teams into 5-team arenas
+    - Divide teams into balanced arenas of at most 5 teams (see ArenaScheduler)
     - Run 5 games per arena
     - Top scorer from each arena advances
     
@@ -34,42 +70,93 @@ class TournamentManager:
     - All qualified teams in single arena
     - Run 5 games
     - Determine final rankings
+    
+    Arenas are independent, so with arena_workers > 1 Stage 1 arenas run in a
+    process pool, most expensive first by estimated agent latency. Every game
+    draws from its own random streams derived from (seed, stage, arena_id,
+    game_number), so games reproduce identically from the seed whatever order
+    or worker they run in. The same property lets a resumed run skip games
+    already stored by an interrupted one.
+    
+    With execution_mode "async" all games of a stage, across its arenas, are
+    interleaved on one asyncio event loop in this process (up to
+    max_concurrent_games at a time), with agents in line-protocol subprocesses
+    (see AsyncAgentManager); arena_workers is then not used.
+    
+    Without a results manager nothing is written to disk: stage results, arena
+    leaderboards and latency profiles are only kept on the manager (used for
+    replicated tournaments, see montecarlo.py).
     """
     
     def __init__(self, valuation_generator: ValuationGenerator,
-                 results_manager: ResultsManager,
-                 timeout_seconds: float = 2.0):
+                 results_manager: Optional[ResultsManager],
+                 timeout_seconds: float = 2.0,
+                 arena_workers: int = 1,
+                 execution_mode: str = AGENT_EXECUTION_MODE,
+                 completed_games: Dict[Tuple[int, str, int], GameResult] = None,
+                 headless: bool = False,
+                 agent_costs: Dict[str, float] = None,
+                 max_concurrent_games: int = ASYNC_MAX_CONCURRENT_GAMES):
         """
         Initialize tournament manager.
         
         Args:
             valuation_generator: Valuation generator instance
-            results_manager: Results manager instance
+            results_manager: Results manager instance, or None to keep results in memory only
             timeout_seconds: Timeout for agent bid execution
+            arena_workers: Number of worker processes for running arenas (1 = sequential)
+            execution_mode: Agent execution backend (see AgentManager), or "async"
+            completed_games: Games stored by an interrupted run with the same seed,
+                keyed by (stage, arena_id, game_number); they are reused instead of
+                replayed (see ResultsManager.load_completed_games)
+            headless: Run games without per-round logging (see GameManager)
+            agent_costs: Estimated seconds per round per team, from a previous
+                run's latency reports, for arena scheduling (see load_agent_costs)
+            max_concurrent_games: Games interleaved at once in "async" mode
         """
         self.valuation_generator = valuation_generator
         self.results_manager = results_manager
         self.timeout_seconds = timeout_seconds
+        self.arena_workers = max(1, arena_workers)
+        self.execution_mode = execution_mode
+        self.completed_games = completed_games or {}
+        self.headless = headless
+        self.max_concurrent_games = max(1, max_concurrent_games)
+        
+        # Per-game random streams derive from this seed; draw one if none was given
+        self.seed = valuation_generator.random_seed
+        if self.seed is None:
+            self.seed = new_base_seed()
+            logger.info(f"No seed given, using generated tournament seed {self.seed}")
+        
+        self.scheduler = ArenaScheduler(agent_costs=agent_costs, workers=self.arena_workers)
         
         self.stage1_results = None
         self.stage2_results = None
+        
+        # Running leaderboard totals per (stage, arena_id), updated as games finish
+        self.arena_accumulators: Dict[Tuple[int, str], LeaderboardAccumulator] = {}
+        self.stage1_arena_leaderboards: Dict[str, List[Dict]] = {}
+        # Agent latency profiles per (stage, arena_id)
+        self.arena_profilers: Dict[Tuple[int, str], LatencyProfiler] = {}
     
-    def create_arenas(self, teams: List[Team]) -> Dict[str, List[Team]]:
+    def create_arenas(self, teams: List[Team], stage: int = 1) -> Dict[str, List[Team]]:
         """
-        Divide teams into arenas of size ARENA_SIZE.
+        Divide teams into balanced arenas of at most ARENA_SIZE teams.
+        
+        The assignment is drawn from the stage's arena assignment stream, so it
+        is reproducible from the seed whatever order the teams are given in.
         
         Args:
             teams: List of Team objects
+            stage: Competition stage
         
         Returns:
             Dictionary mapping arena_id to list of teams
         """
-        arenas = {}
+        arenas = self.scheduler.assign(teams, arena_assignment_rng(self.seed, stage))
         
-        for i in range(0, len(teams), ARENA_SIZE):
-            arena_id = str(i // ARENA_SIZE + 1)
-            arena_teams = teams[i:i + ARENA_SIZE]
-            arenas[arena_id] = arena_teams
+        for arena_id, arena_teams in arenas.items():
             logger.info(f"Arena {arena_id}: {[t.team_id for t in arena_teams]}")
         
         return arenas
@@ -86,20 +173,36 @@ class TournamentManager:
             num_games: Number of games to run
         
         Returns:
-            List of GameResult objects
+            List of GameResult objects (the arena's leaderboard totals and agent
+            latencies are kept in arena_accumulators and arena_profilers)
         """
+        if self.execution_mode == "async":
+            return self.run_arenas({arena_id: arena_teams}, stage, num_games)[arena_id]
+        
         logger.info(f"=== Running Arena {arena_id} (Stage {stage}) ===")
         
         game_results = []
+        accumulator = LeaderboardAccumulator()
+        self.arena_accumulators[(stage, arena_id)] = accumulator
         
         # Prepare team_agents mapping
         team_agents = {team.team_id: team.agent_file_path for team in arena_teams}
         
+        # One agent manager per arena, so worker processes are reused across games
+        agent_manager = AgentManager(timeout_seconds=self.timeout_seconds,
+                                     execution_mode=self.execution_mode)
+        
         for game_num in range(1, num_games + 1):
+            stored_result = self._completed_game(stage, arena_id, game_num, team_agents)
+            if stored_result is not None:
+                game_results.append(stored_result)
+                accumulator.add_game(stored_result)
+                continue
+            
             try:
                 # Create fresh instances for each game
-                auction_engine = AuctionEngine()
-                agent_manager = AgentManager(timeout_seconds=self.timeout_seconds)
+                random_streams = GameRandomStreams.for_game(self.seed, stage, arena_id, game_num)
+                auction_engine = AuctionEngine(rng=random_streams.tie_break)
                 
                 game_manager = GameManager(
                     stage=stage,
@@ -107,21 +210,194 @@ class TournamentManager:
                     game_number=game_num,
                     valuation_generator=self.valuation_generator,
                     auction_engine=auction_engine,
-                    agent_manager=agent_manager
+                    agent_manager=agent_manager,
+                    random_streams=random_streams,
+                    headless=self.headless
                 )
                 
                 # Run the game
                 game_result = game_manager.run_game(team_agents)
                 game_results.append(game_result)
+                accumulator.add_game(game_result)
                 
                 # Save game results
-                self.results_manager.save_game_result(game_result)
+                if self.results_manager is not None:
+                    self.results_manager.save_game_result(game_result)
                 
             except Exception as e:
                 logger.error(f"Error running game {game_num} in arena {arena_id}: {e}", exc_info=True)
         
+        agent_manager.shutdown()
+        self.arena_profilers[(stage, arena_id)] = agent_manager.profiler
+        # Arena workers must write out buffered results before returning
+        if self.results_manager is not None:
+            self.results_manager.flush()
+        
         return game_results
     
+    def _completed_game(self, stage: int, arena_id: str, game_num: int,
+                        team_agents: Dict[str, str]) -> Optional[GameResult]:
+        """
+        Stored result of a game finished by an interrupted run, if it can be reused.
+        
+        Games are fully determined by the seed and their coordinates, so a stored
+        game played by the same teams is exactly what replaying it would produce.
+        """
+        stored_result = self.completed_games.get((stage, arena_id, game_num))
+        if stored_result is None:
+            return None
+        
+        if set(stored_result.team_results) != set(team_agents):
+            logger.warning(f"Stored game {stored_result.game_id} was played by different teams, replaying it")
+            return None
+        
+        logger.info(f"Game {game_num} in arena {arena_id} already completed, reusing stored result")
+        return stored_result
+    
+    def run_arenas(self, arenas: Dict[str, List[Team]], stage: int,
+                   num_games: int) -> Dict[str, List[GameResult]]:
+        """
+        Run all games for several arenas, in parallel if arena_workers > 1.
+        
+        Args:
+            arenas: Dictionary mapping arena_id to list of teams
+            stage: Competition stage (1 or 2)
+            num_games: Number of games per arena
+        
+        Returns:
+            Dictionary mapping arena_id to list of GameResult objects, in arena order
+        """
+        if self.execution_mode == "async":
+            return asyncio.run(self._run_arenas_async(arenas, stage, num_games))
+        
+        if self.arena_workers == 1 or len(arenas) <= 1:
+            return {
+                arena_id: self.run_arena_games(arena_id, arena_teams, stage, num_games)
+                for arena_id, arena_teams in arenas.items()
+            }
+        
+        num_workers = min(self.arena_workers, len(arenas))
+        # Submitting the most expensive arenas first minimizes the stage makespan
+        order, makespan = self.scheduler.plan(arenas, num_games)
+        logger.info(f"Running {len(arenas)} arenas on {num_workers} worker processes "
+                    f"(estimated agent time {makespan:.3f}s)")
+        
+        completed = {}
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = {
+                executor.submit(
+                    _run_arena_in_worker, arena_id, arenas[arena_id], stage, num_games,
+                    self.seed, self.results_manager, self.timeout_seconds, self.execution_mode,
+                    {key: game for key, game in self.completed_games.items() if key[:2] == (stage, arena_id)},
+                    self.headless
+                ): arena_id
+                for arena_id in order
+            }
+            
+            for future in as_completed(futures):
+                arena_id = futures[future]
+                try:
+                    key = (stage, arena_id)
+                    completed[arena_id], self.arena_accumulators[key], self.arena_profilers[key] = future.result()
+                    logger.info(f"Arena {arena_id} finished ({len(completed)}/{len(arenas)})")
+                except Exception as e:
+                    logger.error(f"Arena {arena_id} worker failed: {e}", exc_info=True)
+                    completed[arena_id] = []
+                    self.arena_accumulators[(stage, arena_id)] = LeaderboardAccumulator()
+                    self.arena_profilers[(stage, arena_id)] = LatencyProfiler()
+        
+        # Merge back in arena order so downstream results match a sequential run
+        return {arena_id: completed[arena_id] for arena_id in arenas}
+    
+    async def _run_arenas_async(self, arenas: Dict[str, List[Team]], stage: int,
+                                num_games: int) -> Dict[str, List[GameResult]]:
+        """
+        Play every game of several arenas interleaved on the running event loop.
+        
+        Games start in arena schedule order (most expensive arenas first) as
+        slots free up. Each game is saved as it finishes; leaderboards are
+        accumulated afterwards in game order, so totals match a sequential run.
+        Each arena has its own AsyncAgentManager: a disqualification applies to
+        the arena's games that load agents after it.
+        
+        Returns:
+            Dictionary mapping arena_id to list of GameResult objects, in arena order
+        """
+        slots = asyncio.Semaphore(self.max_concurrent_games)
+        agent_managers = {arena_id: AsyncAgentManager(timeout_seconds=self.timeout_seconds)
+                          for arena_id in arenas}
+        
+        async def play(arena_id: str, team_agents: Dict[str, str], game_num: int) -> Optional[GameResult]:
+            stored_result = self._completed_game(stage, arena_id, game_num, team_agents)
+            if stored_result is not None:
+                return stored_result
+            
+            async with slots:
+                try:
+                    random_streams = GameRandomStreams.for_game(self.seed, stage, arena_id, game_num)
+                    game_manager = AsyncGameManager(
+                        stage=stage,
+                        arena_id=arena_id,
+                        game_number=game_num,
+                        valuation_generator=self.valuation_generator,
+                        auction_engine=AuctionEngine(rng=random_streams.tie_break),
+                        agent_manager=agent_managers[arena_id],
+                        random_streams=random_streams,
+                        headless=self.headless
+                    )
+                    game_result = await game_manager.run_game_async(team_agents)
+                except Exception as e:
+                    logger.error(f"Error running game {game_num} in arena {arena_id}: {e}", exc_info=True)
+                    return None
+            
+            if self.results_manager is not None:
+                self.results_manager.save_game_result(game_result)
+            return game_result
+        
+        order, _ = self.scheduler.plan(arenas, num_games)
+        logger.info(f"Running {len(arenas) * num_games} games of {len(arenas)} arenas on one event loop "
+                    f"(up to {self.max_concurrent_games} at a time)")
+        
+        # Game-major order: with few slots, every arena gets one game going first
+        tasks = {}
+        for game_num in range(1, num_games + 1):
+            for arena_id in order:
+                team_agents = {team.team_id: team.agent_file_path for team in arenas[arena_id]}
+                tasks[(arena_id, game_num)] = asyncio.ensure_future(play(arena_id, team_agents, game_num))
+        
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            await asyncio.gather(*(agent_manager.shutdown() for agent_manager in agent_managers.values()))
+        
+        completed = {}
+        for arena_id in arenas:
+            games = [tasks[(arena_id, game_num)].result() for game_num in range(1, num_games + 1)]
+            completed[arena_id] = [game for game in games if game is not None]
+            self.arena_accumulators[(stage, arena_id)] = LeaderboardAccumulator.from_games(completed[arena_id])
+            self.arena_profilers[(stage, arena_id)] = agent_managers[arena_id].profiler
+        
+        if self.results_manager is not None:
+            self.results_manager.flush()
+        
+        return completed
+    
+    def save_latency_report(self, stage: int, arena_ids):
+        """
+        Merge the agent latency profiles of a stage's arenas and save the report.
+        
+        Args:
+            stage: Competition stage
+            arena_ids: Arenas of the stage
+        """
+        if self.results_manager is None:
+            return
+        stage_profiler = LatencyProfiler()
+        for arena_id in arena_ids:
+            stage_profiler.merge(self.arena_profilers.get((stage, arena_id), LatencyProfiler()))
+        timeouts = {"bid": self.timeout_seconds, "update": UPDATE_TIMEOUT_SECONDS}
+        self.results_manager.save_latency_report(stage, stage_profiler.report(timeouts))
+    
     def run_stage1(self, teams: List[Team]) -> Tuple[StageResult, List[Team]]:
         """
         Run Stage 1: Qualification Round.
@@ -137,25 +413,21 @@ class TournamentManager:
         logger.info("=" * 80)
         
         # Create arenas
-        arenas = self.create_arenas(teams)
+        arenas = self.create_arenas(teams, stage=1)
         
-        # Run games for each arena (sequential as per design decision)
-        arena_results = {}
+        # Run games for each arena (in parallel when arena_workers > 1)
+        arena_results = self.run_arenas(arenas, stage=1, num_games=STAGE1_GAMES)
         arena_winners = []
+        stage_accumulator = LeaderboardAccumulator()
         
         for arena_id, arena_teams in arenas.items():
-            game_results = self.run_arena_games(
-                arena_id=arena_id,
-                arena_teams=arena_teams,
-                stage=1,
-                num_games=STAGE1_GAMES
-            )
-            
-            arena_results[arena_id] = game_results
+            arena_accumulator = self.arena_accumulators[(1, arena_id)]
+            stage_accumulator.merge(arena_accumulator)
             
             # Determine arena winner
             team_reg_times = {team.team_id: team.registration_timestamp for team in arena_teams}
-            leaderboard = self.results_manager.generate_leaderboard(game_results, team_reg_times)
+            leaderboard = arena_accumulator.leaderboard(team_reg_times)
+            self.stage1_arena_leaderboards[arena_id] = leaderboard
             
             if leaderboard:
                 winner_id = leaderboard[0]['team_id']
@@ -164,9 +436,8 @@ class TournamentManager:
                 logger.info(f"Arena {arena_id} Winner: {winner_id} (Utility: {leaderboard[0]['total_utility']:.2f})")
         
         # Generate overall Stage 1 leaderboard
-        all_games = [game for games in arena_results.values() for game in games]
         all_team_reg_times = {team.team_id: team.registration_timestamp for team in teams}
-        overall_leaderboard = self.results_manager.generate_leaderboard(all_games, all_team_reg_times)
+        overall_leaderboard = stage_accumulator.leaderboard(all_team_reg_times)
         
         # Create stage result
         stage_result = StageResult(
@@ -177,7 +448,9 @@ class TournamentManager:
         )
         
         # Save stage results
-        self.results_manager.save_stage_result(stage_result)
+        if self.results_manager is not None:
+            self.results_manager.save_stage_result(stage_result)
+        self.save_latency_report(1, arenas)
         self.stage1_results = stage_result
         
         logger.info("=" * 80)
@@ -212,7 +485,7 @@ class TournamentManager:
         
         # Generate final leaderboard
         team_reg_times = {team.team_id: team.registration_timestamp for team in qualified_teams}
-        final_leaderboard = self.results_manager.generate_leaderboard(game_results, team_reg_times)
+        final_leaderboard = self.arena_accumulators[(2, arena_id)].leaderboard(team_reg_times)
         
         # Create stage result
         stage_result = StageResult(
@@ -223,7 +496,9 @@ class TournamentManager:
         )
         
         # Save stage results
-        self.results_manager.save_stage_result(stage_result)
+        if self.results_manager is not None:
+            self.results_manager.save_stage_result(stage_result)
+        self.save_latency_report(2, [arena_id])
         self.stage2_results = stage_result
         
         # Display final results
@@ -262,7 +537,9 @@ class TournamentManager:
         stage2_result = self.run_stage2(qualified_teams)
         
         # Generate final report
-        self.results_manager.generate_final_report(stage1_result, stage2_result)
+        if self.results_manager is not None:
+            self.results_manager.generate_final_report(stage1_result, stage2_result,
+                                                       arena_leaderboards=self.stage1_arena_leaderboards)
         
         logger.info("=" * 80)
         logger.info("🏆 TOURNAMENT COMPLETE 🏆")
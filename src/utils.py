@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Optional
 import json
+import os
 
 
 @dataclass
@@ -49,6 +50,18 @@ class AuctionRoundResult:
             "execution_times": self.execution_times
         }
     
+    @classmethod
+    def from_dict(cls, data: dict) -> "AuctionRoundResult":
+        return cls(
+            round_number=data["round_number"],
+            item_id=data["item_id"],
+            winner_id=data["winner_id"],
+            price_paid=data["price_paid"],
+            all_bids=data["all_bids"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            execution_times=data["execution_times"]
+        )
+    
     def to_public_dict(self) -> dict:
         """Public information only (for teams)"""
         return {
@@ -70,6 +83,10 @@ class TeamGameResult:
     valuation_vector: Dict[str, float]
     max_single_item_utility: float
     total_valuation_won: float
+    # Resource usage in this game (None unless the agent ran in a worker process)
+    cpu_time_seconds: Optional[float] = None
+    memory_peak_mb: Optional[float] = None
+    disqualification: Optional[str] = None  # Reason, if the agent exceeded a resource limit
     
     def to_dict(self) -> dict:
         return {
@@ -81,8 +98,27 @@ class TeamGameResult:
             "valuation_vector": self.valuation_vector,
             "max_single_item_utility": self.max_single_item_utility,
             "total_valuation_won": self.total_valuation_won,
-            "num_items_won": len(self.items_won)
+            "num_items_won": len(self.items_won),
+            "cpu_time_seconds": self.cpu_time_seconds,
+            "memory_peak_mb": self.memory_peak_mb,
+            "disqualification": self.disqualification
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "TeamGameResult":
+        return cls(
+            team_id=data["team_id"],
+            utility=data["utility"],
+            budget_spent=data["budget_spent"],
+            budget_remaining=data["budget_remaining"],
+            items_won=data["items_won"],
+            valuation_vector=data["valuation_vector"],
+            max_single_item_utility=data["max_single_item_utility"],
+            total_valuation_won=data["total_valuation_won"],
+            cpu_time_seconds=data.get("cpu_time_seconds"),
+            memory_peak_mb=data.get("memory_peak_mb"),
+            disqualification=data.get("disqualification")
+        )
 
 
 @dataclass
@@ -108,6 +144,19 @@ class GameResult:
             "auction_log": [ar.to_dict() for ar in self.auction_log],
             "auction_sequence": self.auction_sequence
         }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameResult":
+        return cls(
+            game_id=data["game_id"],
+            arena_id=data["arena_id"],
+            stage=data["stage"],
+            game_number=data["game_number"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            team_results={tid: TeamGameResult.from_dict(tr) for tid, tr in data["team_results"].items()},
+            auction_log=[AuctionRoundResult.from_dict(ar) for ar in data["auction_log"]],
+            auction_sequence=data["auction_sequence"]
+        )
 
 
 @dataclass
@@ -118,11 +167,16 @@ class StageResult:
     leaderboard: List[Dict]
     timestamp: datetime
     
-    def to_dict(self) -> dict:
+    def to_dict(self, include_games: bool = True) -> dict:
+        """
+        Args:
+            include_games: Embed full games; if False, list only their game IDs
+                (for result formats that already store every game)
+        """
         return {
             "stage": self.stage,
             "arena_results": {
-                arena_id: [game.to_dict() for game in games]
+                arena_id: [game.to_dict() if include_games else game.game_id for game in games]
                 for arena_id, games in self.arena_results.items()
             },
             "leaderboard": self.leaderboard,
@@ -142,12 +196,30 @@ def format_utility(utility: float) -> str:
 
 def save_json(data: dict, filepath: str) -> None:
     """Save data to JSON file"""
-    import os
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=2)
 
 
+def save_json_atomic(data: dict, filepath: str) -> None:
+    """Save data to JSON file via a temporary file, so a crash never leaves a partial file"""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+
+
+def json_default(value):
+    """json.dumps default for values json does not know: NumPy scalars as floats, anything else as str"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
 def load_json(filepath: str) -> dict:
     """Load data from JSON file"""
     with open(filepath, 'r') as f:
@@ -4,13 +4,91 @@ Generates item valuations according to competition rules
 """
 
 import numpy as np
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
 from src.config import (
     K_TOTAL_ITEMS, HIGH_VALUE_ITEMS, LOW_VALUE_ITEMS, MIXED_VALUE_ITEMS,
-    HIGH_VALUE_RANGE, LOW_VALUE_RANGE, MIXED_VALUE_RANGE, ITEM_ID_FORMAT, RANDOM_SEED
+    HIGH_VALUE_RANGE, LOW_VALUE_RANGE, MIXED_VALUE_RANGE, ITEM_ID_FORMAT, RANDOM_SEED,
+    T_AUCTION_ROUNDS
 )
 
 
+# Item category codes used by batched generation
+CATEGORY_HIGH = 0
+CATEGORY_LOW = 1
+CATEGORY_MIXED = 2
+
+ITEM_IDS = [ITEM_ID_FORMAT.format(i) for i in range(K_TOTAL_ITEMS)]
+
+# Value range lower bound and width per category code
+_CATEGORY_LOW_BOUNDS = np.array([HIGH_VALUE_RANGE[0], LOW_VALUE_RANGE[0], MIXED_VALUE_RANGE[0]], dtype=np.float64)
+_CATEGORY_WIDTHS = np.array([
+    HIGH_VALUE_RANGE[1] - HIGH_VALUE_RANGE[0],
+    LOW_VALUE_RANGE[1] - LOW_VALUE_RANGE[0],
+    MIXED_VALUE_RANGE[1] - MIXED_VALUE_RANGE[0]
+], dtype=np.float64)
+
+# Category of the item at each position of a random permutation of all items
+_CATEGORY_BY_RANK = np.repeat(
+    np.array([CATEGORY_HIGH, CATEGORY_LOW, CATEGORY_MIXED], dtype=np.int8),
+    [HIGH_VALUE_ITEMS, LOW_VALUE_ITEMS, MIXED_VALUE_ITEMS]
+)
+
+
+@dataclass
+class ValuationBatch:
+    """
+    Pre-generated inputs for many games of one arena, stored as NumPy arrays.
+    
+    Item and team axes follow ITEM_IDS and team_ids. The accessor methods convert
+    one game back into the dict/list shapes used by GameManager and the agents.
+    """
+    team_ids: List[str]
+    values: np.ndarray             # (n_games, n_teams, K) valuations
+    categories: np.ndarray         # (n_games, K) category code per item
+    auction_sequences: np.ndarray  # (n_games, T) item indices in auction order
+    
+    @property
+    def num_games(self) -> int:
+        return self.values.shape[0]
+    
+    def category_mask(self, category: int) -> np.ndarray:
+        """(n_games, K) boolean mask of items in the given category"""
+        return self.categories == category
+    
+    def valuation_vector(self, game: int, team_index: int) -> Dict[str, float]:
+        """Valuation vector of one team in one game, as handed to agents"""
+        return dict(zip(ITEM_IDS, self.values[game, team_index].tolist()))
+    
+    def arena_valuations(self, game: int) -> Dict[str, Dict[str, float]]:
+        """Valuations of all teams in one game: {team_id: {item_id: valuation}}"""
+        rows = self.values[game].tolist()
+        return {team_id: dict(zip(ITEM_IDS, row)) for team_id, row in zip(self.team_ids, rows)}
+    
+    def item_categories(self, game: int) -> Tuple[List[str], List[str], List[str]]:
+        """(high_items, low_items, mixed_items) of one game"""
+        codes = self.categories[game]
+        return tuple(
+            [ITEM_IDS[i] for i in np.flatnonzero(codes == category)]
+            for category in (CATEGORY_HIGH, CATEGORY_LOW, CATEGORY_MIXED)
+        )
+    
+    def auction_sequence(self, game: int) -> List[str]:
+        """Auction sequence of one game as item IDs"""
+        return [ITEM_IDS[i] for i in self.auction_sequences[game].tolist()]
+    
+    def game_inputs(self, game: int) -> Tuple[Dict[str, Dict[str, float]],
+                                              Tuple[List[str], List[str], List[str]],
+                                              List[str]]:
+        """
+        All inputs of one game, in the shape GameManager.initialize_game accepts.
+        
+        Returns:
+            Tuple of (valuations_dict, item_categories, auction_sequence)
+        """
+        return self.arena_valuations(game), self.item_categories(game), self.auction_sequence(game)
+
+
 class ValuationGenerator:
     """
     Generates valuation vectors for teams according to competition specifications.
@@ -29,23 +107,29 @@ class ValuationGenerator:
             random_seed: Optional seed for reproducibility
         """
         self.random_seed = random_seed if random_seed is not None else RANDOM_SEED
-        if self.random_seed is not None:
-            np.random.seed(self.random_seed)
+        
+        # Dedicated generator used when no per-game stream is given; the global
+        # np.random state is never touched, so agents using it cannot perturb games
+        self.rng = np.random.default_rng(self.random_seed)
         
         # Verify configuration
         assert HIGH_VALUE_ITEMS + LOW_VALUE_ITEMS + MIXED_VALUE_ITEMS == K_TOTAL_ITEMS, \
             "Item categories must sum to K_TOTAL_ITEMS"
     
-    def _generate_item_categories(self) -> Tuple[List[str], List[str], List[str]]:
+    def _generate_item_categories(self, rng: np.random.Generator = None) -> Tuple[List[str], List[str], List[str]]:
         """
         Randomly assign items to categories (high, low, mixed).
         This is done once per game so all teams have consistent categorization.
         
+        Args:
+            rng: Random generator to draw from (default self.rng)
+        
         Returns:
             Tuple of (high_value_items, low_value_items, mixed_value_items)
         """
-        all_items = [ITEM_ID_FORMAT.format(i) for i in range(K_TOTAL_ITEMS)]
-        np.random.shuffle(all_items)
+        rng = rng if rng is not None else self.rng
+        all_items = list(ITEM_IDS)
+        rng.shuffle(all_items)
         
         high_value_items = all_items[:HIGH_VALUE_ITEMS]
         low_value_items = all_items[HIGH_VALUE_ITEMS:HIGH_VALUE_ITEMS + LOW_VALUE_ITEMS]
@@ -56,7 +140,8 @@ class ValuationGenerator:
     def generate_valuation_vector(self, team_id: str, 
                                   high_items: List[str],
                                   low_items: List[str],
-                                  mixed_items: List[str]) -> Dict[str, float]:
+                                  mixed_items: List[str],
+                                  rng: np.random.Generator = None) -> Dict[str, float]:
         """
         Generate a valuation vector for a single team.
         
@@ -65,34 +150,38 @@ class ValuationGenerator:
             high_items: List of item IDs that are high-value for all teams
             low_items: List of item IDs that are low-value for all teams
             mixed_items: List of item IDs with mixed values
+            rng: Random generator to draw from (default self.rng)
         
         Returns:
             Dictionary mapping item_id to valuation
         """
+        rng = rng if rng is not None else self.rng
         valuation_vector = {}
         
         # High-value items (same items for all teams, but different values)
         for item_id in high_items:
-            valuation_vector[item_id] = np.random.uniform(*HIGH_VALUE_RANGE)
+            valuation_vector[item_id] = rng.uniform(*HIGH_VALUE_RANGE)
         
         # Low-value items (same items for all teams, but different values)
         for item_id in low_items:
-            valuation_vector[item_id] = np.random.uniform(*LOW_VALUE_RANGE)
+            valuation_vector[item_id] = rng.uniform(*LOW_VALUE_RANGE)
         
         # Mixed-value items (can be high or low for different teams)
         for item_id in mixed_items:
-            valuation_vector[item_id] = np.random.uniform(*MIXED_VALUE_RANGE)
+            valuation_vector[item_id] = rng.uniform(*MIXED_VALUE_RANGE)
         
         return valuation_vector
     
-    def generate_arena_valuations(self, team_ids: List[str]) -> Tuple[Dict[str, Dict[str, float]], 
-                                                                       Tuple[List[str], List[str], List[str]]]:
+    def generate_arena_valuations(self, team_ids: List[str],
+                                  rng: np.random.Generator = None) -> Tuple[Dict[str, Dict[str, float]], 
+                                                                            Tuple[List[str], List[str], List[str]]]:
         """
         Generate valuations for all teams in an arena.
         All teams get the same item categorization but different values.
         
         Args:
             team_ids: List of team IDs in the arena
+            rng: Random generator to draw from (default self.rng)
         
         Returns:
             Tuple of (valuations_dict, item_categories)
@@ -100,33 +189,90 @@ class ValuationGenerator:
             - item_categories: (high_items, low_items, mixed_items)
         """
         # Determine item categories (consistent for all teams)
-        high_items, low_items, mixed_items = self._generate_item_categories()
+        high_items, low_items, mixed_items = self._generate_item_categories(rng)
         
         # Generate valuations for each team
         valuations = {}
         for team_id in team_ids:
             valuations[team_id] = self.generate_valuation_vector(
-                team_id, high_items, low_items, mixed_items
+                team_id, high_items, low_items, mixed_items, rng
             )
         
         return valuations, (high_items, low_items, mixed_items)
     
-    def get_random_auction_sequence(self, num_items: int = None) -> List[str]:
+    def get_random_auction_sequence(self, num_items: int = None,
+                                    rng: np.random.Generator = None) -> List[str]:
         """
         Select and shuffle random items for auction sequence.
         
         Args:
             num_items: Number of items to auction (default from config)
+            rng: Random generator to draw from (default self.rng)
         
         Returns:
             List of item IDs in random order
         """
-        from src.config import T_AUCTION_ROUNDS
+        rng = rng if rng is not None else self.rng
         if num_items is None:
             num_items = T_AUCTION_ROUNDS
         
-        all_items = [ITEM_ID_FORMAT.format(i) for i in range(K_TOTAL_ITEMS)]
-        selected_items = np.random.choice(all_items, size=num_items, replace=False).tolist()
-        np.random.shuffle(selected_items)
+        selected_items = rng.choice(ITEM_IDS, size=num_items, replace=False).tolist()
+        rng.shuffle(selected_items)
         
         return selected_items
+
+    def generate_batch(self, team_ids: List[str], num_games: int,
+                       num_rounds: int = None) -> ValuationBatch:
+        """
+        Generate the inputs of many games of one arena in a few vectorized draws.
+        
+        Each game gets its own item categorization, valuations for every team and
+        auction sequence, with the same distributions as generate_arena_valuations
+        and get_random_auction_sequence. Draws come from self.rng, not np.random.
+        
+        Args:
+            team_ids: List of team IDs in the arena
+            num_games: Number of games to generate
+            num_rounds: Auction sequence length (default from config)
+        
+        Returns:
+            ValuationBatch holding all games
+        """
+        if num_rounds is None:
+            num_rounds = T_AUCTION_ROUNDS
+        
+        # Random permutation of items per game; its first HIGH_VALUE_ITEMS are high, etc.
+        permutations = np.argsort(self.rng.random((num_games, K_TOTAL_ITEMS)), axis=1)
+        categories = np.empty((num_games, K_TOTAL_ITEMS), dtype=np.int8)
+        np.put_along_axis(categories, permutations,
+                          np.broadcast_to(_CATEGORY_BY_RANK, categories.shape), axis=1)
+        
+        uniforms = self.rng.random((num_games, len(team_ids), K_TOTAL_ITEMS))
+        values = _CATEGORY_LOW_BOUNDS[categories][:, None, :] + \
+            _CATEGORY_WIDTHS[categories][:, None, :] * uniforms
+        
+        auction_sequences = np.argsort(self.rng.random((num_games, K_TOTAL_ITEMS)), axis=1)[:, :num_rounds]
+        
+        return ValuationBatch(
+            team_ids=list(team_ids),
+            values=values,
+            categories=categories,
+            auction_sequences=auction_sequences
+        )
+    
+    def generate_stage_batches(self, arenas: Dict[str, List[str]],
+                               num_games: int) -> Dict[str, ValuationBatch]:
+        """
+        Generate the inputs of every game of a stage.
+        
+        Args:
+            arenas: Dictionary mapping arena_id to list of team IDs
+            num_games: Number of games per arena
+        
+        Returns:
+            Dictionary mapping arena_id to its ValuationBatch
+        """
+        return {
+            arena_id: self.generate_batch(team_ids, num_games)
+            for arena_id, team_ids in arenas.items()
+        }
@@ -0,0 +1,424 @@
+"""
+AGT Competition Parameter Sweep
+Tune an agent's policy parameters offline over many seeded games
+
+Tries every combination of the given values of an agent's tunable parameters
+(class attributes of its BiddingAgent, or module-level constants) against the
+example strategies, without editing the agent file: worker processes play the
+games inline and set the parameters on the imported agent module before each
+batch of games. Game n of every configuration is dealt the valuations,
+auction order and tie breaks of simulator.py's game n with the same --seed, so
+configurations are compared on common games; opponents drawing their own
+random numbers (random_bidder seeds from OS entropy) add noise that the
+intervals account for, and --exclude leaves them out. The agent's own values
+are always included as the baseline.
+
+Every finished game is appended to a per-configuration cache file, keyed on
+the parameters, the seed and the contents of all agent files, so an
+interrupted or extended sweep only plays the missing games. Configurations are
+ranked by mean utility and reported with bootstrap confidence intervals for
+the mean and for the paired difference to the baseline.
+
+Usage:
+    python sweep.py --param DEFAULT_GUARD_FACTOR=1.2,1.4,1.6 --param SHADE_ROUNDS=4,8 --games 2000 --workers 4
+    python sweep.py --param MIXED_ENSURANCE_THRESHOLD=0.05,0.1,0.2 --exclude random_bidder
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from simulator import Simulator
+from src.agent_manager import agent_module_cache
+from src.config import BID_TIMEOUT_SECONDS
+from src.utils import format_utility, save_json
+
+
+# Team ID of the tuned agent in simulator games
+AGENT_TEAM_ID = "your_agent"
+
+
+def parse_param(spec: str) -> Tuple[str, list]:
+    """
+    Parse a NAME=v1,v2,... option; values are JSON (numbers, true/false, "strings").
+
+    Raises:
+        argparse.ArgumentTypeError: If the option is malformed
+    """
+    name, sep, values = spec.partition("=")
+    if not sep or not name.strip() or not values.strip():
+        raise argparse.ArgumentTypeError(f"Expected NAME=v1,v2,... but got '{spec}'")
+    try:
+        parsed = [json.loads(value) for value in values.split(",")]
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"Invalid value in '{spec}': {e}")
+    return name.strip(), parsed
+
+
+def load_agent_module(agent_path: str):
+    """The agent's module as inline games in this process import it"""
+    return agent_module_cache.get_module(agent_path, f"agent_{AGENT_TEAM_ID}")
+
+
+def apply_params(module, params: Dict) -> Dict:
+    """
+    Set parameters on an agent module, on its BiddingAgent class where the class defines them.
+
+    Args:
+        module: Imported agent module
+        params: Parameter name -> value
+
+    Returns:
+        Parameter name -> (object it was set on, previous value), for restore_params
+
+    Raises:
+        AttributeError: If the agent has no parameter of that name
+    """
+    previous = {}
+    for name, value in params.items():
+        target = module.BiddingAgent if hasattr(module.BiddingAgent, name) else module
+        if not hasattr(target, name):
+            raise AttributeError(f"Agent has no parameter {name}")
+        previous[name] = (target, getattr(target, name))
+        setattr(target, name, value)
+    return previous
+
+
+def restore_params(previous: Dict):
+    """Undo apply_params"""
+    for name, (target, value) in previous.items():
+        setattr(target, name, value)
+
+
+def file_hash(file_path: str) -> str:
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def config_key(params: Dict, base_seed: int, agent_hash: str, opponent_hashes: List[str]) -> str:
+    """Cache key of a configuration; changes whenever any of its games could change"""
+    payload = json.dumps({'params': params, 'seed': base_seed, 'agent': agent_hash,
+                          'opponents': sorted(opponent_hashes)}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+class ResultCache:
+    """
+    Per-(configuration, game) results on disk.
+
+    Each configuration has <key>.json describing it and <key>.jsonl with one
+    line per finished game, appended as games complete, so a sweep can be
+    interrupted at any point and resumed.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def load(self, key: str, params: Dict) -> Dict[int, Tuple[float, int]]:
+        """
+        Cached results of a configuration.
+
+        Returns:
+            Dictionary mapping game number to (utility, rank)
+        """
+        meta_path = os.path.join(self.cache_dir, f"{key}.json")
+        if not os.path.exists(meta_path):
+            save_json({'params': params}, meta_path)
+
+        results = {}
+        results_path = os.path.join(self.cache_dir, f"{key}.jsonl")
+        if os.path.exists(results_path):
+            with open(results_path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # line cut short by an interrupted run
+                    results[record['game']] = (record['utility'], record['rank'])
+        return results
+
+    def append(self, key: str, games: List[Tuple[int, float, int]]):
+        """Record finished games of a configuration"""
+        with open(os.path.join(self.cache_dir, f"{key}.jsonl"), 'a') as f:
+            for game_num, utility, rank in games:
+                f.write(json.dumps({'game': game_num, 'utility': utility, 'rank': rank}) + "\n")
+
+
+# Per-process simulator used by pool workers (set by _init_worker)
+_worker_simulator = None
+_worker_agents = None
+
+
+def _init_worker(base_seed: int, timeout: float, agent_path: str, opponents: list):
+    """Process pool initializer: one inline Simulator per worker process"""
+    global _worker_simulator, _worker_agents
+    _worker_simulator = Simulator(seed=base_seed, timeout=timeout, execution_mode="inline", headless=True)
+    _worker_agents = (agent_path, opponents)
+
+
+def _run_games_in_worker(config: int, params: Dict,
+                         game_nums: List[int]) -> Tuple[int, List[Tuple[int, float, int]]]:
+    """
+    Process pool task: play games with one configuration's parameters set.
+
+    Returns:
+        Tuple of (config, [(game_num, utility, rank), ...]); failed games are left out
+    """
+    agent_path, opponents = _worker_agents
+    previous = apply_params(load_agent_module(agent_path), params)
+    try:
+        results = []
+        for game_num in game_nums:
+            game_result = _worker_simulator.simulate_game(agent_path, opponents, game_num)
+            if game_result is None:
+                continue
+            utilities = {team_id: team_result.utility
+                         for team_id, team_result in game_result.team_results.items()}
+            utility = utilities[AGENT_TEAM_ID]
+            rank = 1 + sum(other > utility for other in utilities.values())
+            results.append((game_num, utility, rank))
+        return config, results
+    finally:
+        restore_params(previous)
+
+
+def iter_tasks(tasks: List[Tuple[int, Dict, List[int]]], base_seed: int, timeout: float,
+               agent_path: str, opponents: list, workers: int) -> Iterator[Tuple[int, List]]:
+    """
+    Yield (config, results) as tasks complete.
+
+    With workers > 1 tasks run in a process pool with at most two per worker
+    submitted ahead, so an interrupted sweep has cached nearly all finished work.
+    """
+    initargs = (base_seed, timeout, agent_path, opponents)
+    if workers <= 1:
+        _init_worker(*initargs)
+        for task in tasks:
+            yield _run_games_in_worker(*task)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs)
+    try:
+        remaining = iter(tasks)
+        pending = set()
+        while True:
+            for task in itertools.islice(remaining, 2 * workers - len(pending)):
+                pending.add(executor.submit(_run_games_in_worker, *task))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def build_configs(param_specs: List[Tuple[str, list]], module) -> Tuple[List[Dict], int]:
+    """
+    Cartesian product of the parameter values, plus the agent's own values.
+
+    Returns:
+        Tuple of (configurations, index of the baseline configuration)
+
+    Raises:
+        AttributeError: If the agent has no parameter of a given name
+    """
+    names = [name for name, _ in param_specs]
+    baseline = {}
+    for name in names:
+        target = module.BiddingAgent if hasattr(module.BiddingAgent, name) else module
+        if not hasattr(target, name):
+            raise AttributeError(f"Agent has no parameter {name}")
+        baseline[name] = getattr(target, name)
+
+    configs = []
+    for values in itertools.product(*(values for _, values in param_specs)):
+        params = dict(zip(names, values))
+        if params not in configs:
+            configs.append(params)
+    if baseline not in configs:
+        configs.insert(0, baseline)
+    return configs, configs.index(baseline)
+
+
+def summarize(configs: List[Dict], results: List[Dict[int, Tuple[float, int]]], baseline: int,
+              confidence: float, bootstrap_samples: int, bootstrap_seed: int = 0) -> List[Dict]:
+    """
+    Mean utility, win rate and difference to the baseline per configuration.
+
+    Only games finished by every configuration are used, so differences are
+    paired. Each bootstrap resample is a multinomial count per game shared by
+    all configurations, as in montecarlo.py.
+
+    Returns:
+        List of dicts (params, utility, utility_ci, diff, diff_ci, win_rate, mean_rank),
+        sorted by mean utility
+    """
+    games = sorted(set.intersection(*(set(r) for r in results)))
+    if not games:
+        return []
+
+    # (games, configs)
+    utility = np.array([[r[g][0] for r in results] for g in games])
+    rank = np.array([[r[g][1] for r in results] for g in games], dtype=float)
+    diff = utility - utility[:, [baseline]]
+    num_games = len(games)
+
+    rng = np.random.default_rng(bootstrap_seed)
+    counts = rng.multinomial(num_games, np.full(num_games, 1 / num_games), size=bootstrap_samples)
+    tail = (1 - confidence) / 2
+    utility_low, utility_high = np.quantile(counts @ utility / num_games, [tail, 1 - tail], axis=0)
+    diff_low, diff_high = np.quantile(counts @ diff / num_games, [tail, 1 - tail], axis=0)
+
+    summary = []
+    for c, params in enumerate(configs):
+        summary.append({
+            'params': params,
+            'baseline': c == baseline,
+            'games': num_games,
+            'utility': float(utility[:, c].mean()),
+            'utility_ci': (float(utility_low[c]), float(utility_high[c])),
+            'diff': float(diff[:, c].mean()),
+            'diff_ci': (float(diff_low[c]), float(diff_high[c])),
+            'win_rate': float((rank[:, c] == 1).mean()),
+            'mean_rank': float(rank[:, c].mean())
+        })
+    summary.sort(key=lambda s: -s['utility'])
+    return summary
+
+
+def print_summary(summary: List[Dict], top: int, confidence: float):
+    """Print the best configurations"""
+    if not summary:
+        print("\nNo games finished")
+        return
+    print(f"\nTop {min(top, len(summary))} of {len(summary)} configurations over {summary[0]['games']} games "
+          f"({confidence:.0%} bootstrap intervals)")
+    print(f"{'#':>3} {'Utility':>30} {'vs baseline':>30} {'Win rate':>9} {'Rank':>5}  Parameters")
+    print(f"{'-'*3} {'-'*30} {'-'*30} {'-'*9} {'-'*5}  {'-'*30}")
+    for i, s in enumerate(summary[:top], 1):
+        utility_low, utility_high = s['utility_ci']
+        diff_low, diff_high = s['diff_ci']
+        params = ", ".join(f"{name}={value}" for name, value in s['params'].items())
+        if s['baseline']:
+            params += "  (baseline)"
+        print(f"{i:>3} {format_utility(s['utility']):>10} "
+              f"[{format_utility(utility_low)}, {format_utility(utility_high)}] "
+              f"{s['diff']:>+10.2f} [{diff_low:+.2f}, {diff_high:+.2f}] "
+              f"{s['win_rate']:>9.1%} {s['mean_rank']:>5.2f}  {params}")
+    sys.stdout.flush()
+
+
+def main():
+    """Main entry point for the parameter sweep"""
+    parser = argparse.ArgumentParser(
+        description="AGT Competition Parameter Sweep - tune an agent's parameters against the examples"
+    )
+
+    parser.add_argument('--agent', default=os.path.join('teams', 'ELELIL', 'bidding_agent.py'),
+                        help='Path to the tuned bidding_agent.py (default: %(default)s)')
+    parser.add_argument('--param', action='append', type=parse_param, default=[], metavar='NAME=V1,V2',
+                        help='Parameter values to try (repeatable; all combinations are played)')
+    parser.add_argument('--exclude', action='append', default=[], metavar='NAME',
+                        help='Example opponent to leave out (repeatable)')
+    parser.add_argument('--games', type=int, default=1000, help='Games per configuration')
+    parser.add_argument('--seed', type=int, default=0, help='Base seed; game n is simulator.py game n')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes playing games')
+    parser.add_argument('--chunk-games', type=int, default=25, help='Games per worker task')
+    parser.add_argument('--cache-dir', default=os.path.join('results', 'sweep_cache'),
+                        help='Directory of cached game results (default: %(default)s)')
+    parser.add_argument('--top', type=int, default=10, help='Configurations to print')
+    parser.add_argument('--confidence', type=float, default=0.95, help='Confidence level of the intervals')
+    parser.add_argument('--bootstrap-samples', type=int, default=2000, help='Bootstrap resamples')
+    parser.add_argument('--timeout', type=float, default=BID_TIMEOUT_SECONDS,
+                        help='Timeout for bid execution (seconds)')
+    parser.add_argument('--output', help='Write all configurations\' results to this JSON file')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
+
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.ERROR,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+    agent_path = os.path.abspath(args.agent)
+    if not os.path.exists(agent_path):
+        print(f"Error: Agent file not found: {args.agent}")
+        sys.exit(1)
+
+    opponents = [opp for opp in Simulator(seed=args.seed, execution_mode="inline").load_example_opponents()
+                 if opp['team_id'] not in args.exclude]
+    if not opponents:
+        print("Error: No example opponents found")
+        sys.exit(1)
+
+    try:
+        configs, baseline = build_configs(args.param, load_agent_module(agent_path))
+    except AttributeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    agent_hash = file_hash(agent_path)
+    opponent_hashes = [file_hash(opp['agent_file']) for opp in opponents]
+    keys = [config_key(params, args.seed, agent_hash, opponent_hashes) for params in configs]
+
+    cache = ResultCache(args.cache_dir)
+    results = [cache.load(key, params) for key, params in zip(keys, configs)]
+
+    chunk_games = max(1, args.chunk_games)
+    tasks = []
+    for c, params in enumerate(configs):
+        missing = [g for g in range(1, args.games + 1) if g not in results[c]]
+        for i in range(0, len(missing), chunk_games):
+            tasks.append((c, params, missing[i:i + chunk_games]))
+    num_missing = sum(len(game_nums) for _, _, game_nums in tasks)
+
+    print(f"{'='*80}")
+    print("AGT COMPETITION PARAMETER SWEEP")
+    print(f"{'='*80}")
+    print(f"Agent: {args.agent}")
+    print(f"Opponents: {', '.join(opp['team_id'] for opp in opponents)}")
+    print(f"Configurations: {len(configs)} x {args.games} games (seed: {args.seed})")
+    print(f"Cached: {len(configs) * args.games - num_missing} games, to play: {num_missing} "
+          f"(workers: {args.workers})")
+    print(f"{'='*80}")
+
+    start = time.perf_counter()
+    played = 0
+    try:
+        for c, games in iter_tasks(tasks, args.seed, args.timeout, agent_path, opponents, max(1, args.workers)):
+            cache.append(keys[c], games)
+            for game_num, utility, rank in games:
+                results[c][game_num] = (utility, rank)
+            played += len(games)
+            print(f"\rPlayed {played}/{num_missing} games ({time.perf_counter() - start:.1f} s)",
+                  end="", flush=True)
+    except KeyboardInterrupt:
+        print("\n\nSweep interrupted by user; finished games are cached")
+    if num_missing:
+        print()
+
+    in_range = [{g: r for g, r in result.items() if g <= args.games} for result in results]
+    summary = summarize(configs, in_range, baseline, args.confidence, args.bootstrap_samples)
+    print_summary(summary, max(1, args.top), args.confidence)
+
+    if args.output and summary:
+        save_json({'agent': args.agent, 'seed': args.seed, 'confidence': args.confidence,
+                   'configs': summary}, os.path.abspath(args.output))
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -19,10 +19,23 @@ Key Features:
 - Probability tracking using Bayes’ theorem
 - Dynamic strategy according to expected fourth order statistic (i.e. expected second-highest bid)
 - Guarding (overbidding) in cases of low valuations to make opponent pay more
+- Opponent budget tracking, so guarding never bids more than a cent above what every opponent can still pay
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+try:
+    from src.config import ARENA_SIZE, BID_DECIMAL_PLACES, HIGH_VALUE_RANGE, LOW_VALUE_RANGE, MIXED_VALUE_RANGE
+    from src.opponent_state import OpponentTracker
+except ImportError:  # running outside the competition framework: no opponent budget tracking
+    ARENA_SIZE = 5
+    BID_DECIMAL_PLACES = 2
+    HIGH_VALUE_RANGE, LOW_VALUE_RANGE, MIXED_VALUE_RANGE = (10, 20), (1, 10), (1, 20)
+    OpponentTracker = None
+
 @dataclass
 class Belief:
     p_high: float
@@ -37,21 +50,37 @@ class SeenItemData:
     round_seen: int
     potential_utility: float
 
-HIGH_ORDER_STATISTICS = [11 + 2 / 3, 13 + 1 / 3, 15, 16 + 2 / 3, 18 + 1 / 3]
-MIXED_ORDER_STATISTICS = [4 + 1 / 6, 7 + 1 / 3, 10.5, 13 + 2 / 3, 16 + 5 / 6]
-LOW_ORDER_STATISTICS = [2.5, 4, 5.5, 7, 8.5]
-
 GROUP_HIGH = 'high'
 GROUP_MIXED = 'mixed'
 GROUP_LOW = 'low'
 
+GROUP_VALUE_RANGES = {GROUP_HIGH: HIGH_VALUE_RANGE, GROUP_MIXED: MIXED_VALUE_RANGE, GROUP_LOW: LOW_VALUE_RANGE}
+
+# Smallest bid increment the auction distinguishes
+BID_TICK = 10 ** -BID_DECIMAL_PLACES
+
+def get_order_statistics(group: str, num_bidders: int) -> List[float]:
+    """
+    Expected order statistics of num_bidders values from the group's uniform range, lowest first:
+    E[k-th lowest] = min + (max - min) * k / (n + 1)
+    """
+    range_min, range_max = GROUP_VALUE_RANGES[group]
+    return [range_min + (range_max - range_min) * k / (num_bidders + 1) for k in range(1, num_bidders + 1)]
+
+# For an arena of ARENA_SIZE teams. Index -2 is the expected second highest value (the price paid)
+HIGH_ORDER_STATISTICS = get_order_statistics(GROUP_HIGH, ARENA_SIZE)
+MIXED_ORDER_STATISTICS = get_order_statistics(GROUP_MIXED, ARENA_SIZE)
+LOW_ORDER_STATISTICS = get_order_statistics(GROUP_LOW, ARENA_SIZE)
+ORDER_STATISTICS = {GROUP_HIGH: HIGH_ORDER_STATISTICS, GROUP_MIXED: MIXED_ORDER_STATISTICS, GROUP_LOW: LOW_ORDER_STATISTICS}
+
 STRATEGY_WIN = 'win'
 STRATEGY_GUARD = 'guard'
 STRATEGY_TRUTHFUL = 'truthful'
 
-def get_diff_from_fourth_order(group: str, item_value: float):
-    fourth_order = LOW_ORDER_STATISTICS[3] if group == GROUP_LOW \
-        else (MIXED_ORDER_STATISTICS[3] if group == GROUP_MIXED else HIGH_ORDER_STATISTICS[3])
+def get_diff_from_fourth_order(group: str, item_value: float,
+                               order_statistics: Dict[str, List[float]] = ORDER_STATISTICS):
+    # the "fourth order" statistic of 5 bidders, i.e. the expected second highest value
+    fourth_order = order_statistics[group][-2]
     return item_value - fourth_order
 
 def get_most_likely_group_and_confidence(posteriors: Belief):
@@ -71,6 +100,15 @@ def linear_interpolation(start: float, end: float, t: float, t_max: float) -> fl
 
 class BiddingAgent:
 
+    # Policy thresholds; class attributes so that sweep.py can try other values without editing this file
+    CONFIDENT_GROUP_THRESHOLD = 0.55  # above it, guard by the distance to the group's fourth order statistic
+    MIXED_GUARD_CONFIDENCE = 0.6      # confidence in the mixed group at which low-mixed values are guarded
+    HIGH_GUARD_CONFIDENCE = 0.6       # confidence in the high group needed to guard up to its fourth order
+    DEFAULT_GUARD_FACTOR = 1.4        # overbid factor when no order statistic applies
+    SHADE_START = 0.8                 # shading factor of high bids in the first round
+    SHADE_ROUNDS = 8                  # rounds over which shading rises linearly to 1
+    CAP_GUARD_AT_OPPONENT_BUDGET = True  # guard at most a tick above what the richest opponent can still bid
+
     def __init__(self, team_id: str, valuation_vector: Dict[str, float], 
                  budget: float, opponent_teams: List[str]):
         self.team_id = team_id
@@ -79,7 +117,12 @@ class BiddingAgent:
         self.init_budget = budget
         self.initial_budget = budget
         self.opponent_teams = opponent_teams
+        self.opponents = OpponentTracker(opponent_teams, budget) if OpponentTracker is not None else None
         self.items_won = []
+
+        # the arena may not have ARENA_SIZE teams (e.g. the championship arena)
+        self.num_bidders = max(2, len(opponent_teams) + 1)
+        self.order_statistics = {group: get_order_statistics(group, self.num_bidders) for group in GROUP_VALUE_RANGES}
         self.utility = 0
 
         # Game state tracking
@@ -87,12 +130,7 @@ class BiddingAgent:
         self.total_rounds = 15  # Always 15 rounds per game
 
         self.seen_items: Dict[str, SeenItemData] = {}
-        self.beliefs = get_posteriors_from_values(
-                valuation_vector,
-                Belief(TOTAL_HIGH / TOTAL_ITEMS, TOTAL_MIXED / TOTAL_ITEMS, TOTAL_LOW / TOTAL_ITEMS),
-                [item_id for item_id, value in self.valuation_vector.items() if value >= VALUE_RANGE_HIGH[0]],
-                [item_id for item_id, value in self.valuation_vector.items() if value <= VALUE_RANGE_LOW[1]]
-        )
+        self.beliefs = BeliefState(valuation_vector, self.num_bidders)
     
     def _update_available_budget(self, item_id: str, winning_team: str, 
                                  price_paid: float):
@@ -112,6 +150,8 @@ class BiddingAgent:
             self.utility += (self.valuation_vector[item_id] - price_paid)
         
         self.rounds_completed += 1
+        if self.opponents is not None:
+            self.opponents.update(winning_team, price_paid)
 
         # update history
         self.seen_items[item_id] = SeenItemData(
@@ -123,7 +163,7 @@ class BiddingAgent:
         )
 
         # update beliefs of each value group
-        self.beliefs, priors = get_updated_beliefs_according_to_price(item_id, price_paid, self.valuation_vector, self.beliefs, { item_id for item_id in self.seen_items })
+        update_beliefs_with_price(self.beliefs, item_id, price_paid)
         
         return True
     
@@ -148,9 +188,15 @@ class BiddingAgent:
 
         bid = value * factor
 
+        # no opponent can bid more than the richest one has left (M), so any bid above M wins
+        # at the same second price; capping at M + one tick keeps that outcome, where a cap
+        # at M itself would tie with that opponent and leave the item to the tie-break
+        if guarding and self.CAP_GUARD_AT_OPPONENT_BUDGET and self.opponents is not None:
+            bid = min(bid, max(value, self.opponents.max_feasible_bid() + BID_TICK))
+
         # add shading for first rounds of game to not waste a lot of the budget at the beginning
-        if not guarding and bid > HIGH_ORDER_STATISTICS[3]:
-            round_shade = linear_interpolation(0.8, 1.0, self.rounds_completed, 8)
+        if not guarding and bid > self.order_statistics[GROUP_HIGH][-2]:
+            round_shade = linear_interpolation(self.SHADE_START, 1.0, self.rounds_completed, self.SHADE_ROUNDS)
             bid *= round_shade
 
         return max(0.0, min(bid, self.budget))
@@ -161,30 +207,30 @@ class BiddingAgent:
     '''
     def calc_guard(self, value: float, item_group: str, confidence: float, margin: float = 0):
         if value < 5:
-            return (LOW_ORDER_STATISTICS[3] - margin) / value
+            return (self.order_statistics[GROUP_LOW][-2] - margin) / value
 
         if 10 < value:
-            return (MIXED_ORDER_STATISTICS[3] - margin) / value
+            return (self.order_statistics[GROUP_MIXED][-2] - margin) / value
 
         # only raise to fourth order of high group if the item is from the high group with a certain confidence
         # to avoid winning the item and getting a negative utility
-        if item_group == GROUP_HIGH and confidence >= 0.6:
-            return (HIGH_ORDER_STATISTICS[3] - margin) / value
+        if item_group == GROUP_HIGH and confidence >= self.HIGH_GUARD_CONFIDENCE:
+            return (self.order_statistics[GROUP_HIGH][-2] - margin) / value
 
-        return 1.4
+        return self.DEFAULT_GUARD_FACTOR
 
     def should_guard(self, value, group: str, confidence: float) -> bool:
-        if group == GROUP_MIXED and confidence >= 0.6:
+        if group == GROUP_MIXED and confidence >= self.MIXED_GUARD_CONFIDENCE:
             return value <= 13
 
-        if confidence > 0.55:
-            diff_from_fourth = get_diff_from_fourth_order(group, value)
+        if confidence > self.CONFIDENT_GROUP_THRESHOLD:
+            diff_from_fourth = get_diff_from_fourth_order(group, value, self.order_statistics)
             return diff_from_fourth < 0
 
         if 8 <= value < 10:
             return False
 
-        if 10 < value <= MIXED_ORDER_STATISTICS[3]:
+        if 10 < value <= self.order_statistics[GROUP_MIXED][-2]:
             return True
 
         if value >= 18:
@@ -199,28 +245,31 @@ class BiddingAgent:
 ================================= BELIEF CALCULATIONS ==========================================================
 ============================================================================================================ """
 
+# Per-item formulas. The agent runs the vectorized versions below (BeliefState), which give the same probabilities.
+
 TOTAL_HIGH = 6
 TOTAL_MIXED = 10
 TOTAL_LOW = 4
 TOTAL_ITEMS = TOTAL_HIGH + TOTAL_MIXED + TOTAL_LOW
 
-VALUE_RANGE_LOW = [1,10]
-VALUE_RANGE_MIXED = [1,20]
-VALUE_RANGE_HIGH = [10,20]
+VALUE_RANGE_LOW = list(LOW_VALUE_RANGE)
+VALUE_RANGE_MIXED = list(MIXED_VALUE_RANGE)
+VALUE_RANGE_HIGH = list(HIGH_VALUE_RANGE)
 
 def get_updated_beliefs_according_to_price(
         item_id: str,
         price_paid: float,
         valuation_vector: Dict[str, float],
         beliefs: Dict[str, Belief],
-        seen_items: set[str]
+        seen_items: set[str],
+        num_bidders: int = ARENA_SIZE
     ):
     # For price p of item i with value v:
     # calculate P(T_i=t | v,p) for every t in [LOW,MIXED,HIGH]
-    beliefs[item_id] = get_posterior_with_price(item_id, valuation_vector[item_id], price_paid, beliefs[item_id])
+    beliefs[item_id] = get_posterior_with_price(item_id, valuation_vector[item_id], price_paid, beliefs[item_id], num_bidders)
 
     # SPECIAL CASE HANDLING: in case of P(T_i=MIXED)=1, remove i from the list of possible LOW/HIGH items
-    possible_highs, possible_lows = get_group_possible_candidates(valuation_vector, {})
+    possible_highs, possible_lows = get_group_possible_candidates(valuation_vector, {i: beliefs[i] for i in seen_items})
 
     # Calculate E[items remaining in group t] for every t in [LOW,MIXED,HIGH]
     remainders = get_expected_remainders_from_seen(beliefs, seen_items)
@@ -277,6 +326,39 @@ def posterior_from_value(v: float, priors: Belief, possible_highs: list[str] = N
     return Belief(w_high / w_sum, w_mixed / w_sum, w_low / w_sum)
 
 
+# Price step of the likelihood tables
+LIKELIHOOD_GRID_STEP = 1e-3
+
+@lru_cache(maxsize=None)
+def likelihood_table(group: str, num_bidders: int) -> np.ndarray:
+    """
+    For n i.i.d. samples from Uniform[0,1], the density of the k-th order statistic (k-th item in increasing order) is:
+    f_k(y) = n!/((k-1)!(n-k)!)y^(k-1)(1-y)^(n-k)
+    Where:
+     - y = the value of the density function (which is also the probability to be lower than y because the samples are from Uniform[0,1]).
+     - k-1 = items below y
+     - n-k = items above y
+    The price paid is the second highest value, k = n-1: f(y) = n(n-1)y^(n-2)(1-y).
+    Dividing by (max - min) shifts the density to the group's range [min,max] instead of [0,1].
+
+    Returns the density on a grid of prices from min to max, LIKELIHOOD_GRID_STEP apart.
+    """
+    range_min, range_max = GROUP_VALUE_RANGES[group]
+    y = np.linspace(0.0, 1.0, int(round((range_max - range_min) / LIKELIHOOD_GRID_STEP)) + 1)
+    return num_bidders * (num_bidders - 1) * y ** (num_bidders - 2) * (1.0 - y) / (range_max - range_min)
+
+def price_likelihood(group: str, num_bidders: int, price_paid: float) -> float:
+    """l(p|T=t): likelihood of the price paid for an item of the group, interpolated from likelihood_table"""
+    range_min, range_max = GROUP_VALUE_RANGES[group]
+    if price_paid < range_min or price_paid > range_max:
+        return 0.0
+    table = likelihood_table(group, num_bidders)
+    position = (price_paid - range_min) / (range_max - range_min) * (len(table) - 1)
+    i = min(int(position), len(table) - 2)
+    below, above = table.item(i), table.item(i + 1)
+    return below + (position - i) * (above - below)
+
+
 MIXED_ENSURANCE_THRESHOLD = 0.1
 """
 Bayes’ rule for continuous observations:
@@ -289,31 +371,17 @@ Given:
 We can calculate the probability of the item being in each item group depending on the prior and the price paid: 
 P(T=t|v,p) = P(T=t|v)l(p|T=t) / sum_t'(P(T=t'|v)l(p|T=t'))
 
-Where l is the likelihood of the second highest bid being p for an item of group t  
+Where l is the likelihood of the second highest bid being p for an item of group t (see price_likelihood)
 """
-def get_posterior_with_price(item_id: str, value: float, price_paid: float, posterior_without_price: Belief) -> Belief:
-    """
-    For n i.i.d. samples from Uniform[0,1], the density of the k-th order statistic (k-th item in increasing order) is:
-    f_k(y) = n!/((k-1)!(n-k)!)y^(k-1)(1-y)^(n-k)
-    Where:
-     - y = the value of the density function (which is also the probability to be lower than y because the samples are from Uniform[0,1]).
-     - k-1 = items below y
-     - n-k = items above y
-    Where the division by (min - max) is to shift our density to the range [min,max] instead of [0,1]
-    """
-    def second_highest_pdf_uniform(p_val: float, range_min: float, range_max: float) -> float:
-        if p_val < range_min or p_val > range_max:
-            return 0.0
-        y = (p_val - range_min) / (range_max - range_min)
-        return 20 * (y ** 3) * (1.0 - y) * (1.0 / (range_max - range_min))
-
+def get_posterior_with_price(item_id: str, value: float, price_paid: float, posterior_without_price: Belief,
+                             num_bidders: int = ARENA_SIZE) -> Belief:
     if posterior_without_price.p_low == 1.0 and price_paid < VALUE_RANGE_LOW[1] or posterior_without_price.p_high == 1.0 and price_paid > \
             VALUE_RANGE_HIGH[0]:
         return posterior_without_price
 
-    like_low = second_highest_pdf_uniform(price_paid, VALUE_RANGE_LOW[0], VALUE_RANGE_LOW[1])
-    like_high = second_highest_pdf_uniform(price_paid, VALUE_RANGE_HIGH[0], VALUE_RANGE_HIGH[1])
-    like_mixed = second_highest_pdf_uniform(price_paid, VALUE_RANGE_MIXED[0], VALUE_RANGE_MIXED[1])
+    like_low = price_likelihood(GROUP_LOW, num_bidders, price_paid)
+    like_high = price_likelihood(GROUP_HIGH, num_bidders, price_paid)
+    like_mixed = price_likelihood(GROUP_MIXED, num_bidders, price_paid)
 
     w_high = posterior_without_price.p_high * like_high
     w_mixed = posterior_without_price.p_mixed * like_mixed
@@ -418,3 +486,188 @@ def get_updated_posteriors_of_unseens(
 =============================== END BELIEF CALCULATIONS ========================================================
 ============================================================================================================ """
 
+""" ============================================================================================================
+============================== VECTORIZED BELIEF STATE =========================================================
+============================================================================================================ """
+
+# Column of each value group in the belief arrays
+COL_HIGH, COL_MIXED, COL_LOW = 0, 1, 2
+
+GROUP_TOTALS = [TOTAL_HIGH, TOTAL_MIXED, TOTAL_LOW]
+
+
+class BeliefState:
+    """
+    P(T_i=t) of all items as one (items, 3) array, columns high, mixed, low, rows in valuation vector order.
+    beliefs[item_id] gives the Belief of one item.
+
+    P(T_i=t|v) only depends on which value ranges v falls in (and on whether the item is surely high / low),
+    so items are grouped into a few value patterns: posteriors are computed once per pattern and then
+    gathered into the item array.
+
+    A seen item's belief no longer changes, so the sums over seen items (expected items used per group)
+    and the number of possible high / low items are kept as running totals, updated by the seen item only.
+    """
+
+    def __init__(self, valuation_vector: Dict[str, float], num_bidders: int = ARENA_SIZE):
+        self.num_bidders = num_bidders
+        for group in GROUP_VALUE_RANGES:
+            likelihood_table(group, num_bidders)  # build the tables now rather than in the first update
+
+        self.item_ids = list(valuation_vector)
+        self.index = {item_id: i for i, item_id in enumerate(self.item_ids)}
+        self.values = np.array([float(v) for v in valuation_vector.values()])
+        self.seen = np.zeros((len(self.item_ids), 1), dtype=bool)
+
+        # sum_{i seen} P(T_i=t) for high, mixed, low
+        self.expected_used = [0.0, 0.0, 0.0]
+
+        # items that can be high / low by their value, less seen items that are surely mixed
+        # (see get_group_possible_candidates)
+        self.possible_high_count = int(np.count_nonzero(self.values >= VALUE_RANGE_HIGH[0]))
+        self.possible_low_count = int(np.count_nonzero(self.values <= VALUE_RANGE_LOW[1]))
+        self.assign_patterns()
+
+        self.priors = [TOTAL_HIGH / TOTAL_ITEMS, TOTAL_MIXED / TOTAL_ITEMS, TOTAL_LOW / TOTAL_ITEMS]
+        self.probs = np.array(self.pattern_posteriors(self.priors))[self.pattern]
+
+    @property
+    def surely(self) -> Tuple[bool, bool]:
+        """Whether all possible high items, and all possible low items, are known"""
+        return self.possible_high_count == TOTAL_HIGH, self.possible_low_count == TOTAL_LOW
+
+    def assign_patterns(self):
+        """Group the items into value patterns, given the possible high / low counts"""
+        # if all possible low (high) items are known, a value in the low (high) range is surely low (high)
+        surely_high, surely_low = self.surely
+
+        # value pattern of every item: (f(v|T=t) of each group, surely belief or None)
+        pattern_index = {}
+        pattern = []
+        for v in self.values.tolist():
+            if surely_high and v >= VALUE_RANGE_HIGH[0]:
+                key = ((), (1.0, 0.0, 0.0))
+            elif surely_low and v <= VALUE_RANGE_LOW[1]:
+                key = ((), (0.0, 0.0, 1.0))
+            else:
+                key = (tuple(1.0 / (range_max - range_min) if range_min <= v <= range_max else 0.0
+                             for range_min, range_max in (VALUE_RANGE_HIGH, VALUE_RANGE_MIXED, VALUE_RANGE_LOW)),
+                       None)
+            pattern.append(pattern_index.setdefault(key, len(pattern_index)))
+        self.patterns = list(pattern_index)
+        self.pattern = np.array(pattern)
+
+    def observe(self, i: int, belief: List[float]):
+        """Record the final belief of item i once it was sold"""
+        self.probs[i] = belief
+        self.seen[i] = True
+        self.expected_used = [used + p for used, p in zip(self.expected_used, belief)]
+
+        # SPECIAL CASE HANDLING: an item surely mixed is no longer a possible high / low item
+        if belief[COL_MIXED] == 1:
+            surely = self.surely
+            value = self.values.item(i)
+            if value >= VALUE_RANGE_HIGH[0]:
+                self.possible_high_count -= 1
+            if value <= VALUE_RANGE_LOW[1]:
+                self.possible_low_count -= 1
+            if self.surely != surely:
+                self.assign_patterns()
+
+    def __getitem__(self, item_id: str) -> Belief:
+        p_high, p_mixed, p_low = self.probs[self.index[item_id]].tolist()
+        return Belief(p_high, p_mixed, p_low)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.index
+
+    def pattern_posteriors(self, priors: List[float]) -> List[Tuple[float, float, float]]:
+        """posterior_from_value of every value pattern"""
+        p_high, p_mixed, p_low = priors
+        rows = []
+        for densities, surely in self.patterns:
+            if surely is not None:
+                rows.append(surely)
+                continue
+            f_high, f_mixed, f_low = densities
+            w_high = p_high * f_high
+            w_mixed = p_mixed * f_mixed
+            w_low = p_low * f_low
+            w_sum = w_high + w_mixed + w_low
+            rows.append(tuple(priors) if w_sum == 0 else (w_high / w_sum, w_mixed / w_sum, w_low / w_sum))
+        return rows
+
+
+def update_beliefs_with_price(state: BeliefState, item_id: str, price_paid: float):
+    """Vectorized get_updated_beliefs_according_to_price, updating state in place"""
+    i = state.index[item_id]
+    state.observe(i, posterior_with_price(state.values.item(i), price_paid, state.probs[i].tolist(),
+                                          state.num_bidders))
+    unseen = ~state.seen
+
+    # E[items remaining in t] and the global priors P(T_i=t) they give
+    remainders = [max(0.0, total - used) for total, used in zip(GROUP_TOTALS, state.expected_used)]
+    state.priors = get_global_priors_list(remainders)
+
+    # P(T_j | v) of all unseen items, normalized such that sum_j(P(T_j=t)) = E[items remaining in t].
+    # Sums down a column add rows in order, like the per-item functions (seen rows add 0.0)
+    posteriors = state.pattern_posteriors(state.priors)
+    cumulative = (np.array(posteriors)[state.pattern] * unseen).sum(axis=0).tolist()
+    factors = [remainder / c if c > 0 else 1.0 for remainder, c in zip(remainders, cumulative)]
+    np.copyto(state.probs, np.array(normalized_rows(posteriors, factors))[state.pattern], where=unseen)
+
+
+def posterior_with_price(value: float, price_paid: float, posterior_without_price: List[float],
+                         num_bidders: int = ARENA_SIZE) -> List[float]:
+    """get_posterior_with_price on a [p_high, p_mixed, p_low] list"""
+    p_high, p_mixed, p_low = posterior_without_price
+    if p_low == 1.0 and price_paid < VALUE_RANGE_LOW[1] or p_high == 1.0 and price_paid > VALUE_RANGE_HIGH[0]:
+        return posterior_without_price
+
+    min_val = min(price_paid, value)
+    max_val = max(price_paid, value)
+    if min_val <= (VALUE_RANGE_LOW[1] - MIXED_ENSURANCE_THRESHOLD) and max_val >= (
+            VALUE_RANGE_HIGH[0] + MIXED_ENSURANCE_THRESHOLD):
+        return [0.0, 1.0, 0.0]
+
+    like_high = price_likelihood(GROUP_HIGH, num_bidders, price_paid)
+    like_mixed = price_likelihood(GROUP_MIXED, num_bidders, price_paid)
+    like_low = price_likelihood(GROUP_LOW, num_bidders, price_paid)
+    w_high = p_high * like_high
+    w_mixed = p_mixed * like_mixed
+    w_low = p_low * like_low
+    w_sum = w_high + w_mixed + w_low
+
+    # a price no group can produce (e.g. 0 when a single team bid) tells nothing about the item
+    if w_sum == 0:
+        return posterior_without_price
+
+    return [w_high / w_sum, w_mixed / w_sum, w_low / w_sum]
+
+
+def get_global_priors_list(expected_remainders: List[float]) -> List[float]:
+    """get_global_priors on a [high, mixed, low] list of expected remainders"""
+    expected_items_left = expected_remainders[COL_HIGH] + expected_remainders[COL_MIXED] + expected_remainders[COL_LOW]
+    if expected_items_left <= 0:
+        return [0.0, 0.0, 0.0]
+    return [remainder / expected_items_left for remainder in expected_remainders]
+
+
+def normalized_rows(posteriors: List[Tuple[float, float, float]], factors: List[float]) -> List[Tuple[float, float, float]]:
+    """get_normalized_posteriors on (p_high, p_mixed, p_low) rows, given the factors"""
+    high_factor, mixed_factor, low_factor = factors
+    normalized = []
+    for p_high, p_mixed, p_low in posteriors:
+        factored_high = p_high * high_factor
+        factored_low = p_low * low_factor
+        factored_mixed = p_mixed * mixed_factor
+        total_factor = factored_high + factored_low + factored_mixed
+        if total_factor == 0:
+            normalized.append((p_high, p_mixed, p_low))
+            continue
+        normalized.append((factored_high / total_factor, factored_mixed / total_factor, factored_low / total_factor))
+    return normalized
+
+""" ============================================================================================================
+============================ END VECTORIZED BELIEF STATE =======================================================
+============================================================================================================ """
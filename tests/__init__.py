@@ -0,0 +1,4 @@
+"""
+Tests for the AGT Competition System
+Run from the repository root with python -m pytest
+"""
@@ -0,0 +1,82 @@
+"""
+Tests for the BatchAuctionEngine
+Every game of a batch must be settled exactly as AuctionEngine settles a single round
+"""
+
+import numpy as np
+import pytest
+
+from src.auction_engine import AuctionEngine
+from src.batch_auction_engine import BatchAuctionEngine
+
+
+def random_bids(rng: np.random.Generator, num_games: int, num_teams: int) -> np.ndarray:
+    """Bids from a few values (so ties for the highest and second bid are common), including 0"""
+    return rng.choice([0.0, 0.0, 1.5, 3.0, 7.25, 7.25, 12.0, 19.99], size=(num_games, num_teams))
+
+
+@pytest.mark.parametrize("num_teams", [1, 2, 3, 5, 8])
+def test_prices_and_ties_match_determine_winner(num_teams):
+    rng = np.random.default_rng(num_teams)
+    bids = random_bids(rng, 5000, num_teams)
+    winners, prices, tied = BatchAuctionEngine(rng=np.random.default_rng(0)).determine_winners(bids)
+    engine = AuctionEngine(rng=np.random.default_rng(0))
+
+    for game, row in enumerate(bids.tolist()):
+        team_ids = [f"team_{t}" for t in range(num_teams)]
+        winner_id, price, tied_teams = engine.determine_winner(dict(zip(team_ids, row)))
+
+        assert prices[game] == price
+        assert [team_ids[t] for t in np.flatnonzero(tied[game])] == tied_teams
+        if winner_id is None:
+            assert winners[game] == -1
+        elif tied_teams:
+            # the tie-break draws differ between the engines, the candidates may not
+            assert team_ids[winners[game]] in tied_teams
+        else:
+            assert team_ids[winners[game]] == winner_id
+
+
+def test_single_valid_bidder_pays_zero():
+    bids = np.array([[0.0, 9.0, 0.0], [0.0, 0.0, 0.0], [4.0, 9.0, 0.0]])
+    winners, prices, tied = BatchAuctionEngine(rng=np.random.default_rng(0)).determine_winners(bids)
+
+    assert winners.tolist() == [1, -1, 1]
+    assert prices.tolist() == [0.0, 0.0, 4.0]
+    assert not tied.any()
+
+
+def test_ties_are_broken_uniformly():
+    num_games = 30000
+    bids = np.tile([5.0, 8.0, 8.0, 2.0, 8.0], (num_games, 1))
+    winners, prices, tied = BatchAuctionEngine(rng=np.random.default_rng(1)).determine_winners(bids)
+
+    assert (prices == 8.0).all()
+    assert tied[:, [1, 2, 4]].all() and not tied[:, [0, 3]].any()
+    shares = np.bincount(winners, minlength=5) / num_games
+    assert shares[[0, 3]].tolist() == [0.0, 0.0]
+    assert np.abs(shares[[1, 2, 4]] - 1 / 3).max() < 0.02
+
+
+def test_validation_matches_validate_bid():
+    rng = np.random.default_rng(2)
+    bids = np.round(rng.uniform(-5.0, 40.0, (2000, 5)), 4)
+    bids[::7, 0] = 2.675  # half cent, where float rounding is easy to get wrong
+    budgets = np.round(rng.uniform(0.0, 60.0, (2000, 5)), 3)
+    validated, capped = BatchAuctionEngine().validate_bids(bids, budgets)
+    engine = AuctionEngine()
+
+    for game in range(len(bids)):
+        for team in range(bids.shape[1]):
+            expected, was_capped = engine.validate_bid(float(bids[game, team]), float(budgets[game, team]),
+                                                       f"team_{team}")
+            assert (validated[game, team], bool(capped[game, team])) == (expected, was_capped)
+
+
+def test_charge_winners_deducts_price_from_winner_only():
+    budgets = np.full((3, 3), 60.0)
+    result = BatchAuctionEngine(rng=np.random.default_rng(0)).execute_round(
+        np.array([[10.0, 4.0, 0.0], [0.0, 0.0, 0.0], [3.0, 70.0, 5.0]]), budgets)
+    BatchAuctionEngine.charge_winners(budgets, result)
+
+    assert budgets.tolist() == [[56.0, 60.0, 60.0], [60.0, 60.0, 60.0], [60.0, 55.0, 60.0]]
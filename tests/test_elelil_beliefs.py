@@ -0,0 +1,173 @@
+"""
+Tests for the ELELIL agent's vectorized BeliefState
+Every update must give exactly the probabilities of the per-item Belief functions
+"""
+
+import numpy as np
+import pytest
+
+from src.valuation_generator import ValuationGenerator
+from teams.ELELIL import bidding_agent as elelil
+
+
+def simulate_games(num_games: int, num_teams: int, seed: int) -> list:
+    """
+    Games from team 0's view: the price of a round is the second highest valuation
+    in the arena, or for every other game a uniform price in [0, 21], which
+    includes prices no value group can produce.
+
+    Returns:
+        List of (valuation_vector, [(item_id, price_paid), ...]) per game
+    """
+    batch = ValuationGenerator(random_seed=seed).generate_batch([f"team_{i}" for i in range(num_teams)], num_games)
+    rng = np.random.default_rng(seed)
+
+    games = []
+    for game in range(num_games):
+        item_values = batch.values[game].T
+        rounds = []
+        for item_index, item_id in zip(batch.auction_sequences[game].tolist(), batch.auction_sequence(game)):
+            if game % 2 == 0:
+                price = float(np.sort(item_values[item_index])[-2])
+            else:
+                price = float(rng.uniform(0.0, 21.0))
+            rounds.append((item_id, price))
+        games.append((batch.valuation_vector(game, 0), rounds))
+    return games
+
+
+def reference_beliefs(valuation_vector: dict) -> dict:
+    """Initial beliefs as BiddingAgent computed them with the per-item functions"""
+    return elelil.get_posteriors_from_values(
+        valuation_vector,
+        elelil.Belief(elelil.TOTAL_HIGH / elelil.TOTAL_ITEMS, elelil.TOTAL_MIXED / elelil.TOTAL_ITEMS,
+                      elelil.TOTAL_LOW / elelil.TOTAL_ITEMS),
+        [item_id for item_id, value in valuation_vector.items() if value >= elelil.VALUE_RANGE_HIGH[0]],
+        [item_id for item_id, value in valuation_vector.items() if value <= elelil.VALUE_RANGE_LOW[1]]
+    )
+
+
+def reference_update(item_id: str, price: float, valuation_vector: dict, beliefs: dict, seen: list,
+                     num_bidders: int) -> dict:
+    """
+    get_updated_beliefs_according_to_price, with the sold item's belief kept
+    where the per-item functions divide by zero (a price no group can produce).
+
+    seen holds the seen items in sale order, the order BeliefState sums them in.
+    """
+    try:
+        beliefs, _ = elelil.get_updated_beliefs_according_to_price(
+            item_id, price, valuation_vector, beliefs, seen, num_bidders)
+        return beliefs
+    except ZeroDivisionError:
+        pass
+
+    possible_highs, possible_lows = elelil.get_group_possible_candidates(
+        valuation_vector, {i: beliefs[i] for i in seen})
+    remainders = elelil.get_expected_remainders_from_seen(beliefs, seen)
+    priors = elelil.get_global_priors(remainders)
+    return elelil.get_updated_posteriors_of_unseens(
+        valuation_vector, beliefs, seen, priors, remainders, possible_highs, possible_lows)
+
+
+def as_array(beliefs: dict, item_ids: list) -> np.ndarray:
+    return np.array([[beliefs[i].p_high, beliefs[i].p_mixed, beliefs[i].p_low] for i in item_ids])
+
+
+@pytest.mark.parametrize("num_teams", [2, 3, 5, 8])
+def test_matches_per_item_functions(num_teams):
+    for valuation_vector, rounds in simulate_games(40, num_teams, seed=num_teams):
+        beliefs = reference_beliefs(valuation_vector)
+        state = elelil.BeliefState(valuation_vector, num_teams)
+        assert np.array_equal(as_array(beliefs, state.item_ids), state.probs)
+
+        seen = []
+        for item_id, price in rounds:
+            seen.append(item_id)
+            elelil.update_beliefs_with_price(state, item_id, price)
+            beliefs = reference_update(item_id, price, valuation_vector, beliefs, seen, num_teams)
+            assert np.array_equal(as_array(beliefs, state.item_ids), state.probs), \
+                f"Beliefs differ after {item_id} at price {price}"
+
+
+@pytest.mark.parametrize("num_teams", [2, 5, 8])
+def test_price_no_group_can_produce_keeps_item_belief(num_teams):
+    valuation_vector, rounds = simulate_games(1, num_teams, seed=7)[0]
+    state = elelil.BeliefState(valuation_vector, num_teams)
+    for item_id, price in rounds[:3]:
+        elelil.update_beliefs_with_price(state, item_id, price)
+
+    # below every value range, and not a surely mixed item (value below the high range)
+    item_id = next(i for i, _ in rounds[3:] if valuation_vector[i] < elelil.VALUE_RANGE_HIGH[0])
+    i = state.index[item_id]
+    before = state.probs.copy()
+    with pytest.raises(ZeroDivisionError):
+        elelil.get_posterior_with_price(item_id, valuation_vector[item_id], 0.0, state[item_id], num_teams)
+
+    elelil.update_beliefs_with_price(state, item_id, 0.0)
+
+    assert np.array_equal(state.probs[i], before[i])
+    assert state.seen[i]
+    unseen = ~state.seen[:, 0]
+    assert not np.array_equal(state.probs[unseen], before[unseen])
+
+
+def test_likelihood_tables_match_closed_form():
+    rng = np.random.default_rng(0)
+    for num_bidders in range(2, 11):
+        for group, (range_min, range_max) in elelil.GROUP_VALUE_RANGES.items():
+            prices = rng.uniform(range_min, range_max, 1000)
+            y = (prices - range_min) / (range_max - range_min)
+            exact = num_bidders * (num_bidders - 1) * y ** (num_bidders - 2) * (1.0 - y) / (range_max - range_min)
+            looked_up = np.array([elelil.price_likelihood(group, num_bidders, p) for p in prices.tolist()])
+            assert np.abs(looked_up - exact).max() < 1e-6
+
+
+@pytest.mark.parametrize("num_teams", [3, 5])
+def test_running_totals_match_full_recomputation(num_teams):
+    for valuation_vector, rounds in simulate_games(40, num_teams, seed=100 + num_teams):
+        beliefs = reference_beliefs(valuation_vector)
+        state = elelil.BeliefState(valuation_vector, num_teams)
+
+        seen = []
+        for item_id, price in rounds:
+            seen.append(item_id)
+            elelil.update_beliefs_with_price(state, item_id, price)
+            beliefs = reference_update(item_id, price, valuation_vector, beliefs, seen, num_teams)
+
+            expected_used = [sum(beliefs[i].p_high for i in seen), sum(beliefs[i].p_mixed for i in seen),
+                             sum(beliefs[i].p_low for i in seen)]
+            assert state.expected_used == expected_used
+            possible_highs, possible_lows = elelil.get_group_possible_candidates(
+                valuation_vector, {i: beliefs[i] for i in seen})
+            assert (state.possible_high_count, state.possible_low_count) == \
+                (len(possible_highs), len(possible_lows))
+
+
+@pytest.mark.parametrize("values, sold_value, price, surely_row", [
+    # one high-range item too many; selling one cheaply makes it surely mixed, the rest surely high
+    ([12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0] + [2.0 + 0.5 * k for k in range(13)], 12.0, 5.0, [1.0, 0.0, 0.0]),
+    # one low-range item too many; selling one dearly makes it surely mixed, the rest surely low
+    ([2.0, 3.0, 4.0, 5.0, 6.0] + [10.5 + 0.5 * k for k in range(15)], 3.0, 15.0, [0.0, 0.0, 1.0]),
+])
+def test_surely_mixed_item_rules_out_candidate(values, sold_value, price, surely_row):
+    valuation_vector = {f"item_{k}": value for k, value in enumerate(values)}
+    item_id = next(i for i, value in valuation_vector.items() if value == sold_value)
+    in_range = [i for i, value in valuation_vector.items() if i != item_id and
+                (value >= elelil.VALUE_RANGE_HIGH[0] if surely_row[0] else value <= elelil.VALUE_RANGE_LOW[1])]
+
+    state = elelil.BeliefState(valuation_vector)
+    counts = (state.possible_high_count, state.possible_low_count)
+    elelil.update_beliefs_with_price(state, item_id, price)
+    beliefs = reference_update(item_id, price, valuation_vector, reference_beliefs(valuation_vector),
+                               [item_id], elelil.ARENA_SIZE)
+
+    assert state.probs[state.index[item_id]].tolist() == [0.0, 1.0, 0.0]
+    if surely_row[0]:
+        assert (state.possible_high_count, state.possible_low_count) == (counts[0] - 1, counts[1])
+        assert state.surely == (True, False)
+    else:
+        assert (state.possible_high_count, state.possible_low_count) == (counts[0], counts[1] - 1)
+        assert state.surely == (False, True)
+    assert all(state.probs[state.index[i]].tolist() == surely_row for i in in_range)
+    assert np.array_equal(as_array(beliefs, state.item_ids), state.probs)
@@ -0,0 +1,20 @@
+"""
+Tests for the LatencyProfiler report
+Every operation's slowest call is measured against that operation's own timeout
+"""
+
+from src.profiling import LatencyProfiler
+
+
+def test_timeout_fraction_uses_each_operations_timeout():
+    profiler = LatencyProfiler()
+    profiler.record("team_a", "bid", (500_000_000, 400_000_000))
+    profiler.record("team_a", "update", (500_000_000, 400_000_000))
+    profiler.record_timeout("team_b", "update", 4_000_000_000)
+
+    rows = profiler.report({"bid": 1.0, "update": 4.0})
+
+    fractions = {(row['team_id'], row['operation']): row['max_timeout_fraction'] for row in rows}
+    assert fractions == {("team_a", "bid"): 0.5, ("team_a", "update"): 0.125, ("team_b", "update"): 1.0}
+    assert [(row['team_id'], row['operation']) for row in rows][0] == ("team_b", "update")
+    assert rows[0]['timeouts'] == 1
@@ -0,0 +1,90 @@
+"""
+Tests for resuming an interrupted tournament
+A run killed in the middle of an arena and resumed must rank teams exactly as an uninterrupted run
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.config import STAGE1_GAMES
+from src.result_sinks import iter_game_records
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SEED = 11
+CRASH_GAME = 3
+
+# Bids truthfully; with CRASH_COUNTER set, kills the whole process in the middle
+# of game CRASH_GAME, the way a crashed or killed tournament host dies
+CRASHING_AGENT = f'''
+import os
+
+from examples.truthful_bidder import BiddingAgent as TruthfulBidder
+
+
+class BiddingAgent(TruthfulBidder):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rounds = 0
+        self.crash = False
+        counter_path = os.environ.get("CRASH_COUNTER")
+        if counter_path:
+            games = int(open(counter_path).read()) + 1 if os.path.exists(counter_path) else 1
+            with open(counter_path, "w") as f:
+                f.write(str(games))
+            self.crash = games == {CRASH_GAME}
+
+    def bidding_function(self, item_id):
+        self.rounds += 1
+        if self.crash and self.rounds == 10:
+            os._exit(1)
+        return super().bidding_function(item_id)
+'''
+
+
+def make_teams(teams_dir: Path):
+    for team_id, example in [("truthful", "truthful_bidder"), ("strategic", "strategic_bidder"),
+                             ("budget_aware", "budget_aware_bidder"), ("strategic_2", "strategic_bidder")]:
+        (teams_dir / team_id).mkdir(parents=True)
+        shutil.copy(REPO_ROOT / "examples" / f"{example}.py", teams_dir / team_id / "bidding_agent.py")
+    (teams_dir / "crashing").mkdir()
+    (teams_dir / "crashing" / "bidding_agent.py").write_text(CRASHING_AGENT)
+
+
+def run_stage1(teams_dir: Path, output_dir: Path, result_format: str, *extra_args,
+               env: dict = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "main.py", "--mode", "stage", "--stage", "1", "--teams-dir", str(teams_dir),
+         "--output-dir", str(output_dir), "--seed", str(SEED), "--execution-mode", "inline",
+         "--result-format", result_format, "--log-file", str(output_dir.parent / f"{output_dir.name}.log"),
+         *extra_args],
+        cwd=REPO_ROOT, env={**os.environ, **(env or {})}, capture_output=True, timeout=300
+    )
+
+
+@pytest.mark.parametrize("result_format", ["json", "jsonl", "jsonl.gz"])
+def test_killed_run_resumes_to_same_leaderboard(tmp_path, result_format):
+    teams_dir = tmp_path / "teams"
+    make_teams(teams_dir)
+
+    run_stage1(teams_dir, tmp_path / "uninterrupted", result_format).check_returncode()
+
+    interrupted = run_stage1(teams_dir, tmp_path / "resumed", result_format,
+                             env={"CRASH_COUNTER": str(tmp_path / "crash_counter")})
+    assert interrupted.returncode == 1
+    # every game finished before the crash is on disk; the game it killed is not
+    stored = sorted(record["game_number"] for record in iter_game_records(str(tmp_path / "resumed"), stage=1))
+    assert stored == list(range(1, CRASH_GAME))
+
+    run_stage1(teams_dir, tmp_path / "resumed", result_format, "--resume").check_returncode()
+
+    stored = sorted(record["game_number"] for record in iter_game_records(str(tmp_path / "resumed"), stage=1))
+    assert stored == list(range(1, STAGE1_GAMES + 1))
+    expected = pd.read_csv(tmp_path / "uninterrupted" / "stage1" / "stage1_leaderboard.csv")
+    resumed = pd.read_csv(tmp_path / "resumed" / "stage1" / "stage1_leaderboard.csv")
+    pd.testing.assert_frame_equal(resumed, expected)
@@ -0,0 +1,77 @@
+"""
+Tests for the "penalize" update timeout policy
+An update timeout forfeits the agent's next bid in the same game, never one in another game
+"""
+
+import asyncio
+
+from src.agent_manager import AgentManager
+from src.async_agent_manager import AsyncAgentManager
+
+# Bids 5; updates take longer than the test's update timeout in games where its budget is 50
+SLOW_UPDATE_AGENT = '''
+import time
+
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.slow = budget == 50
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        if self.slow:
+            time.sleep(1.0)
+        return True
+
+    def bidding_function(self, item_id):
+        return 5.0
+'''
+
+VALUATIONS = {"item_0": 10.0, "item_1": 10.0}
+UPDATE_TIMEOUT_SECONDS = 0.2
+
+
+def test_penalty_stays_in_its_game(tmp_path):
+    agent_file = str(tmp_path / "bidding_agent.py")
+    (tmp_path / "bidding_agent.py").write_text(SLOW_UPDATE_AGENT)
+    agent_manager = AgentManager(timeout_seconds=2.0, execution_mode="thread",
+                                 update_timeout_seconds=UPDATE_TIMEOUT_SECONDS, update_timeout_policy="penalize")
+
+    # last round of a game times out: the next game starts without a penalty
+    agent = agent_manager.load_agent(agent_file, "team_a", VALUATIONS, 50, [])
+    assert agent_manager.update_agents_after_round({"team_a": agent}, "item_0", "team_a", 1.0) == {"team_a": False}
+    agent = agent_manager.load_agent(agent_file, "team_a", VALUATIONS, 60, [])
+    assert agent_manager.execute_bid_with_timeout(agent, "item_1")[0] == 5.0
+
+    # within a game, exactly the next bid is forfeited
+    agent = agent_manager.load_agent(agent_file, "team_a", VALUATIONS, 50, [])
+    agent_manager.update_agents_after_round({"team_a": agent}, "item_0", "team_a", 1.0)
+    assert agent_manager.execute_bid_with_timeout(agent, "item_1") == (0.0, 0.0, "Penalized: update timeout")
+    assert agent_manager.execute_bid_with_timeout(agent, "item_1")[0] == 5.0
+    agent_manager.shutdown()
+
+
+def test_async_penalty_does_not_reach_concurrent_game(tmp_path):
+    agent_file = str(tmp_path / "bidding_agent.py")
+    (tmp_path / "bidding_agent.py").write_text(SLOW_UPDATE_AGENT)
+
+    async def play():
+        agent_manager = AsyncAgentManager(timeout_seconds=5.0, update_timeout_seconds=UPDATE_TIMEOUT_SECONDS,
+                                          update_timeout_policy="penalize")
+        try:
+            slow_game = {"team_a": await agent_manager.load_agent(agent_file, "team_a", VALUATIONS, 50, [])}
+            other_game = {"team_a": await agent_manager.load_agent(agent_file, "team_a", VALUATIONS, 60, [])}
+
+            updated = await agent_manager.update_agents_after_round(slow_game, "item_0", "team_a", 1.0)
+            return (updated, await agent_manager.collect_bids(other_game, "item_1"),
+                    await agent_manager.collect_bids(slow_game, "item_1"))
+        finally:
+            await agent_manager.shutdown()
+
+    updated, other_bids, slow_bids = asyncio.run(play())
+
+    assert updated == {"team_a": False}
+    assert other_bids["team_a"][0] == 5.0
+    assert slow_bids["team_a"] == (0.0, 0.0, "Penalized: update timeout")
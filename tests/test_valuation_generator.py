@@ -0,0 +1,110 @@
+"""
+Tests for batched valuation generation
+Every game of a ValuationBatch must follow the competition's valuation rules
+"""
+
+import numpy as np
+
+from src.agent_manager import AgentManager
+from src.auction_engine import AuctionEngine
+from src.config import (
+    HIGH_VALUE_ITEMS, HIGH_VALUE_RANGE, INITIAL_BUDGET, K_TOTAL_ITEMS, LOW_VALUE_ITEMS, LOW_VALUE_RANGE,
+    MIXED_VALUE_ITEMS, MIXED_VALUE_RANGE, T_AUCTION_ROUNDS
+)
+from src.game_manager import GameManager
+from src.valuation_generator import (
+    CATEGORY_HIGH, CATEGORY_LOW, CATEGORY_MIXED, ITEM_IDS, ValuationGenerator
+)
+
+TEAM_IDS = ["team_a", "team_b", "team_c", "team_d", "team_e"]
+
+
+def test_categories_and_value_ranges():
+    batch = ValuationGenerator(random_seed=0).generate_batch(TEAM_IDS, 500)
+
+    assert batch.values.shape == (500, len(TEAM_IDS), K_TOTAL_ITEMS)
+    for category, count, (low, high) in [(CATEGORY_HIGH, HIGH_VALUE_ITEMS, HIGH_VALUE_RANGE),
+                                         (CATEGORY_LOW, LOW_VALUE_ITEMS, LOW_VALUE_RANGE),
+                                         (CATEGORY_MIXED, MIXED_VALUE_ITEMS, MIXED_VALUE_RANGE)]:
+        mask = batch.category_mask(category)
+        assert (mask.sum(axis=1) == count).all()
+
+        # every team values an item from its category's range, with the range's mean
+        values = batch.values.transpose(1, 0, 2)[:, mask]
+        assert values.min() >= low and values.max() <= high
+        assert abs(values.mean() - (low + high) / 2) < 0.05 * (high - low)
+
+
+def test_auction_sequences_are_distinct_items():
+    batch = ValuationGenerator(random_seed=1).generate_batch(TEAM_IDS, 500)
+
+    assert batch.auction_sequences.shape == (500, T_AUCTION_ROUNDS)
+    for sequence in batch.auction_sequences:
+        assert len(set(sequence.tolist())) == T_AUCTION_ROUNDS
+    # every item is auctioned about equally often
+    counts = np.bincount(batch.auction_sequences.ravel(), minlength=K_TOTAL_ITEMS)
+    assert np.abs(counts / counts.sum() - 1 / K_TOTAL_ITEMS).max() < 0.01
+
+
+def test_adapters_match_arrays():
+    batch = ValuationGenerator(random_seed=2).generate_batch(TEAM_IDS, 10)
+
+    for game in range(batch.num_games):
+        valuations, (high_items, low_items, mixed_items), sequence = batch.game_inputs(game)
+        assert list(valuations) == TEAM_IDS
+        for t, team_id in enumerate(TEAM_IDS):
+            assert valuations[team_id] == batch.valuation_vector(game, t)
+            assert list(valuations[team_id]) == ITEM_IDS
+            assert list(valuations[team_id].values()) == batch.values[game, t].tolist()
+        assert (len(high_items), len(low_items), len(mixed_items)) == \
+            (HIGH_VALUE_ITEMS, LOW_VALUE_ITEMS, MIXED_VALUE_ITEMS)
+        assert all(batch.categories[game, ITEM_IDS.index(i)] == CATEGORY_HIGH for i in high_items)
+        assert sequence == [ITEM_IDS[i] for i in batch.auction_sequences[game].tolist()]
+
+
+def test_same_seed_same_batch():
+    first = ValuationGenerator(random_seed=3).generate_batch(TEAM_IDS, 20)
+    second = ValuationGenerator(random_seed=3).generate_batch(TEAM_IDS, 20)
+
+    assert np.array_equal(first.values, second.values)
+    assert np.array_equal(first.categories, second.categories)
+    assert np.array_equal(first.auction_sequences, second.auction_sequences)
+
+
+def test_stage_batches_cover_every_arena():
+    arenas = {"1": TEAM_IDS[:3], "2": TEAM_IDS[3:]}
+    batches = ValuationGenerator(random_seed=4).generate_stage_batches(arenas, 5)
+
+    assert {arena_id: batch.team_ids for arena_id, batch in batches.items()} == arenas
+    assert [batch.values.shape for batch in batches.values()] == [(5, 3, K_TOTAL_ITEMS), (5, 2, K_TOTAL_ITEMS)]
+
+
+def test_game_manager_plays_batch_inputs():
+    batch = ValuationGenerator(random_seed=5).generate_batch(TEAM_IDS, 1)
+    agent_manager = AgentManager(execution_mode="inline")
+    game_manager = GameManager(
+        stage=1,
+        arena_id="test",
+        game_number=1,
+        valuation_generator=ValuationGenerator(random_seed=5),
+        auction_engine=AuctionEngine(rng=np.random.default_rng(0)),
+        agent_manager=agent_manager,
+        headless=True
+    )
+    try:
+        game_result = game_manager.run_game({team_id: "examples/truthful_bidder.py" for team_id in TEAM_IDS},
+                                            game_inputs=batch.game_inputs(0))
+    finally:
+        agent_manager.shutdown()
+
+    assert {team_id: result.valuation_vector for team_id, result in game_result.team_results.items()} == \
+        batch.arena_valuations(0)
+    assert game_result.auction_sequence == batch.auction_sequence(0)
+    # truthful bidders bid their valuation (in cents) of the batch's item, as long as their budget lasts
+    valuations = batch.arena_valuations(0)
+    first_round = game_result.auction_log[0]
+    assert first_round.all_bids == {team_id: round(valuations[team_id][first_round.item_id], 2)
+                                    for team_id in TEAM_IDS}
+    for round_result in game_result.auction_log:
+        assert round_result.all_bids[round_result.winner_id] == max(round_result.all_bids.values())
+    assert all(result.budget_spent <= INITIAL_BUDGET for result in game_result.team_results.values())